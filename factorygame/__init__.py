@@ -22,8 +22,9 @@ references to ensure that actors can be destroyed safely.
 
 # Import useful classes.
 
-from factorygame.core.engine_base import Actor, GameEngine
+from factorygame.core.engine_base import Actor, ActorComponent, GameEngine
 from factorygame.core.blueprint import FColor
-from factorygame.utils.loc import Loc
+from factorygame.utils.loc import Loc, Vec2
 from factorygame.utils.mymath import MathStat
 from factorygame.utils.gameplay import GameplayStatics, GameplayUtilities
+from factorygame.utils.delegate import MulticastDelegate
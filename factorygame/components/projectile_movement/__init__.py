@@ -2,5 +2,9 @@
 """
 
 from factorygame.components.projectile_movement.projectile_movement import (
-    ProjectileAimOffsetStruct, ProjectileMovementComponent, HitResult
+    ProjectileAimOffsetStruct, ProjectileMovementComponent
 )
+from factorygame.components.projectile_movement.trajectory import (
+    ProjectileTrajectory
+)
+from factorygame.core.collision import HitResult
@@ -1,23 +1,16 @@
-from math import atan2
-from factorygame import Loc
-from factorygame.core.engine_base import EngineObject
-from factorygame.core.blueprint import GeomHelper
-
-
-class HitResult:
-    """Structure for result of a colliding hit.
-    """
-    def __init__(self):
-        self.impact_velocity = Loc(0.0, 0.0)
-        self.surface_normal = Loc(0.0, 0.0)
-        self.location = Loc(0.0, 0.0)
-        self.other_actor = None
+from factorygame import Loc, Vec2
+from factorygame.core.engine_base import ActorComponent, ETickGroup
+from factorygame.components.projectile_movement.trajectory import (
+    ProjectileTrajectory
+)
 
 
 class ProjectileAimStruct:
     """Structure for aiming data of projectile to be launched.
     """
 
+    __slots__ = ("fire_velocity",)
+
     def __init__(self):
         """Set default values.
         """
@@ -29,6 +22,9 @@ class ProjectileAimOffsetStruct(ProjectileAimStruct):
     """Structure for aiming by specifying positional offset.
     """
 
+    __slots__ = ("start_position", "fire_speed_multiplier",
+        "should_normalise_speed")
+
     def __init__(self, start_position=None):
         super().__init__()
 
@@ -62,16 +58,42 @@ class ProjectileAimOffsetStruct(ProjectileAimStruct):
         # Set final fire velocity.
         self.fire_velocity = new_velocity
 
+    def set_velocity_to_hit(self, target, speed, gravity_strength=1.0,
+        high_arc=False):
+        """Set fire velocity to hit a target, accounting for gravity.
+
+        :param target: (Loc) Location to hit.
+
+        :param speed: (float) Speed to fire at.
+
+        :return: (bool) Whether the target is in range. Fire velocity is
+        not changed if out of range.
+        """
+        if self.start_position is None:
+            return False
+
+        new_velocity = ProjectileTrajectory.solve_launch_velocity(
+            self.start_position, target, speed, gravity_strength, high_arc)
+        if new_velocity is None:
+            return False
+
+        self.fire_velocity = new_velocity
+        return True
+
 
-class ProjectileMovementComponent(EngineObject):
+class ProjectileMovementComponent(ActorComponent):
     """Drives projectile like motion for an actor.
+
+    Moves the owning actor automatically when added with
+    `Actor.add_component`. Otherwise `tick_physics` must be called each
+    frame.
     """
 
     def __init__(self):
         super().__init__()
 
-        ## Actor this component belongs to.
-        self.owning_actor = None
+        # Move before gameplay actors tick.
+        self.primary_component_tick.tick_group = ETickGroup.PHYSICS
 
         ## Initial speed to launch projectile with.
         self.initial_speed = 0.0
@@ -94,6 +116,12 @@ class ProjectileMovementComponent(EngineObject):
         self.velocity = Loc(0.0, 0.0)
         ## Whether to simulate projectile movement currently.
         self.enable_simulation = False
+        ## Whether to collide with geometry in the world's collision
+        ## manager, bouncing or stopping when hit.
+        self.enable_collision = True
+        ## Distance to keep from surfaces after a hit, so the next move
+        ## starts outside them.
+        self.surface_offset = 0.01
 
     def config_from_aim(self, aim_data):
         """Configure values using a ProjectileAimStruct.
@@ -103,6 +131,9 @@ class ProjectileMovementComponent(EngineObject):
         self.initial_speed = abs(aim_data.fire_velocity)
         self.rotation_direction = aim_data.fire_velocity
 
+    def tick_component(self, delta_time):
+        self.tick_physics(delta_time)
+
     def tick_physics(self, dt):
         """Process changes to actor position.
         """
@@ -124,7 +155,8 @@ class ProjectileMovementComponent(EngineObject):
         # Add downward effects of gravity.
         # acceleration = delta velocity / delta time
         # delta velocity = acceleration * delta time
-        new_vel += Loc(0.0, -9.8) * self.gravity_strength * dt * 100
+        new_vel += Loc(0.0, -ProjectileTrajectory.GRAVITY) \
+            * self.gravity_strength * dt
 
         # Clamp to max speed if over limit.
         new_speed = abs(new_vel)
@@ -133,42 +165,100 @@ class ProjectileMovementComponent(EngineObject):
             new_vel *= self.max_speed / new_speed
 
         # Set final state of projectile this frame.
-        self.owning_actor.location += loc_offset
+        start = self.owning_actor.location
+        hit_data = self._find_hit(start, start + loc_offset)
         self.velocity = new_vel
 
+        if hit_data is None:
+            self.owning_actor.location += loc_offset
+            return
+
+        # Stop at the surface, then bounce off it.
+        self.owning_actor.location = (hit_data.location
+            + hit_data.surface_normal * self.surface_offset)
+        hit_data.impact_velocity = Loc(new_vel)
+        if not self.bounce(hit_data):
+            self.velocity = Loc(0.0, 0.0)
+            self.enable_simulation = False
+
+    def predict_location(self, time, step=0.0):
+        """Return where the actor will be after some time, if nothing is
+        hit.
+
+        :param time: (float) Time from now, in seconds.
+
+        :param step: (float) Time between calls to `tick_physics`, in
+        seconds, to match frame by frame movement exactly.
+
+        :return: (Loc) Predicted location.
+        """
+        return ProjectileTrajectory.get_location(self.owning_actor.location,
+            self.velocity, time, self.gravity_strength, step)
+
+    def predict_hit(self, duration, num_segments=30):
+        """Return the first HitResult the actor will hit within a
+        duration, in seconds, or None. Requires a collision manager in
+        the actor's world.
+        """
+        try:
+            collision_manager = self.owning_actor.world.collision_manager
+        except AttributeError:
+            return None
+        if collision_manager is None:
+            return None
+
+        return ProjectileTrajectory.predict_hit(self.owning_actor.location,
+            self.velocity, collision_manager, duration, self.gravity_strength,
+            num_segments, ignore=self.owning_actor)
+
+    def _find_hit(self, start, end):
+        """Return the first HitResult when moving from START to END, or
+        None if nothing is hit or there is no collision manager."""
+        if not self.enable_collision:
+            return None
+
+        try:
+            collision_manager = self.owning_actor.world.collision_manager
+        except AttributeError:
+            return None
+        if collision_manager is None:
+            return None
+
+        return collision_manager.sweep(start, end, ignore=self.owning_actor)
+
     def bounce(self, hit_data):
-        """Trigger direction change with when a collision occurs.
+        """Trigger direction change when a collision occurs.
 
-        Must be called manually as robust collision detection system not
-        made yet.
+        Called automatically when moving into geometry in the world's
+        collision manager, but can also be called manually.
+
+        :return: (bool) Whether the projectile bounced.
         """
         if (not self.enable_simulation
-            or not self.bounce
+            or not self.should_bounce
             or (self.max_num_bounces > 0 
                 and self._current_num_bounces >= self.max_num_bounces
             )):
-            return
+            return False
 
         # Increment bounce counter.
         self._current_num_bounces += 1
 
-        # Recalculate velocity direction considering surface normal.
-		# Assume values from hit data are correct rather than using
+        # Reflect velocity direction off the surface normal.
+        # Assume values from hit data are correct rather than using
         # the current projectile values.
-        incoming_angle = atan2(*hit_data.impact_velocity)
-        surface_angle = atan2(*hit_data.surface_normal)
-        launch_angle = surface_angle + incoming_angle + (4* 3.14 /3 )
-        new_direction, *_ = tuple(
-            GeomHelper.generate_reg_poly(3, radial_offset=launch_angle)
-		)
+        incoming = Vec2.from_loc(hit_data.impact_velocity)
+        normal = Vec2.from_loc(hit_data.surface_normal).normalized()
+        new_direction = (incoming - normal * (2 * incoming.dot(normal))
+            ).normalized()
         
         # Calculate new speed (magnitude of velocity) to relaunch with.
         current_speed = abs(self.velocity)
         new_speed = current_speed * self.bounce_speed_multiplier
         
         # Set velocity for an similar effect to launching.
-        self.velocity = new_direction * new_speed
-
+        self.velocity = Loc(new_direction * new_speed)
+        return True
 
     def launch(self):
         """Begin simulating physics and launch with initial speed.
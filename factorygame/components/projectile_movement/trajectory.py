@@ -0,0 +1,181 @@
+"""Closed form projectile trajectories, matching ProjectileMovementComponent.
+"""
+
+from math import sqrt
+from factorygame import Loc
+
+
+class ProjectileTrajectory:
+    """Static helper class to predict and aim projectile motion without
+    simulating each frame.
+
+    Speed limits are not considered, so predictions are only exact for
+    projectiles without a max speed.
+    """
+
+    ## Downward acceleration of gravity, in world units per second
+    ## squared, before multiplying by gravity strength.
+    GRAVITY = 980.0
+
+    @staticmethod
+    def get_location(start, velocity, time, gravity_strength=1.0, step=0.0):
+        """Return location of a projectile after some time.
+
+        :param start: (Loc) Launch location.
+
+        :param velocity: (Loc) Launch velocity, in world units per second.
+
+        :param time: (float) Time since launch, in seconds.
+
+        :param gravity_strength: (float) Multiplier for gravity.
+
+        :param step: (float) Time between physics ticks, in seconds, to
+        match frame by frame movement exactly. Zero for smooth motion.
+
+        :return: (Loc) Predicted location.
+        """
+        drop = 0.5 * ProjectileTrajectory.GRAVITY * gravity_strength \
+            * time * (time - step)
+        return Loc(start[0] + velocity[0] * time,
+            start[1] + velocity[1] * time - drop)
+
+    @staticmethod
+    def get_velocity(velocity, time, gravity_strength=1.0):
+        """Return velocity of a projectile after some time.
+
+        :param velocity: (Loc) Launch velocity.
+
+        :param time: (float) Time since launch, in seconds.
+
+        :return: (Loc) Predicted velocity.
+        """
+        return Loc(velocity[0], velocity[1]
+            - ProjectileTrajectory.GRAVITY * gravity_strength * time)
+
+    @staticmethod
+    def sample_locations(start, velocity, duration, num_samples,
+        gravity_strength=1.0, step=0.0):
+        """Return evenly spaced locations along a trajectory in one call,
+        eg for drawing an aim preview. Requires NumPy.
+
+        :param duration: (float) Time of the last sample, in seconds.
+
+        :param num_samples: (int) Number of locations, including launch.
+
+        :return: (numpy.ndarray) Locations, shape (num_samples, 2).
+        """
+        # Imported here as NumPy is optional.
+        import numpy as np
+
+        times = np.linspace(0.0, duration, num_samples)
+        drop = 0.5 * ProjectileTrajectory.GRAVITY * gravity_strength \
+            * times * (times - step)
+
+        locations = np.empty((num_samples, 2))
+        locations[:, 0] = start[0] + velocity[0] * times
+        locations[:, 1] = start[1] + velocity[1] * times - drop
+        return locations
+
+    @staticmethod
+    def solve_launch_velocity(start, target, speed, gravity_strength=1.0,
+        high_arc=False):
+        """Find a launch velocity with a given speed that hits a target.
+
+        :param start: (Loc) Launch location.
+
+        :param target: (Loc) Location to hit.
+
+        :param speed: (float) Launch speed.
+
+        :param high_arc: (bool) Whether to use the higher of the two
+        possible arcs, which takes longer to arrive.
+
+        :return: (Loc) Launch velocity, or None if the target is out of
+        range.
+        """
+        dx = target[0] - start[0]
+        dy = target[1] - start[1]
+        gravity = ProjectileTrajectory.GRAVITY * gravity_strength
+
+        if not gravity:
+            # Fire straight at the target.
+            distance = sqrt(dx * dx + dy * dy)
+            if not distance:
+                return None
+            return Loc(dx / distance * speed, dy / distance * speed)
+
+        speed_squared = speed * speed
+        discriminant = (speed_squared * speed_squared
+            - gravity * (gravity * dx * dx + 2 * dy * speed_squared))
+        if discriminant < 0.0:
+            return None
+
+        if not dx:
+            # Straight up or down.
+            return Loc(0.0, speed if dy >= 0.0 or high_arc else -speed)
+
+        root = sqrt(discriminant)
+
+        # Tangent of launch angle, for an arc in the direction of target.
+        tan_angle = (speed_squared + (root if high_arc else -root)) \
+            / (gravity * abs(dx))
+        horizontal = speed / sqrt(1 + tan_angle * tan_angle)
+        return Loc(horizontal if dx > 0 else -horizontal,
+            horizontal * tan_angle)
+
+    @staticmethod
+    def solve_launch_velocity_for_time(start, target, time,
+        gravity_strength=1.0):
+        """Find the launch velocity that hits a target after a given time.
+
+        :param time: (float) Time to reach target, in seconds.
+
+        :return: (Loc) Launch velocity.
+        """
+        drop = 0.5 * ProjectileTrajectory.GRAVITY * gravity_strength * time
+        return Loc((target[0] - start[0]) / time,
+            (target[1] - start[1]) / time + drop)
+
+    @staticmethod
+    def predict_hit(start, velocity, collision_manager, duration,
+        gravity_strength=1.0, num_segments=30, ignore=None):
+        """Find the first collider a projectile will hit, by tracing
+        lines along its trajectory.
+
+        :param collision_manager: (CollisionManager) Geometry to trace
+        against, eg `world.collision_manager`.
+
+        :param duration: (float) How far ahead to look, in seconds.
+
+        :param num_segments: (int) Number of lines to split the
+        trajectory into. More gives a closer fit to the curve.
+
+        :param ignore: Collider to not collide with, eg the projectile.
+
+        :return: (HitResult) The first hit, with impact velocity set to
+        the predicted velocity at the hit. None if nothing is hit.
+        """
+        get_location = ProjectileTrajectory.get_location
+        segment_time = duration / num_segments
+
+        segment_start = Loc(start)
+        for i in range(1, num_segments + 1):
+            time = segment_time * i
+            segment_end = get_location(start, velocity, time, gravity_strength)
+
+            hits = collision_manager.line_trace(
+                segment_start, segment_end, ignore)
+            if hits:
+                hit = hits[0]
+                # Time of the hit, assuming even speed along the line.
+                offset = hit.location - segment_start
+                length = abs(segment_end - segment_start)
+                hit_time = time - segment_time * (
+                    1.0 - (abs(offset) / length if length else 0.0))
+                hit.impact_velocity = ProjectileTrajectory.get_velocity(
+                    velocity, hit_time, gravity_strength)
+                return hit
+
+            segment_start = segment_end
+
+        return None
@@ -5,11 +5,14 @@ Defines all visual elements of the engine.
 from tkinter import Canvas
 from uuid import uuid4
 import itertools, math
-from factorygame.utils.loc import Loc
-from factorygame.utils.tkutils import MotionInput, ScalingImage
+from factorygame.utils.loc import Loc, Vec2
+from factorygame.utils.tkutils import MotionInput
 from factorygame.utils.gameplay import GameplayStatics
+from factorygame.utils.delegate import MulticastDelegate
 from factorygame.utils.mymath import MathStat
 from factorygame.core.engine_base import World, Actor, ETickGroup
+from factorygame.core.collision import CollisionManager
+from factorygame.core.significance import SignificanceManager
 
 class Drawable(object):
     """
@@ -68,6 +71,12 @@ class DrawnActor(Actor, Drawable):
         ## Used to determine if this canvas shape was clicked.
         self.canvas_ids = set()
 
+    def __init_clone__(self):
+        super().__init_clone__()
+
+        # Each copy needs its own canvas tag.
+        self.unique_id = uuid4()
+
     def tick(self, dt):
         """Called every frame to perform draw cycle."""
         self.start_cycle()
@@ -115,6 +124,17 @@ class NodeBase(DrawnActor):
         """
         self.world.render_manager.node_canvas_ids[canvas_id] = self
 
+    def _on_location_set(self):
+        super()._on_location_set()
+        self._refresh_hovered_nodes()
+
+    def _refresh_hovered_nodes(self):
+        """Find hovered nodes again next frame, if spawned in a graph."""
+        world = getattr(self, "_world", None)
+        render_manager = getattr(world, "render_manager", None)
+        if render_manager is not None:
+            render_manager.refresh_hovered_nodes()
+
     # # # # # # # # # # # # # # # # # # # # # # # # # # # #
     # Start of drawable interface.
 
@@ -175,10 +195,23 @@ class PolygonNode(NodeBase):
         ## relative to the polygon's location.
         self._vertices = tuple()
 
+        ## Copy of relative vertex coordinates (Vec2) taken when the
+        ## vertices were set.
+        self._local_vertices = tuple()
+
+        ## Bounding box of relative vertex coordinates as a tuple of
+        ## (bottom left, top right) Vec2 corners.
+        self._local_bounds = (Vec2(), Vec2())
+
         ## Set of vertex coordinates (Loc) that make up the polygon,
-        ## in world coordinates. Should not be set directly.
+        ## in world coordinates. Recalculated when the location or
+        ## vertices change. Should not be set directly.
         self._world_vertices = tuple()
 
+        ## Location (Vec2) that world vertices were last calculated for.
+        ## None when they need recalculating.
+        self._world_vertices_location = None
+
         ## Fill color of the polygon (FColor)
         self.fill_color = FColor.default()
 
@@ -188,6 +221,14 @@ class PolygonNode(NodeBase):
         ## Width of outline of the polygon (float)
         self.outline_width = 1.0
 
+        ## Whether moving objects such as projectiles collide with this
+        ## polygon. Only read when spawned.
+        self.collision_enabled = False
+
+        ## Whether the polygon never moves or changes shape once its
+        ## vertices are set, so collision geometry is only made once.
+        self.collision_static = False
+
     @property
     def vertices(self):
         return self._vertices
@@ -196,23 +237,82 @@ class PolygonNode(NodeBase):
     def vertices(self, value):
         # Only allow setting all vertices at once. Since Loc
         # objects are mutable, the referenced objects can still
-        # be manipulated.
+        # be manipulated, but call mark_vertices_dirty afterwards.
 
         if len(value) < 3:
             raise ValueError("Polygon must have at least 3 vertices")
 
         # Store relative coordinates for convenience.
         self._vertices = tuple(value)
-        # Add node's world location, to avoid calculating per draw call.
-        self._world_vertices = tuple(map(lambda v: self.location + v, value))
+        self.mark_vertices_dirty()
+
+    def mark_vertices_dirty(self):
+        """
+        Update cached coordinates after changing vertices in place.
+        Not needed when assigning new vertices or moving the node.
+        """
+        local_vertices = tuple(map(Vec2.from_loc, self._vertices))
+        self._local_vertices = local_vertices
+
+        if local_vertices:
+            xs = [v[0] for v in local_vertices]
+            ys = [v[1] for v in local_vertices]
+            self._local_bounds = (Vec2(min(xs), min(ys)),
+                Vec2(max(xs), max(ys)))
+        else:
+            self._local_bounds = (Vec2(), Vec2())
+
+        # World vertices are recalculated when next needed.
+        self._world_vertices_location = None
+        self._refresh_hovered_nodes()
 
     @property
     def world_vertices(self):
-        # Calculate each time it is called.
-        # return tuple(map(lambda v: self.location + v, self.vertices))
+        # Only recalculate when the node has moved or vertices changed.
+        location = Vec2.from_loc(self.location)
+        if location != self._world_vertices_location:
+            self._world_vertices = tuple(
+                Loc(v + location) for v in self._local_vertices)
+            self._world_vertices_location = location
 
         return self._world_vertices
 
+    def get_bounds(self):
+        """
+        Return the axis aligned bounding box of the polygon, in world
+        coordinates.
+
+        :return: (tuple) Bottom left and top right corners as Loc.
+        """
+        location = Vec2.from_loc(self.location)
+        local_bl, local_tr = self._local_bounds
+        return Loc(local_bl + location), Loc(local_tr + location)
+
+    def overlaps_bounds(self, bl, tr):
+        """
+        Return whether the polygon's bounding box overlaps a box.
+
+        :param bl: (Loc) Bottom left corner of box, in world coordinates.
+
+        :param tr: (Loc) Top right corner of box, in world coordinates.
+
+        :return: (bool) Whether the boxes overlap.
+        """
+        my_bl, my_tr = self.get_bounds()
+        return (my_bl.x <= tr[0] and bl[0] <= my_tr.x
+            and my_bl.y <= tr[1] and bl[1] <= my_tr.y)
+
+    def is_point_in_bounds(self, point):
+        """
+        Return whether a point is inside the polygon's bounding box. Use
+        this as a cheap test before exact picking.
+
+        :param point: (Loc) Point in world coordinates.
+
+        :return: (bool) Whether point is in the bounding box.
+        """
+        return self.overlaps_bounds(point, point)
+
     @property
     def fill_color(self):
         return self._fill_color
@@ -270,8 +370,12 @@ class PolygonNode(NodeBase):
     # Start of drawable interface.
 
     def _should_draw(self):
-        """Only draw if visible in graph and has vertices."""
-        return super()._should_draw() and self.vertices
+        """Only draw if bounding box is visible in graph and has vertices."""
+        if not self._vertices:
+            return False
+
+        tr, bl = self.world.get_view_coords()
+        return self.overlaps_bounds(bl, tr)
 
     def _draw(self):
         # Create a generator to convert vertices into canvas coordinates.
@@ -287,63 +391,147 @@ class PolygonNode(NodeBase):
     # End of drawable interface.
     # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
+    def begin_play(self):
+        super().begin_play()
+
+        if self.collision_enabled:
+            collision_manager = getattr(self.world, "collision_manager", None)
+            if collision_manager is not None:
+                collision_manager.add_collider(self, self.collision_static)
+
     def begin_destroy(self):
         super().begin_destroy()
         self._clear()
 
+        collision_manager = getattr(self.world, "collision_manager", None)
+        if collision_manager is not None:
+            collision_manager.remove_collider(self)
+
+    def get_streaming_state(self):
+        # Fill color first, so a matching outline color follows it.
+        return {
+            "vertices": self._vertices,
+            "fill_color": self._fill_color,
+            "outline_color": self._outline_color,
+            "outline_width": self._outline_width,
+            "collision_enabled": self.collision_enabled,
+            "collision_static": self.collision_static,
+        }
+
 class ImageNode(NodeBase):
-    """Node that shows an image. EXPERIMENTAL!!!"""
+    """
+    Node that shows an image. EXPERIMENTAL!!!
+
+    The image is loaded in the background, and a placeholder is shown
+    until it is ready.
+    """
     def __init__(self):
         super().__init__()
 
         ## Path to look in for the image.
         self.image_path = ""
 
-        ## Reference to image that is shown by this node.
+        ## Reference to image that is shown by this node. None until the
+        ## image has loaded.
         self.image_ref = None
 
+        ## Error (Exception) raised loading the image, or None. The
+        ## placeholder is kept if the image couldn't be loaded.
+        self.image_error = None
+
         ## Scaling to always apply to image (before graph scaling).
         self.image_base_scale = 1
 
         ## Last scale used on the image.
         self.image_scale = 1.0
 
+        ## Size of the placeholder shown while loading, in world units.
+        self.placeholder_size = Loc(100, 100)
+
+        ## Color of the placeholder shown while loading.
+        self.placeholder_color = FColor(200)
+
+        ## Screen size factor the zoom ratio scales were precomputed for.
+        self._precomputed_screen_size_factor = None
+
     # # # # # # # # # # # # # # # # # # # # # # # # # # # #
     # Start of actor interface.
 
     def begin_play(self):
         self._init_image()
 
+    def get_streaming_state(self):
+        return {
+            "image_path": self.image_path,
+            "image_base_scale": self.image_base_scale,
+            "placeholder_size": self.placeholder_size,
+            "placeholder_color": self.placeholder_color,
+        }
+
     # End of actor interface.
     # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
     def _init_image(self):
-        """Initialise the scaling image from image_path."""
-        self.image_ref = ScalingImage(file=self.image_path)
-        # Setup callback for after scaling the image.
-        self.image_ref.on_assign_image = self.on_assign_image
-        self._scale_image()
+        """Start loading the scaling image from image_path."""
+        GameplayStatics.game_engine.image_cache.load_async(
+            self.image_path, self._on_image_loaded)
+
+    def _on_image_loaded(self, image, error):
+        """Called on the Tk thread when the original image is loaded, or
+        with the error if it couldn't be."""
+        if error is not None:
+            self.image_error = error
+            return
+
+        self.image_ref = image
+        # Force scaling to the current zoom on the next draw.
+        self.image_scale = None
+
+    def _precompute_image_scales(self, screen_size_factor):
+        """Scale for every zoom ratio in the background. The cache is
+        shared, so other nodes using the same file will reuse these."""
+        self._precomputed_screen_size_factor = screen_size_factor
+        GameplayStatics.game_engine.image_cache.precompute_scales_async(
+            self.image_path,
+            [self._get_image_scale(zoom_ratio, screen_size_factor)
+            for zoom_ratio in range(GraphBase.MIN_ZOOM_RATIO,
+                GraphBase.MAX_ZOOM_RATIO + 1)])
+
+    def _get_image_scale(self, zoom_ratio, screen_size_factor):
+        """Return the real number scale of the image at ZOOM_RATIO."""
+        return self.image_base_scale \
+            * (1/zoom_ratio) \
+            * screen_size_factor
 
     def _scale_image(self):
         """Scale the image to match the current zoom ratio."""
         graph = self.world
-        img = self.image_ref.get_original_image()
+        screen_size_factor = graph.get_screen_size_factor()
+
+        if screen_size_factor != self._precomputed_screen_size_factor:
+            self._precompute_image_scales(screen_size_factor)
 
         # Use a real number for the scale.
-        new_scale = self.image_base_scale \
-            * (1/graph.zoom_ratio) \
-            * graph.get_screen_size_factor()
+        new_scale = self._get_image_scale(graph.zoom_ratio, screen_size_factor)
 
         # Only scale if scale changed.
         if new_scale == self.image_scale: return
         self.image_scale = new_scale
 
-
-        # Get the original image, otherwise the
-        # scale would get multiplied each time.
-        img = img.scale(new_scale)
-        # img = img.scale_continuous(new_scale)
-        # TODO: Use a timer to call scale_continuous_end
+        # Only the final scale needs to be high quality.
+        self.image_ref.cancel_scale_continuous_end()
+
+        # Scaled images are shared between nodes and always made from
+        # the original image, so the scale doesn't get multiplied.
+        cache = GameplayStatics.game_engine.image_cache
+        img = cache.find_scaled(self.image_path, new_scale)
+        if img is None:
+            # Not precomputed yet, so show a fast low quality image until
+            # scaling stops for a while.
+            img = cache.get_original(self.image_path).scale_continuous(
+                new_scale)
+            img.on_assign_image = self.on_assign_image
+            img.schedule_scale_continuous_end()
 
         self.on_assign_image(img)
 
@@ -355,17 +543,101 @@ class ImageNode(NodeBase):
     # Start of drawable interface.
 
     def _draw(self):
-        self._scale_image()
         c1 = self.world.view_to_canvas(self.location)
+
+        if self.image_ref is None:
+            # Still loading, so show a placeholder.
+            half_size = self.placeholder_size / 2
+            self.world.create_rectangle(
+                self.world.view_to_canvas(self.location - half_size),
+                self.world.view_to_canvas(self.location + half_size),
+                fill=self.placeholder_color.to_hex(), outline="",
+                tags=(self.unique_id))
+            return
+
+        self._scale_image()
         self.world.create_image(c1, image=self.image_ref,
             tags=(self.unique_id))
 
-        self.world.create_text(self.world.view_to_canvas(self.location),
+        self.world.create_text(c1,
             text=round(self.image_scale, 2), tags=(self.unique_id))
 
     # End of drawable interface.
     # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
+class StaticLayoutNode(DrawnActor):
+    """
+    Shows the polygons of a memory mapped static layout, instead of
+    spawning a PolygonNode for each. Only polygons in view are read from
+    the layout and drawn.
+
+    :see: factorygame.utils.static_layout for writing layouts.
+    """
+
+    def __init__(self):
+        """Set default values."""
+        super().__init__()
+
+        ## Layout to show (StaticLayout), or None. Vertices are in world
+        ## coordinates, so the node's location is not used.
+        self.layout = None
+
+        ## Width of outline of each polygon (float)
+        self.outline_width = 1.0
+
+        ## Whether moving objects such as projectiles collide with the
+        ## layout's polygons. Only read when spawned.
+        self.collision_enabled = False
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Start of drawable interface.
+
+    def _should_draw(self):
+        return self.layout is not None and not self.layout.closed
+
+    def _draw(self):
+        graph = self.world
+        layout = self.layout
+        canvas_dim, tr, bl = graph.get_view_transform()
+
+        # Same conversion as view_to_canvas, for all vertices at once.
+        scale_x = canvas_dim[0] / (tr[0] - bl[0])
+        scale_y = canvas_dim[1] / (tr[1] - bl[1])
+        offset_x = -bl[0] * scale_x
+        offset_y = canvas_dim[1] + bl[1] * scale_y
+
+        tags = (self.unique_id)
+        width = self.outline_width
+        for index in layout.query_box((bl[0], bl[1], tr[0], tr[1])):
+            vertices = layout.get_vertices(index)
+            coords = []
+            for i in range(0, len(vertices), 2):
+                coords.append(vertices[i] * scale_x + offset_x)
+                coords.append(offset_y - vertices[i + 1] * scale_y)
+
+            graph.create_polygon(*coords, tags=tags,
+                fill=layout.get_fill_color(index),
+                outline=layout.get_outline_color(index), width=width)
+
+    # End of drawable interface.
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def begin_play(self):
+        super().begin_play()
+
+        if self.collision_enabled and self.layout is not None:
+            collision_manager = getattr(self.world, "collision_manager", None)
+            if collision_manager is not None:
+                collision_manager.add_static_layout(self, self.layout)
+
+    def begin_destroy(self):
+        super().begin_destroy()
+        self._clear()
+
+        collision_manager = getattr(self.world, "collision_manager", None)
+        if collision_manager is not None:
+            collision_manager.remove_collider(self)
+
 class GraphBase(Canvas, Drawable):
     """
     Base blueprint graph for displaying drawable objects.
@@ -379,14 +651,21 @@ class GraphBase(Canvas, Drawable):
     ## Default is 3 (right mouse button).
     GRAPH_MOTION_BUTTON = property(lambda self: 3)
 
+    ## Smallest and largest allowed zoom ratio.
+    MIN_ZOOM_RATIO = 1
+    MAX_ZOOM_RATIO = 20
+
     def __get_zoom_ratio(self):
         return self._zoom_ratio
     def __set_zoom_ratio(self, value):
         # Only allow values between 1 and 20.
-        self._zoom_ratio = int(MathStat.clamp(value, 1, 20))
+        self._zoom_ratio = int(MathStat.clamp(value,
+            self.MIN_ZOOM_RATIO, self.MAX_ZOOM_RATIO))
         # Calculate zoom amount for later calculations.
         self._zoom_amt = 1 / self._zoom_ratio
 
+        self.on_view_changed.broadcast(self)
+
     ## Integer property for zoom level [1-20].
     ## Higher values zoom out further.
     zoom_ratio = property(__get_zoom_ratio, __set_zoom_ratio)
@@ -396,6 +675,10 @@ class GraphBase(Canvas, Drawable):
 
         # Set default values.
 
+        ## Event broadcast with the graph when the viewport is moved or
+        ## zoomed.
+        self.on_view_changed = MulticastDelegate()
+
         ## Offset of viewport from center of the graph in pixels.
         self._view_offset   = Loc(0, 0)
 
@@ -452,6 +735,8 @@ class GraphBase(Canvas, Drawable):
 
         self._view_offset += world_displacement
 
+        self.on_view_changed.broadcast(self)
+
     def on_graph_wheel_input(self, event):
         """Called when a mouse wheel event occurs on the graph."""
         # On windows wheel delta is in 120x
@@ -479,7 +764,14 @@ class GraphBase(Canvas, Drawable):
     def get_screen_size_factor(self):
         """Return the viewport scale factor to ensure the same
         sized viewport is shown at all scales."""
-        return MathStat.clamp(max(MathStat.getpercent(self.get_canvas_dim(), Loc(3840, 2160), Loc(640, 480))), 0.5, 8)
+        return self._get_screen_size_factor(
+            Vec2(self.winfo_width(), self.winfo_height()))
+
+    def _get_screen_size_factor(self, canvas_dim):
+        """Return the screen size factor for CANVAS_DIM, given as a Vec2."""
+        # Percent of the way from 4K to 480p, for the larger axis.
+        percent = (canvas_dim - (3840, 2160)) / (640 - 3840, 480 - 2160)
+        return MathStat.clamp(max(percent), 0.5, 8)
 
     def get_view_dim(self):
         """Return dimensions of viewport in coordinates as a Loc."""
@@ -489,12 +781,31 @@ class GraphBase(Canvas, Drawable):
     def get_view_coords(self):
         """Return top right and bottom left coordinates of viewport
         as a 2 tuple of Loc."""
-        center = self._view_offset
-        screen_size_factor = self.get_screen_size_factor()
-        half_bounds = (self.get_view_dim() / 2) * (screen_size_factor / 2)
-        tr = center + half_bounds
-        bl = center - half_bounds
-        return tr, bl
+        _, tr, bl = self.get_view_transform()
+        return tr.to_loc(), bl.to_loc()
+
+    def get_view_bounds(self):
+        """Return bottom left and top right coordinates of viewport
+        as a 2 tuple of Loc."""
+        tr, bl = self.get_view_coords()
+        return bl, tr
+
+    def get_view_transform(self):
+        """
+        Return canvas dimensions and the top right and bottom left
+        coordinates of viewport as a 3 tuple of Vec2. Cheaper than
+        calling get_canvas_dim and get_view_coords when transforming
+        many coordinates at once.
+        """
+        canvas_dim = Vec2(self.winfo_width(), self.winfo_height())
+        screen_size_factor = self._get_screen_size_factor(canvas_dim)
+
+        # Half of the view dimensions, scaled again by screen size.
+        half_bounds = canvas_dim * (
+            self.zoom_ratio * screen_size_factor * screen_size_factor / 4)
+
+        center = Vec2.from_loc(self._view_offset)
+        return canvas_dim, center + half_bounds, center - half_bounds
 
     def view_to_canvas(self, in_coords, clamp_to_viewport=False):
         """
@@ -507,20 +818,18 @@ class GraphBase(Canvas, Drawable):
 
         :return: Canvas coordinates converted from in_coords.
         """
-        canvas_dim = self.get_canvas_dim()
-        tr, bl = self.get_view_coords()
+        canvas_dim, tr, bl = self.get_view_transform()
 
-        if clamp_to_viewport:
-            coords = Loc(
-            MathStat.map_range_clamped(in_coords.x, bl.x, tr.x, 0, canvas_dim.x),
-            MathStat.map_range_clamped(in_coords.y, bl.y, tr.y, canvas_dim.y, 0))
+        # Percent of the way across the viewport, with y flipped.
+        percent_x = (in_coords[0] - bl[0]) / (tr[0] - bl[0])
+        percent_y = (in_coords[1] - bl[1]) / (tr[1] - bl[1])
 
-        else:
-            coords = Loc(
-            MathStat.map_range(in_coords.x, bl.x, tr.x, 0, canvas_dim.x),
-            MathStat.map_range(in_coords.y, bl.y, tr.y, canvas_dim.y, 0))
+        if clamp_to_viewport:
+            percent_x = MathStat.clamp(percent_x)
+            percent_y = MathStat.clamp(percent_y)
 
-        return coords
+        return Loc(canvas_dim[0] * percent_x,
+            canvas_dim[1] - canvas_dim[1] * percent_y)
 
     def canvas_to_view(self, in_coords, clamp_to_canvas=False):
         """
@@ -533,25 +842,28 @@ class GraphBase(Canvas, Drawable):
 
         :return: Viewport coordinates converted from in_coords.
         """
-        canvas_dim = self.get_canvas_dim()
-        tr, bl = self.get_view_coords()
+        canvas_dim, tr, bl = self.get_view_transform()
 
-        if clamp_to_canvas:
-            coords = Loc(
-            MathStat.map_range_clamped(in_coords.x, 0, canvas_dim.x, bl.x, tr.x),
-            MathStat.map_range_clamped(in_coords.y, canvas_dim.y, 0, bl.y, tr.y))
+        # Percent of the way across the canvas, with y flipped.
+        percent_x = in_coords[0] / canvas_dim[0]
+        percent_y = (in_coords[1] - canvas_dim[1]) / -canvas_dim[1]
 
-        else:
-            coords = Loc(
-            MathStat.map_range(in_coords.x, 0, canvas_dim.x, bl.x, tr.x),
-            MathStat.map_range(in_coords.y, canvas_dim.y, 0, bl.y, tr.y))
+        if clamp_to_canvas:
+            percent_x = MathStat.clamp(percent_x)
+            percent_y = MathStat.clamp(percent_y)
 
-        return coords
+        return Loc(bl[0] + (tr[0] - bl[0]) * percent_x,
+            bl[1] + (tr[1] - bl[1]) * percent_y)
 
 class GridGismo(DrawnActor):
     """
     Actor class to show grid lines on the viewport area
     which is currently visible.
+
+    Grid lines are laid out as cached tiles, one per world grid line,
+    keyed by zoom level and world tile index. Canvas items are pooled
+    and reused, so panning only translates existing tiles and recycles
+    the few that scroll in or out of view.
     """
 
     def __init__(self):
@@ -573,22 +885,31 @@ class GridGismo(DrawnActor):
 
         self.primary_actor_tick.tick_group = ETickGroup.WORLD
 
-        self._canvas_cache = {}
+        ## Grid tiles currently laid out, per axis. Maps world tile index
+        ## to the (line, label) canvas ids showing it.
+        self._grid_tiles = {"vertical": {}, "horizontal": {}}
+
+        ## Hidden (line, label) canvas id pairs ready to reuse, per axis.
+        self._grid_tile_pool = {"vertical": [], "horizontal": []}
+
+        ## Zoom level and canvas state the laid out tiles are valid for.
+        self._grid_layout_key = None
+
+        ## Canvas position of the world origin at the last layout.
+        self._grid_origin = None
+
+        ## Canvas ids of the vertical and horizontal origin lines.
+        self._origin_line_ids = None
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # #
     # Start of drawable interface.
 
     def _clear(self):
-        """Clear old drawn canvas elements."""
-        # Delete old grid lines.
-        self.world.delete("axis_number_vertical")
-        self.world.delete("grid_line_horizontal")
-        self.world.delete("axis_number_horizontal")
-        self.world.delete("origin_line_vertical")
-        self.world.delete("origin_line_horizontal")
+        """Grid tiles are cached between frames, so nothing is cleared."""
+        pass
 
     def _draw(self):
-        """Create new grid lines."""
+        """Update grid lines."""
         # Draw the grid lines.
         self.__draw_grid()
         self.__draw_grid_origin_lines()
@@ -598,8 +919,14 @@ class GridGismo(DrawnActor):
     # End of drawable interface.
     # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
+    def begin_destroy(self):
+        super().begin_destroy()
+
+        if GameplayStatics.is_game_valid() and self.world.winfo_exists():
+            self.world.delete(self.unique_id)
+
     def __draw_grid(self, draw_axis_numbers=True):
-        """Create grid lines."""
+        """Lay out grid tiles for the visible area."""
 
         graph = self.world
 
@@ -618,88 +945,133 @@ class GridGismo(DrawnActor):
         # density (decrease gap size).
         gap_size += self.grid_size * ((2 ** grid_mult) - 1)
 
-        # Offset of the first leftmost line from the
-        # bottom left viewport corner.
-        bl_line_offset = -bl % gap_size
-
-        # Find number of vertical lines to draw
-        first = bl.x + bl_line_offset.x
-        last = tr.x - (first % gap_size)
-        num_lines = ((last - first) // gap_size ) + 1
-
-        should_recache = not self._canvas_cache \
-            or len(self._canvas_cache["grid_line_vertical"]) != num_lines
-        if should_recache:
-            graph.delete("grid_line_vertical")
-            self._canvas_cache["grid_line_vertical"] = []
-
-        # Create vertical grid lines.
-        # Find left most line, then draw lines towards the right.
-        draw_pos = bl + bl_line_offset
-        while bl.x < draw_pos.x < tr.x:
-            c1 = graph.view_to_canvas(draw_pos)
-            c1.y = 0
-            c2 = c1 + (0, dim.y)
-            if should_recache:
-                new_id = graph.create_line(c1, c2, fill=line_color,
-                tags=(self.unique_id, "grid_line_vertical"))
-
-                self._canvas_cache["grid_line_vertical"].append(new_id)
-            else:
-                old_id = self._canvas_cache["grid_line_vertical"].pop(0)
-                graph.coords(old_id, c1.x,c1.y, c2.x,c2.y)
-                self._canvas_cache["grid_line_vertical"].append(old_id)
-
-            if draw_axis_numbers:
-                c1.x += 3
-                c1.y = dim.y - 5
-                graph.create_text(c1, text="%d" % draw_pos.x,
-                anchor="sw", fill=text_color,
-                tags=(self.unique_id, "axis_number_vertical"))
-
-            draw_pos.x += gap_size
-
-        # Create horizontal grid lines.
-        # Start at the bottom left corner.
-        draw_pos = bl + bl_line_offset
-        while bl.y < draw_pos.y < tr.y:
-            c1 = graph.view_to_canvas(draw_pos)
-            c1.x = 0
-            c2 = c1 + (dim.x, 0)
-            graph.create_line(c1, c2, fill=line_color,
-                tags=(self.unique_id, "grid_line_horizontal"))
-
-            if draw_axis_numbers:
-                c1.x = 5
-                graph.create_text(c1, text="%d" % draw_pos.y,
-                    anchor="nw", fill=text_color,
-                    tags=(self.unique_id, "axis_number_horizontal"))
-
-            draw_pos.y += gap_size
+        # Canvas pixels per world unit, for each axis.
+        scale = dim / (tr - bl)
+
+        origin = graph.view_to_canvas(Loc(0, 0))
+
+        layout_key = (graph.zoom_ratio, dim.x, dim.y, gap_size,
+            line_color, text_color, draw_axis_numbers)
+
+        if layout_key != self._grid_layout_key:
+            # Zoom or appearance changed, so every tile is invalid.
+            for axis in ("vertical", "horizontal"):
+                self.__release_grid_tiles(axis, tuple(self._grid_tiles[axis]))
+            self._grid_layout_key = layout_key
+
+        elif origin != self._grid_origin:
+            # Panning only translates tiles that are already laid out.
+            delta = origin - self._grid_origin
+            graph.move(self.__get_grid_axis_tag("vertical"), delta.x, 0)
+            graph.move(self.__get_grid_axis_tag("horizontal"), 0, delta.y)
+
+        self._grid_origin = origin
+
+        # Lines are only drawn strictly inside the viewport.
+        visible = {
+            "vertical": range(math.floor(bl.x / gap_size) + 1,
+                math.ceil(tr.x / gap_size)),
+            "horizontal": range(math.floor(bl.y / gap_size) + 1,
+                math.ceil(tr.y / gap_size)),
+            }
+
+        for axis, indices in visible.items():
+            tiles = self._grid_tiles[axis]
+
+            # Recycle tiles that scrolled out of view.
+            self.__release_grid_tiles(axis,
+                [index for index in tiles if index not in indices])
+
+            # Lay out tiles that scrolled into view.
+            for index in indices:
+                if index in tiles:
+                    continue
+
+                world_pos = index * gap_size
+                line_id, label_id = tiles[index] = self.__acquire_grid_tile(axis)
+
+                if axis == "vertical":
+                    x = origin.x + world_pos * scale.x
+                    graph.coords(line_id, x, 0, x, dim.y)
+                    graph.coords(label_id, x + 3, dim.y - 5)
+                else:
+                    y = origin.y - world_pos * scale.y
+                    graph.coords(line_id, 0, y, dim.x, y)
+                    graph.coords(label_id, 5, y)
+
+                graph.itemconfigure(line_id, fill=line_color, state="normal")
+                graph.itemconfigure(label_id, text="%d" % world_pos,
+                    fill=text_color,
+                    state="normal" if draw_axis_numbers else "hidden")
+
+    def __acquire_grid_tile(self, axis):
+        """
+        Return a (line, label) canvas id pair for a tile on AXIS, reusing
+        a pooled pair if one is available.
+        """
+        pool = self._grid_tile_pool[axis]
+        if pool:
+            return pool.pop()
+
+        graph = self.world
+        tags = (self.unique_id, self.__get_grid_axis_tag(axis))
+        line_id = graph.create_line(0, 0, 0, 0, tags=tags)
+        label_id = graph.create_text(0, 0,
+            anchor="sw" if axis == "vertical" else "nw", tags=tags)
+
+        # Keep the grid behind everything else on the canvas.
+        graph.tag_lower(label_id)
+        graph.tag_lower(line_id)
+
+        return line_id, label_id
+
+    def __get_grid_axis_tag(self, axis):
+        """Return the canvas tag of this grid's tiles on AXIS, so other
+        grids on the same graph aren't moved with them."""
+        return "%s_grid_%s" % (self.unique_id, axis)
+
+    def __release_grid_tiles(self, axis, indices):
+        """Hide tiles at INDICES on AXIS and return them to the pool."""
+        graph = self.world
+        tiles = self._grid_tiles[axis]
+        pool = self._grid_tile_pool[axis]
+
+        for index in indices:
+            tile = tiles.pop(index)
+            for canvas_id in tile:
+                graph.itemconfigure(canvas_id, state="hidden")
+            pool.append(tile)
 
     def __draw_grid_origin_lines(self):
-        """Create grid lines for origin lines of x and y."""
+        """Update grid lines for origin lines of x and y."""
 
         graph = self.world
         dim = graph.get_canvas_dim()
 
+        if self._origin_line_ids is None:
+            tags = (self.unique_id, "origin_line")
+            self._origin_line_ids = (
+                graph.create_line(0, 0, 0, 0, width=3, tags=tags),
+                graph.create_line(0, 0, 0, 0, width=3, tags=tags))
+
+        vertical_id, horizontal_id = self._origin_line_ids
         line_color = self.origin_line_color.to_hex()
 
-        # Vertical
         c1 = graph.view_to_canvas(Loc(0, 0))
-        if c1.x > 0 and c1.x < dim.x:
-            c1.y = 0
-            c2 = c1 + (0, dim.y)
-            graph.create_line(c1, c2, fill=line_color, width=3,
-                tags=(self.unique_id, "origin_line_vertical"))
+
+        # Vertical
+        if 0 < c1.x < dim.x:
+            graph.coords(vertical_id, c1.x, 0, c1.x, dim.y)
+            graph.itemconfigure(vertical_id, fill=line_color, state="normal")
+        else:
+            graph.itemconfigure(vertical_id, state="hidden")
 
         # Horizontal
-        c1 = graph.view_to_canvas(Loc(0, 0))
-        if c1.y > 0 and c1.y < dim.y:
-            c1.x = 0
-            c2 = c1 + (dim.x, 0)
-            graph.create_line(c1, c2, fill=line_color, width=3,
-            tags=(self.unique_id, "origin_line_horizontal"))
+        if 0 < c1.y < dim.y:
+            graph.coords(horizontal_id, 0, c1.y, dim.x, c1.y)
+            graph.itemconfigure(horizontal_id, fill=line_color, state="normal")
+        else:
+            graph.itemconfigure(horizontal_id, state="hidden")
 
 class WorldGraph(World, GraphBase):
     """
@@ -718,9 +1090,18 @@ class WorldGraph(World, GraphBase):
         ## Actor to control draw cycles. Receives tick event before other actors.
         self._render_manager = None
 
+        ## Actor to detect collisions with geometry in the world.
+        self._collision_manager = None
+
+        ## Actor to tick actors far from the view less often.
+        self._significance_manager = None
+
     def begin_play(self):
         # Spawn the world render manager first for tick priority.
         self._render_manager = self.spawn_actor(RenderManager, Loc(0, 0))
+        self._collision_manager = self.spawn_actor(CollisionManager, Loc(0, 0))
+        self._significance_manager = self.spawn_actor(SignificanceManager,
+            Loc(0, 0))
 
     def begin_destroy(self):
         super().begin_destroy()
@@ -849,9 +1230,61 @@ class WorldGraph(World, GraphBase):
     def render_manager(self):
         return self._render_manager
 
+    @property
+    def collision_manager(self):
+        return self._collision_manager
+
+    @property
+    def significance_manager(self):
+        return self._significance_manager
+
 class GeomHelper:
     """Helper class to create geometric objects for the graph."""
 
+    ## Largest number of shape templates to keep cached.
+    MAX_SHAPE_TEMPLATES = 1024
+
+    ## Unit vertex offsets of regular polygons, keyed by
+    ## (num_sides, radial_offset).
+    _shape_templates = {}
+
+    @staticmethod
+    def get_shape_template(num_sides, radial_offset=None):
+        """
+        Get the vertices of a regular polygon with radius 1 centered on
+        the origin. Templates are cached so sin and cos are only computed
+        once for each shape.
+
+        :param num_sides: (int) Number of sides of the polygon.
+
+        :param radial_offset: (float) Angle to rotate the polygon, in
+        radians.
+
+        :return: (tuple) Vertices as Vec2 objects.
+        """
+        key = (num_sides, radial_offset)
+        template = GeomHelper._shape_templates.get(key)
+        if template is not None:
+            return template
+
+        # Rotate the polygon so that the bottom has a flat side.
+        start_angle = GeomHelper.get_poly_start_angle(num_sides)
+        if radial_offset is not None:
+            start_angle += radial_offset
+
+        # Angle of each vertex in relation to the previous vertex.
+        center_angle = (2 * math.pi) / num_sides
+
+        template = tuple(
+            Vec2(math.sin(theta), math.cos(theta))
+            for theta in (center_angle * i + start_angle
+                for i in range(num_sides)))
+
+        if len(GeomHelper._shape_templates) >= GeomHelper.MAX_SHAPE_TEMPLATES:
+            GeomHelper._shape_templates.clear()
+        GeomHelper._shape_templates[key] = template
+        return template
+
     @staticmethod
     def generate_reg_poly(num_sides, **kw):
         """
@@ -874,17 +1307,46 @@ class GeomHelper:
         """
         radius = kw.get("radius", 1.0)
 
-        center = kw.get("center", Loc(0, 0))
+        center = Vec2.from_loc(kw.get("center", (0, 0)))
 
-        # Rotate the polygon so that the bottom has a flat side.
-        radial_offset = GeomHelper.get_poly_start_angle(num_sides)
-        to_add = kw.get("radial_offset")
-        if to_add is not None:
-            radial_offset += to_add
+        template = GeomHelper.get_shape_template(
+            num_sides, kw.get("radial_offset"))
+
+        for offset in template:
+            yield Loc(offset * radius + center)
+
+    @staticmethod
+    def generate_reg_polys(num_sides, centers, radii=1.0, radial_offset=None):
+        """
+        Generate vertices for many regular polygons with the same number
+        of sides in one call. Requires NumPy.
+
+        :param num_sides: (int) Number of sides of each polygon.
+
+        :param centers: (array) Center point of each polygon, shape (N, 2).
+
+        :param radii: (float or array) Radius of all polygons, or of each
+        polygon with shape (N,).
+
+        :param radial_offset: (float) Angle to rotate every polygon, in
+        radians.
+
+        :return: (numpy.ndarray) Contiguous vertices, shape
+        (N, num_sides, 2).
+        """
+        # Imported here as NumPy is optional.
+        import numpy as np
+
+        template = np.array(
+            GeomHelper.get_shape_template(num_sides, radial_offset),
+            dtype=float)
+        centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+        radii = np.asarray(radii, dtype=float)
+        if radii.ndim == 1:
+            radii = radii[:, np.newaxis, np.newaxis]
 
-        for i in range(num_sides):
-            yield GeomHelper.get_nth_vertex_offset(i, num_sides, radius, radial_offset) \
-                + center
+        return np.ascontiguousarray(
+            template * radii + centers[:, np.newaxis, :])
 
     @staticmethod
     def get_poly_start_angle(num_sides):
@@ -950,6 +1412,12 @@ class FColor(Loc):
 
     _repr_items = "RGB"
 
+    ## Largest number of colors to keep in the hex palette.
+    MAX_PALETTE_SIZE = 65536
+
+    ## Interned hex strings for each color value, shared by all FColors.
+    _hex_palette = {}
+
     @staticmethod
     def default():
         """Return the default color."""
@@ -1036,7 +1504,7 @@ class FColor(Loc):
         Yield RGB values from a hexadecimal string.
         """
         for i in range(1, len(hex_string), digits):
-            yield int("0x%s" % hex_string[i:i + digits], 0)
+            yield int(hex_string[i:i + digits], 16)
 
     @staticmethod
     def from_hex(hex_string, digits=2):
@@ -1053,11 +1521,18 @@ class FColor(Loc):
 
     def to_hex(self):
         """
-        Get hexadecimal representation of this color.
+        Get hexadecimal representation of this color. The string is only
+        formatted the first time each color value is used.
 
         :return: (str) Hex color code
         """
-        return "#%02x%02x%02x" % tuple(self)
+        key = tuple(self)
+        hex_val = FColor._hex_palette.get(key)
+        if hex_val is None:
+            hex_val = "#%02x%02x%02x" % key
+            if len(FColor._hex_palette) < FColor.MAX_PALETTE_SIZE:
+                FColor._hex_palette[key] = hex_val
+        return hex_val
 
 class RenderManager(Actor, Drawable):
     def __init__(self):
@@ -1072,9 +1547,60 @@ class RenderManager(Actor, Drawable):
         ## Set of nodes the mouse is currently hovering over.
         self.hovered_nodes = set()
 
+        ## Last pointer event on the graph, or None if there hasn't been
+        ## one yet.
+        self._pointer_event = None
+
+        ## Whether nodes or the view changed since the last draw cycle
+        ## started, so hovered nodes must be found again once they have
+        ## been drawn.
+        self._hover_dirty = False
+
+        ## Whether to find hovered nodes again this frame, from the
+        ## canvas items drawn last frame.
+        self._hover_ready = False
+
         # ENSURE we tick before any other actors!
         self.primary_actor_tick.tick_group = ETickGroup.ENGINE
 
+    def begin_play(self):
+        super().begin_play()
+
+        # Only find hovered nodes again when the pointer, view or nodes
+        # change.
+        graph = self.world
+        graph.bind("<Motion>", self._on_pointer_moved, True)
+        graph.bind("<Leave>", self._on_pointer_left, True)
+        graph.on_view_changed.add(self.refresh_hovered_nodes)
+        graph.on_actor_spawned.add(self.refresh_hovered_nodes)
+        graph.on_actor_destroyed.add(self.refresh_hovered_nodes)
+
+    def refresh_hovered_nodes(self, *args):
+        """
+        Find which nodes are hovered again once nodes have been drawn
+        again. Called automatically when the view changes, actors are spawned or
+        destroyed, or nodes are moved or given new vertices. Call after
+        moving nodes in place or by moving an actor they are attached
+        to.
+        """
+        self._hover_dirty = True
+
+    def _on_pointer_moved(self, event):
+        # Nothing needs redrawing, so find hovered nodes next frame.
+        self._pointer_event = event
+        self._hover_ready = True
+
+    def _on_pointer_left(self, event):
+        """Stop hovering all nodes when the pointer leaves the graph."""
+        self._pointer_event = None
+        self._hover_dirty = False
+        self._hover_ready = False
+
+        hovered_nodes, self.hovered_nodes = self.hovered_nodes, set()
+        for node in hovered_nodes:
+            if node.generate_cursor_over_events:
+                node.on_end_cursor_over(event)
+
     def _draw(self):
         """This should be called before any other nodes receive draw calls."""
 
@@ -1086,14 +1612,14 @@ class RenderManager(Actor, Drawable):
             self.node_canvas_ids = {}
 
     def tick(self, dt):
-        # Call motion input every frame rather than on mouse movement.
-        canvas = self.world
-        event = type(
-            "MyTkEvent", (), {
-                "x": canvas.winfo_pointerx() - canvas.winfo_rootx(),
-                "y": canvas.winfo_pointery() - canvas.winfo_rooty()})
-
-        self.world.on_graph_pointer_movement_input(event)
+        # Call motion input at most once per frame, and only when
+        # something changed. Canvas items are from last frame's draw
+        # cycle, so changes made since then wait until this frame's
+        # draw cycle is done.
+        if self._hover_ready and self._pointer_event is not None:
+            self.world.on_graph_pointer_movement_input(self._pointer_event)
+        self._hover_ready = self._hover_dirty
+        self._hover_dirty = False
 
 
         self.start_cycle()
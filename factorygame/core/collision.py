@@ -0,0 +1,587 @@
+"""
+Collision detection between moving objects and world geometry.
+"""
+
+from math import floor, inf, sqrt
+from factorygame.utils.loc import Loc
+from factorygame.utils.bvh import AABBTree
+from factorygame.core.engine_base import Actor, ETickGroup
+
+
+class HitResult:
+    """Structure for result of a colliding hit.
+    """
+
+    __slots__ = ("impact_velocity", "surface_normal", "location",
+        "other_actor", "item")
+
+    def __init__(self):
+        self.impact_velocity = Loc(0.0, 0.0)
+        self.surface_normal = Loc(0.0, 0.0)
+        self.location = Loc(0.0, 0.0)
+        self.other_actor = None
+
+        ## Index of the polygon hit in a static layout, or None if the
+        ## other actor isn't a static layout collider.
+        self.item = None
+
+
+class CollisionManager(Actor):
+    """
+    Tracks collidable geometry in a world and finds where moving
+    objects first hit it.
+
+    Geometry is stored as edges in a uniform grid, so each query only
+    tests edges in the grid cells that the movement passes through.
+    """
+
+    def __init__(self):
+        """Set default values."""
+        super().__init__()
+
+        ## Width and height of each grid cell, in world units. Must be
+        ## set before any geometry is added.
+        self.cell_size = 200.0
+
+        ## Set of edges in each grid cell, keyed by (column, row). Each
+        ## edge is a tuple of (ax, ay, bx, by, collider).
+        self._cells = {}
+
+        ## Geometry of each collider as a tuple of (vertices, list of
+        ## (cell, edge) placed in the grid, list of (x, y) points,
+        ## whether closed), keyed by collider.
+        self._colliders = {}
+
+        ## Bounding volume hierarchy of colliders, for traces and
+        ## overlap queries.
+        self._tree = AABBTree()
+
+        ## Polygon nodes whose world vertices are checked each tick, as
+        ## a dictionary of node to whether the node is static.
+        self._polygon_nodes = {}
+
+        ## Static layouts (StaticLayout) to collide with, keyed by the
+        ## collider reported when their polygons are hit.
+        self._static_layouts = {}
+
+        # Update geometry before gameplay actors move.
+        self.primary_actor_tick.tick_group = ETickGroup.PHYSICS
+
+    def set_geometry(self, collider, vertices, closed=True):
+        """
+        Set the edges that make up a collider, replacing any it had
+        before.
+
+        :param collider: Object to report as the other actor when hit,
+        usually an actor.
+
+        :param vertices: (iterable) Vertex coordinates (Loc) of the
+        collider, in world coordinates.
+
+        :param closed: (bool) Whether to join the last vertex to the
+        first, making a polygon rather than a line.
+        """
+        self._remove_edges(collider)
+
+        points = [(v[0], v[1]) for v in vertices]
+        pairs = list(zip(points, points[1:]))
+        if closed and len(points) > 2:
+            pairs.append((points[-1], points[0]))
+
+        placed = []
+        for a, b in pairs:
+            edge = (a[0], a[1], b[0], b[1], collider)
+            for cell in self._get_segment_cells(*edge[:4]):
+                self._cells.setdefault(cell, set()).add(edge)
+                placed.append((cell, edge))
+
+        self._colliders[collider] = (vertices, placed, points, closed)
+
+        if points:
+            xs = [p[0] for p in points]
+            ys = [p[1] for p in points]
+            self._tree.update(collider, (min(xs), min(ys), max(xs), max(ys)))
+        else:
+            self._tree.remove(collider)
+
+    def add_collider(self, node, is_static=False):
+        """
+        Start colliding with a polygon node. Its world vertices are read
+        each tick, so the geometry follows the node when it moves.
+
+        :param node: (PolygonNode) Node to collide with.
+
+        :param is_static: (bool) Whether the node never moves or changes
+        shape. Static nodes are only read once they have vertices.
+        """
+        self._polygon_nodes[node] = is_static
+
+    def add_static_layout(self, collider, layout):
+        """
+        Start colliding with the polygons of a static layout. They are
+        read from the mapped file for each query rather than added to the
+        grid, so large layouts cost no memory here.
+
+        :param collider: Object to report as the other actor when hit,
+        usually the StaticLayoutNode showing the layout. Hits also give
+        the index of the polygon as the item.
+
+        :param layout: (StaticLayout) Layout to collide with.
+        """
+        self._static_layouts[collider] = layout
+
+    def remove_collider(self, collider):
+        """
+        Stop colliding with a collider, polygon node or static layout.
+        Does nothing if it is not a collider.
+        """
+        self._polygon_nodes.pop(collider, None)
+        self._static_layouts.pop(collider, None)
+        self._remove_edges(collider)
+        self._colliders.pop(collider, None)
+        self._tree.remove(collider)
+
+    def sweep(self, start, end, ignore=None):
+        """
+        Find the first edge hit when moving in a straight line.
+
+        :param start: (Loc) Start of movement, in world coordinates.
+
+        :param end: (Loc) End of movement, in world coordinates.
+
+        :param ignore: Collider to not collide with, eg the moving actor.
+
+        :return: (HitResult) Details about the hit, where impact velocity
+        is the movement offset. None if nothing was hit.
+        """
+        ax, ay = start[0], start[1]
+        dx, dy = end[0] - ax, end[1] - ay
+
+        best_time = inf
+        best_edge = None
+        cells = self._cells
+        for cell in self._get_segment_cells(ax, ay, end[0], end[1]):
+            edges = cells.get(cell)
+            if not edges:
+                continue
+
+            for edge in edges:
+                ex, ey, fx, fy, collider = edge
+                if collider is ignore:
+                    continue
+
+                # Intersect the movement with the edge.
+                sx, sy = fx - ex, fy - ey
+                denom = dx * sy - dy * sx
+                if not denom:
+                    # Parallel, so can't cross.
+                    continue
+
+                ox, oy = ex - ax, ey - ay
+                time = (ox * sy - oy * sx) / denom
+                if time < 0.0 or time > 1.0 or time >= best_time:
+                    continue
+
+                along_edge = (ox * dy - oy * dx) / denom
+                if 0.0 <= along_edge <= 1.0:
+                    best_time = time
+                    best_edge = edge
+
+        best_normal = best_collider = best_item = None
+        if best_edge is not None:
+            ex, ey, fx, fy, best_collider = best_edge
+
+            # Normal points back towards the side that was hit.
+            nx, ny = ey - fy, fx - ex
+            if nx * dx + ny * dy > 0.0:
+                nx, ny = -nx, -ny
+            length = sqrt(nx * nx + ny * ny)
+            best_normal = (nx / length, ny / length)
+
+        for collider, time, normal, item in self._trace_static_layouts(
+            ax, ay, dx, dy, ignore):
+            if time < best_time:
+                best_time, best_normal = time, normal
+                best_collider, best_item = collider, item
+
+        if best_normal is None:
+            return None
+
+        hit = HitResult()
+        hit.impact_velocity = Loc(dx, dy)
+        hit.surface_normal = Loc(best_normal)
+        hit.location = Loc(ax + dx * best_time, ay + dy * best_time)
+        hit.other_actor = best_collider
+        hit.item = best_item
+        return hit
+
+    def line_trace(self, start, end, ignore=None):
+        """
+        Find every collider crossed by a line segment.
+
+        :param start: (Loc) Start of line, in world coordinates.
+
+        :param end: (Loc) End of line, in world coordinates.
+
+        :param ignore: Collider to leave out of the results.
+
+        :return: (list) A HitResult for the first point each collider is
+        crossed, sorted by distance from start.
+        """
+        ax, ay = start[0], start[1]
+        dx, dy = end[0] - ax, end[1] - ay
+        colliders = self._colliders
+
+        found = []
+        for collider in self._tree.query_segment(ax, ay, end[0], end[1]):
+            if collider is ignore:
+                continue
+
+            _, _, points, closed = colliders[collider]
+            time, normal = _trace_polyline(ax, ay, dx, dy, points, closed)
+            if normal is not None:
+                found.append((time, normal, collider, None))
+
+        for collider, time, normal, item in self._trace_static_layouts(
+            ax, ay, dx, dy, ignore):
+            found.append((time, normal, collider, item))
+
+        found.sort(key=lambda it: it[0])
+
+        hits = []
+        for time, normal, collider, item in found:
+            hit = HitResult()
+            hit.impact_velocity = Loc(dx, dy)
+            hit.surface_normal = Loc(normal)
+            hit.location = Loc(ax + dx * time, ay + dy * time)
+            hit.other_actor = collider
+            hit.item = item
+            hits.append(hit)
+        return hits
+
+    def multi_line_trace(self, starts, ends, ignore=None):
+        """
+        Trace many lines in one call, eg for AI sight checks.
+
+        :param starts: (iterable) Start of each line.
+
+        :param ends: (iterable) End of each line.
+
+        :param ignore: Collider to leave out of the results.
+
+        :return: (list) Sorted list of HitResults for each line.
+        """
+        line_trace = self.line_trace
+        return [line_trace(start, end, ignore)
+            for start, end in zip(starts, ends)]
+
+    def sphere_overlap(self, center, radius, ignore=None):
+        """
+        Find every collider within a distance of a point.
+
+        :param center: (Loc) Center of sphere, in world coordinates.
+
+        :param radius: (float) Radius of sphere, in world units.
+
+        :param ignore: Collider to leave out of the results.
+
+        :return: (list) A HitResult for each collider, sorted by distance
+        from center. The location is the closest point on the collider,
+        and the surface normal points from it towards the center. Both
+        are the center if it is inside the collider.
+        """
+        cx, cy = center[0], center[1]
+        bounds = (cx - radius, cy - radius, cx + radius, cy + radius)
+        return self._overlap(bounds, cx, cy, radius * radius, ignore)
+
+    def box_overlap(self, bl, tr, ignore=None):
+        """
+        Find every collider touching a box.
+
+        :param bl: (Loc) Bottom left corner of box, in world coordinates.
+
+        :param tr: (Loc) Top right corner of box, in world coordinates.
+
+        :param ignore: Collider to leave out of the results.
+
+        :return: (list) A HitResult for each collider, sorted by distance
+        from the center of the box. The location is the closest point on
+        the collider to the center of the box.
+        """
+        bounds = (bl[0], bl[1], tr[0], tr[1])
+        cx, cy = (bl[0] + tr[0]) * 0.5, (bl[1] + tr[1]) * 0.5
+        return self._overlap(bounds, cx, cy, None, ignore)
+
+    def tick(self, dt):
+        # Move edges of polygon nodes that have moved or changed shape.
+        for node, is_static in tuple(self._polygon_nodes.items()):
+            vertices = node.world_vertices
+            current = self._colliders.get(node)
+            if current is not None and current[0] is vertices:
+                # World vertices are cached until they change.
+                continue
+
+            self.set_geometry(node, vertices)
+            if is_static and vertices:
+                # Stop checking nodes that won't change.
+                del self._polygon_nodes[node]
+
+    def begin_destroy(self):
+        super().begin_destroy()
+        self._cells.clear()
+        self._colliders.clear()
+        self._polygon_nodes.clear()
+        self._static_layouts.clear()
+        self._tree.clear()
+
+    def _overlap(self, bounds, cx, cy, radius_squared, ignore):
+        """
+        Find colliders touching a sphere or box, sorted by distance from
+        (CX, CY).
+
+        :param radius_squared: (float) Squared radius of sphere, or None
+        to test against the box BOUNDS.
+        """
+        colliders = self._colliders
+
+        found = []
+        for collider in self._tree.query_box(bounds):
+            if collider is ignore:
+                continue
+
+            _, _, points, closed = colliders[collider]
+            distance_squared, px, py = _closest_point(cx, cy, points, closed)
+
+            if radius_squared is not None:
+                if distance_squared > radius_squared:
+                    continue
+            elif not _polyline_overlaps_box(points, closed, bounds, cx, cy):
+                continue
+
+            found.append((distance_squared, px, py, collider, None))
+
+        for collider, layout in self._static_layouts.items():
+            if collider is ignore:
+                continue
+
+            for item in layout.query_box(bounds):
+                points = layout.get_points(item)
+                distance_squared, px, py = _closest_point(cx, cy, points,
+                    True)
+
+                if radius_squared is not None:
+                    if distance_squared > radius_squared:
+                        continue
+                elif not _polyline_overlaps_box(points, True, bounds, cx, cy):
+                    continue
+
+                found.append((distance_squared, px, py, collider, item))
+
+        found.sort(key=lambda it: it[0])
+
+        hits = []
+        for distance_squared, px, py, collider, item in found:
+            hit = HitResult()
+            hit.location = Loc(px, py)
+            if distance_squared:
+                distance = sqrt(distance_squared)
+                hit.surface_normal = Loc(
+                    (cx - px) / distance, (cy - py) / distance)
+            hit.other_actor = collider
+            hit.item = item
+            hits.append(hit)
+        return hits
+
+    def _trace_static_layouts(self, ax, ay, dx, dy, ignore):
+        """
+        Generate the first hit of a line segment with each static layout
+        polygon it crosses.
+
+        :return: A generator of (collider, fraction along the segment,
+        surface normal, polygon index) tuples.
+        """
+        bounds = (min(ax, ax + dx), min(ay, ay + dy),
+            max(ax, ax + dx), max(ay, ay + dy))
+        for collider, layout in self._static_layouts.items():
+            if collider is ignore:
+                continue
+
+            for item in layout.query_box(bounds):
+                time, normal = _trace_polyline(ax, ay, dx, dy,
+                    layout.get_points(item), True)
+                if normal is not None:
+                    yield collider, time, normal, item
+
+    def _remove_edges(self, collider):
+        """Remove edges of a collider from the grid."""
+        current = self._colliders.get(collider)
+        if current is None:
+            return
+
+        for cell, edge in current[1]:
+            cell_edges = self._cells.get(cell)
+            if cell_edges is None:
+                continue
+            cell_edges.discard(edge)
+            if not cell_edges:
+                del self._cells[cell]
+
+    def _get_segment_cells(self, ax, ay, bx, by):
+        """
+        Generate the grid cells a line segment passes through, in order
+        from start to end.
+
+        :return: A generator of (column, row) tuples.
+        """
+        size = self.cell_size
+        col, row = floor(ax / size), floor(ay / size)
+        end_col, end_row = floor(bx / size), floor(by / size)
+        yield col, row
+
+        dx, dy = bx - ax, by - ay
+        step_col = 1 if dx > 0 else -1
+        step_row = 1 if dy > 0 else -1
+
+        # Fraction along the segment to the next cell boundary on each
+        # axis, and between cell boundaries.
+        if dx:
+            time_x = ((col + (step_col > 0)) * size - ax) / dx
+            delta_x = size / abs(dx)
+        else:
+            time_x = delta_x = inf
+        if dy:
+            time_y = ((row + (step_row > 0)) * size - ay) / dy
+            delta_y = size / abs(dy)
+        else:
+            time_y = delta_y = inf
+
+        remaining = abs(end_col - col) + abs(end_row - row)
+        while remaining > 0:
+            if time_x < time_y:
+                col += step_col
+                time_x += delta_x
+                remaining -= 1
+            elif time_y < time_x:
+                row += step_row
+                time_y += delta_y
+                remaining -= 1
+            else:
+                # Passes through a corner, so include both neighbours.
+                yield col + step_col, row
+                yield col, row + step_row
+                col += step_col
+                row += step_row
+                time_x += delta_x
+                time_y += delta_y
+                remaining -= 2
+            yield col, row
+
+        if (col, row) != (end_col, end_row):
+            # Rounding errors stopped short of the end.
+            yield end_col, end_row
+
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# Start of shape tests
+
+def _iter_edges(points, closed):
+    """Generate each edge of a polyline as a pair of points."""
+    yield from zip(points, points[1:])
+    if closed and len(points) > 2:
+        yield points[-1], points[0]
+
+def _trace_polyline(ax, ay, dx, dy, points, closed):
+    """
+    Find the first edge of a polyline crossed by a line segment.
+
+    :return: (tuple) Fraction along the segment of the hit, and unit
+    surface normal facing the start of the segment. The normal is None
+    if nothing was hit.
+    """
+    best_time = inf
+    best_edge = None
+    for (ex, ey), (fx, fy) in _iter_edges(points, closed):
+        sx, sy = fx - ex, fy - ey
+        denom = dx * sy - dy * sx
+        if not denom:
+            continue
+
+        ox, oy = ex - ax, ey - ay
+        time = (ox * sy - oy * sx) / denom
+        if time < 0.0 or time > 1.0 or time >= best_time:
+            continue
+
+        along_edge = (ox * dy - oy * dx) / denom
+        if 0.0 <= along_edge <= 1.0:
+            best_time = time
+            best_edge = (ex, ey, fx, fy)
+
+    if best_edge is None:
+        return best_time, None
+
+    ex, ey, fx, fy = best_edge
+    nx, ny = ey - fy, fx - ex
+    if nx * dx + ny * dy > 0.0:
+        nx, ny = -nx, -ny
+    length = sqrt(nx * nx + ny * ny)
+    return best_time, (nx / length, ny / length)
+
+def _is_point_in_polygon(x, y, points):
+    """Return whether a point is inside a closed polygon."""
+    inside = False
+    for (ex, ey), (fx, fy) in _iter_edges(points, True):
+        if (ey > y) != (fy > y) and x < ex + (y - ey) * (fx - ex) / (fy - ey):
+            inside = not inside
+    return inside
+
+def _closest_point(x, y, points, closed):
+    """
+    Find the closest point on a polyline to a point. A point inside a
+    closed polygon is its own closest point.
+
+    :return: (tuple) Squared distance, and x and y of closest point.
+    """
+    if closed and len(points) > 2 and _is_point_in_polygon(x, y, points):
+        return 0.0, x, y
+
+    if len(points) == 1:
+        px, py = points[0]
+        return (px - x) ** 2 + (py - y) ** 2, px, py
+
+    best = (inf, x, y)
+    for (ex, ey), (fx, fy) in _iter_edges(points, closed):
+        sx, sy = fx - ex, fy - ey
+        length_squared = sx * sx + sy * sy
+        along = ((x - ex) * sx + (y - ey) * sy) / length_squared \
+            if length_squared else 0.0
+        along = 0.0 if along < 0.0 else 1.0 if along > 1.0 else along
+
+        px, py = ex + sx * along, ey + sy * along
+        distance_squared = (px - x) ** 2 + (py - y) ** 2
+        if distance_squared < best[0]:
+            best = (distance_squared, px, py)
+    return best
+
+def _polyline_overlaps_box(points, closed, bounds, cx, cy):
+    """Return whether a polyline touches a box with center (CX, CY)."""
+    min_x, min_y, max_x, max_y = bounds
+
+    # Any vertex inside the box.
+    for px, py in points:
+        if min_x <= px <= max_x and min_y <= py <= max_y:
+            return True
+
+    # Box inside a closed polygon.
+    if closed and len(points) > 2 and _is_point_in_polygon(cx, cy, points):
+        return True
+
+    # Any edge crossing the box.
+    corners = ((min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y))
+    for (ax, ay), (bx, by) in _iter_edges(points, closed):
+        _, normal = _trace_polyline(ax, ay, bx - ax, by - ay, corners, True)
+        if normal is not None:
+            return True
+    return False
+
+# End of shape tests
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
@@ -0,0 +1,385 @@
+"""
+Entity component system for large numbers of lightweight objects.
+
+Entities are just ids. Their data is stored in archetype tables, which
+hold one NumPy array per component for all entities with exactly the same
+set of components. Systems query for components and update whole arrays
+at once, so hundreds of thousands of entities, such as factory items,
+can be simulated without making an actor for each.
+
+Heavyweight objects should keep using actors. An `EntityManager` actor
+holds the entities of a world, and `EntitySystem` components added to it
+run in the usual tick group order.
+
+Requires NumPy.
+"""
+
+import numpy as np
+from factorygame.core.engine_base import Actor, ActorComponent, ETickGroup
+
+class _Archetype(object):
+    """Table of entities with exactly the same set of components."""
+
+    __slots__ = ("index", "component_names", "columns", "entities", "count")
+
+    def __init__(self, index, component_names, component_types):
+        ## Position of this archetype in the manager's list.
+        self.index = index
+
+        ## Frozen set of names of components of each entity.
+        self.component_names = component_names
+
+        ## Array of values of each component, keyed by component name.
+        ## Only the first `count` rows are used.
+        self.columns = {}
+        for name in component_names:
+            dtype, shape = component_types[name]
+            self.columns[name] = np.zeros((0,) + shape, dtype=dtype)
+
+        ## Entity id of each row.
+        self.entities = np.zeros(0, dtype=np.int64)
+
+        ## Number of rows in use.
+        self.count = 0
+
+    def reserve(self, extra):
+        """Make room for EXTRA more rows, growing arrays by doubling."""
+        needed = self.count + extra
+        capacity = len(self.entities)
+        if needed <= capacity:
+            return
+
+        capacity = max(needed, capacity * 2, 16)
+        count = self.count
+        for name, column in self.columns.items():
+            new_column = np.zeros((capacity,) + column.shape[1:],
+                dtype=column.dtype)
+            new_column[:count] = column[:count]
+            self.columns[name] = new_column
+
+        new_entities = np.zeros(capacity, dtype=np.int64)
+        new_entities[:count] = self.entities[:count]
+        self.entities = new_entities
+
+class EntityManager(Actor):
+    """
+    Actor that stores entities and their components in archetype
+    tables.
+
+    Define each component with `define_component` before using it.
+    Entities must not be created, destroyed or changed while iterating a
+    query. Collect them and change them after instead.
+    """
+
+    def __init__(self):
+        """Set default values."""
+        super().__init__()
+
+        # Systems tick, not the manager itself.
+        self.primary_actor_tick.can_ever_tick = False
+
+        ## Data type and shape of each component, keyed by name.
+        self._component_types = {}
+
+        ## All archetypes, in order of creation.
+        self._archetypes = []
+
+        ## Archetype of each set of component names.
+        self._archetypes_by_names = {}
+
+        ## Archetypes that have all of a set of component names, keyed
+        ## by set of names. Cleared when archetypes are added.
+        self._query_cache = {}
+
+        ## Archetype index of each entity id, or -1 if destroyed.
+        self._entity_archetypes = np.zeros(0, dtype=np.int64)
+
+        ## Row of each entity id in its archetype.
+        self._entity_rows = np.zeros(0, dtype=np.int64)
+
+        ## Next entity id to use. Ids are never reused.
+        self._next_entity = 0
+
+        ## Number of entities alive.
+        self._num_entities = 0
+
+    def define_component(self, name, dtype=float, shape=()):
+        """
+        Define a type of component that entities can have.
+
+        :param name: (str) Name of component.
+
+        :param dtype: NumPy data type of the component, eg float or
+        np.uint8. Use object for any Python object.
+
+        :param shape: (tuple) Shape of each value, eg (2,) for a location.
+        """
+        self._component_types[name] = (np.dtype(dtype), tuple(shape))
+
+    @property
+    def num_entities(self):
+        """Number of entities alive."""
+        return self._num_entities
+
+    def create_entity(self, **components):
+        """
+        Create an entity with some components.
+
+        :param components: Initial value of each component, by name.
+
+        :return: (int) Id of new entity.
+        """
+        return int(self.create_entities(1, **components)[0])
+
+    def create_entities(self, count, **components):
+        """
+        Create many entities with the same components in one call.
+
+        :param count: (int) Number of entities to create.
+
+        :param components: Initial values of each component, by name.
+        Each value is used for all entities, or can be an array with one
+        value per entity.
+
+        :return: (numpy.ndarray) Ids of new entities.
+        """
+        archetype = self._get_archetype(frozenset(components))
+        entities = np.arange(self._next_entity, self._next_entity + count,
+            dtype=np.int64)
+        self._next_entity += count
+        self._reserve_entities(self._next_entity)
+
+        start = archetype.count
+        end = start + count
+        archetype.reserve(count)
+        for name, value in components.items():
+            archetype.columns[name][start:end] = value
+        archetype.entities[start:end] = entities
+        archetype.count = end
+
+        self._entity_archetypes[entities] = archetype.index
+        self._entity_rows[entities] = np.arange(start, end)
+        self._num_entities += count
+        return entities
+
+    def destroy_entity(self, entity):
+        """Destroy an entity. Does nothing if it is already destroyed."""
+        if not self.is_entity_valid(entity):
+            return
+
+        archetype = self._archetypes[self._entity_archetypes[entity]]
+        self._remove_row(archetype, int(self._entity_rows[entity]))
+        self._entity_archetypes[entity] = -1
+        self._num_entities -= 1
+
+    def destroy_entities(self, entities):
+        """
+        Destroy many entities in one call. Destroyed entities are
+        ignored.
+
+        :param entities: (iterable) Ids of entities.
+        """
+        entities = np.unique(np.asarray(entities, dtype=np.int64))
+        entities = entities[(entities >= 0) & (entities < self._next_entity)]
+        archetype_indexes = self._entity_archetypes[entities]
+        entities = entities[archetype_indexes >= 0]
+        archetype_indexes = archetype_indexes[archetype_indexes >= 0]
+
+        for index in np.unique(archetype_indexes):
+            archetype = self._archetypes[index]
+            count = archetype.count
+
+            # Keep remaining rows in order.
+            keep = np.ones(count, dtype=bool)
+            keep[self._entity_rows[entities[archetype_indexes == index]]] = False
+            new_count = int(np.count_nonzero(keep))
+            for column in archetype.columns.values():
+                column[:new_count] = column[:count][keep]
+            archetype.entities[:new_count] = archetype.entities[:count][keep]
+            archetype.count = new_count
+
+            self._entity_rows[archetype.entities[:new_count]] = \
+                np.arange(new_count)
+
+        self._entity_archetypes[entities] = -1
+        self._num_entities -= len(entities)
+
+    def is_entity_valid(self, entity):
+        """Return whether an entity exists and has not been destroyed."""
+        return (0 <= entity < self._next_entity
+            and self._entity_archetypes[entity] >= 0)
+
+    def has_entity_component(self, entity, name):
+        """Return whether an entity has a component."""
+        return name in self._get_entity_archetype(entity).component_names
+
+    def get_entity_component(self, entity, name):
+        """
+        Return the value of a component of an entity. Array components
+        are returned as views, so can be changed in place.
+        """
+        archetype = self._get_entity_archetype(entity)
+        return archetype.columns[name][self._entity_rows[entity]]
+
+    def set_entity_component(self, entity, name, value):
+        """
+        Set the value of a component of an entity, adding the component
+        if the entity doesn't have it.
+        """
+        archetype = self._get_entity_archetype(entity)
+        if name not in archetype.component_names:
+            self._move_entity(entity, archetype.component_names | {name})
+            archetype = self._archetypes[self._entity_archetypes[entity]]
+        archetype.columns[name][self._entity_rows[entity]] = value
+
+    def remove_entity_component(self, entity, name):
+        """Remove a component from an entity. Does nothing if the entity
+        doesn't have it."""
+        archetype = self._get_entity_archetype(entity)
+        if name in archetype.component_names:
+            self._move_entity(entity, archetype.component_names - {name})
+
+    def query(self, *names):
+        """
+        Generate arrays of entities that have all of some components.
+
+        :param names: (str) Names of required components.
+
+        :return: A generator yielding a tuple of (entity ids, tuple of
+        component arrays in the same order as NAMES) for each archetype.
+        Arrays are views, so changing them changes the components.
+        """
+        key = frozenset(names)
+        archetypes = self._query_cache.get(key)
+        if archetypes is None:
+            archetypes = self._query_cache[key] = [archetype
+                for archetype in self._archetypes
+                if key <= archetype.component_names]
+
+        for archetype in archetypes:
+            count = archetype.count
+            if not count:
+                continue
+            columns = archetype.columns
+            yield archetype.entities[:count], tuple(
+                columns[name][:count] for name in names)
+
+    def add_system(self, system_class):
+        """
+        Create a system that runs on these entities each tick.
+
+        :param system_class: (EntitySystem) Class of system.
+
+        :return: (EntitySystem) The new system.
+        """
+        return self.add_component(system_class)
+
+    def _get_entity_archetype(self, entity):
+        """Return the archetype of an entity, raising KeyError if it
+        doesn't exist or has been destroyed."""
+        if not self.is_entity_valid(entity):
+            raise KeyError("Entity %s does not exist" % entity)
+        return self._archetypes[self._entity_archetypes[entity]]
+
+    def _get_archetype(self, component_names):
+        """Return the archetype for a set of names, making it if needed."""
+        archetype = self._archetypes_by_names.get(component_names)
+        if archetype is not None:
+            return archetype
+
+        for name in component_names:
+            if name not in self._component_types:
+                raise KeyError("Component '%s' has not been defined" % name)
+
+        archetype = _Archetype(len(self._archetypes), component_names,
+            self._component_types)
+        self._archetypes.append(archetype)
+        self._archetypes_by_names[component_names] = archetype
+        self._query_cache.clear()
+        return archetype
+
+    def _reserve_entities(self, num_ids):
+        """Make room to store locations of NUM_IDS entity ids."""
+        capacity = len(self._entity_archetypes)
+        if num_ids <= capacity:
+            return
+
+        capacity = max(num_ids, capacity * 2, 16)
+        for name in ("_entity_archetypes", "_entity_rows"):
+            old_array = getattr(self, name)
+            new_array = np.full(capacity, -1, dtype=np.int64)
+            new_array[:len(old_array)] = old_array
+            setattr(self, name, new_array)
+
+    def _remove_row(self, archetype, row):
+        """Remove a row by moving the last row into its place."""
+        last = archetype.count - 1
+        if row != last:
+            for column in archetype.columns.values():
+                column[row] = column[last]
+            moved_entity = archetype.entities[last]
+            archetype.entities[row] = moved_entity
+            self._entity_rows[moved_entity] = row
+        archetype.count = last
+
+    def _move_entity(self, entity, component_names):
+        """Move an entity to the archetype with different components,
+        keeping the values of components in both."""
+        old_archetype = self._archetypes[self._entity_archetypes[entity]]
+        old_row = int(self._entity_rows[entity])
+        new_archetype = self._get_archetype(frozenset(component_names))
+
+        new_archetype.reserve(1)
+        new_row = new_archetype.count
+        for name, column in new_archetype.columns.items():
+            old_column = old_archetype.columns.get(name)
+            column[new_row] = (old_column[old_row] if old_column is not None
+                else np.zeros((), dtype=column.dtype))
+        new_archetype.entities[new_row] = entity
+        new_archetype.count += 1
+
+        self._remove_row(old_archetype, old_row)
+        self._entity_archetypes[entity] = new_archetype.index
+        self._entity_rows[entity] = new_row
+
+class EntitySystem(ActorComponent):
+    """
+    Logic run each tick on every entity with a set of components. Add to
+    an EntityManager with `add_system`, and set the tick group in the
+    constructor to choose when it runs.
+    """
+
+    ## Names of components entities need for this system to run on them.
+    required_components = ()
+
+    def tick_component(self, delta_time):
+        for entities, columns in self.owning_actor.query(
+            *self.required_components):
+            self.update(delta_time, entities, *columns)
+
+    def update(self, delta_time, entities, *columns):
+        """
+        Update a table of entities.
+
+        :param delta_time: Time since last frame, in milliseconds.
+
+        :param entities: (numpy.ndarray) Ids of entities.
+
+        :param columns: (numpy.ndarray) Array of each required component,
+        in the order of required_components.
+        """
+        raise NotImplementedError("System %s has no update" % type(self).__name__)
+
+class MovementSystem(EntitySystem):
+    """Moves entities by their velocity each tick. Locations and
+    velocities should have shape (2,)."""
+
+    required_components = ("location", "velocity")
+
+    def __init__(self):
+        super().__init__()
+        self.primary_component_tick.tick_group = ETickGroup.PHYSICS
+
+    def update(self, delta_time, entities, locations, velocities):
+        # Convert delta time ms to seconds.
+        locations += velocities * (delta_time * 0.001)
@@ -1,10 +1,17 @@
 """Game engine for FactoryGame."""
 
-from tkinter import Tk
+import asyncio
+from copy import deepcopy
+from tkinter import Tk, TclError
+from uuid import UUID
 from factorygame.core.input_base import EngineInputMappings
 from factorygame.core.input_tk import TkInputHandler
-from factorygame.utils.loc import Loc
+from factorygame.utils.loc import Loc, Vec2
 from factorygame.utils.gameplay import GameplayStatics
+from factorygame.utils.tkutils import ScalingImageCache
+from factorygame.utils.delegate import MulticastDelegate
+from factorygame.core.timer_manager import TimerManager
+from factorygame.core.latent import LatentActionManager
 
 class EngineObjectBase(object):
     """
@@ -54,6 +61,14 @@ class GameEngine(EngineObject):
         ## Class to use for initial world creation. If omitted default world will be used.
         self._starting_world    = None
 
+        ## Whether to drive the game window from an asyncio event loop
+        ## instead of the tkinter main loop, so actors can use async I/O.
+        ## Only used when the engine makes its own window.
+        self._use_asyncio       = False
+
+        ## Event loop running the game, if using asyncio.
+        self._event_loop        = None
+
     def __init_game_engine__(self, master=None):
         """
         Create the game engine. Shouldn't be called directly, call
@@ -63,6 +78,11 @@ class GameEngine(EngineObject):
         # Set central reference to game engine.
         GameplayStatics.set_game_engine(self)
 
+        # Make the event loop first, so the world can schedule its tick
+        # loop as a task.
+        if self._use_asyncio and master is None:
+            self._event_loop = asyncio.new_event_loop()
+
 
         # Create/setup the game window.
 
@@ -94,6 +114,9 @@ class GameEngine(EngineObject):
         # possibly from a config file.
         self.setup_input_mappings()
 
+        # Create image cache shared by all images in the game.
+        self._image_cache = ScalingImageCache(self._window)
+
 
         # Create the starting world.
 
@@ -117,9 +140,52 @@ class GameEngine(EngineObject):
 
         # Start game window tkinter event loop.        
 
+        if self._event_loop is not None:
+            return self._run_event_loop()
+
         if master is None:
             return self._window.mainloop()
 
+    def _run_event_loop(self):
+        """Run the asyncio event loop until the game window is closed,
+        then close the game and the loop."""
+        loop = self._event_loop
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._pump_window_events())
+        finally:
+            # Close the game if the window was closed by the user.
+            if GameplayStatics.game_engine is self:
+                self.close_game()
+
+            # Cancel tasks started by actors, and let them finish.
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(
+                asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+
+            asyncio.set_event_loop(None)
+            loop.close()
+            self._event_loop = None
+
+    async def _pump_window_events(self):
+        """Process tkinter events at the frame rate until the window is
+        destroyed. Events are processed with `update` instead of
+        `mainloop`, so work from other threads, such as images loaded by
+        the image cache, must be handed over with `after` callbacks
+        rather than by calling Tk from those threads."""
+        window = self._window
+        while True:
+            try:
+                window.update()
+            except TclError:
+                # Window has been destroyed.
+                return
+
+            await asyncio.sleep(self.FRAME_TIME * 0.001)
+
     def setup_input_mappings(self):
         """
         Set up input mappings associated with a set of keys.
@@ -135,15 +201,22 @@ class GameEngine(EngineObject):
             return
 
         # Attempt to close game window.
-        if self._window is not None and self._window.winfo_exists():
-            # It does exist. Close it.
-            self._window.destroy()
+        try:
+            if self._window is not None and self._window.winfo_exists():
+                # It does exist. Close it.
+                self._window.destroy()
+        except TclError:
+            # Window was already destroyed.
+            pass
         
         # Delete world and all actors.
         world = GameplayStatics.world
         if world is not None:
             world.begin_destroy()
 
+        # Release cached images, which belong to the closed window.
+        self._image_cache.clear()
+
         # Begin destroying self.
         self.begin_destroy()
 
@@ -154,6 +227,123 @@ class GameEngine(EngineObject):
     def input_mappings(self):
         return self._input_mappings
 
+    @property
+    def event_loop(self):
+        """
+        Asyncio event loop running the game, or None if using the
+        tkinter main loop. Actors can start async I/O with
+        `event_loop.create_task`.
+        """
+        return self._event_loop
+
+    @property
+    def image_cache(self):
+        return self._image_cache
+
+class _PrototypeCloner(object):
+    """
+    Makes copies of an object without calling its constructor.
+
+    How to copy each attribute is decided once from the prototype.
+    Immutable values are shared, Locs, empty containers and tuples of
+    Locs are remade directly, and anything else is deep copied.
+    References back to the prototype become references to the copy.
+    """
+
+    ## Types of values that can be shared between copies.
+    _IMMUTABLE_TYPES = frozenset((int, float, complex, bool, str, bytes,
+        type(None), Vec2, frozenset, type, UUID))
+
+    def __init__(self, prototype, shared_names=()):
+        """
+        :param prototype: Object to copy.
+
+        :param shared_names: (dict) Values of attributes to share
+        between copies without copying, by name. Attributes holding
+        these values, or tuples of their items, are also shared.
+        """
+        ## Object to copy.
+        self._prototype = prototype
+
+        ## Ids of objects to share between copies.
+        self._shared_ids = set()
+        for value in shared_names.values():
+            self._shared_ids.add(id(value))
+            if type(value) in (tuple, list):
+                self._shared_ids.update(map(id, value))
+
+        ## Tuples of (name, copy function) for attributes copied
+        ## directly.
+        self._copiers = []
+
+        ## Names of attributes to deep copy.
+        self._deep_names = []
+
+        for name, value in vars(prototype).items():
+            if name in shared_names or self._is_immutable(value):
+                continue
+
+            copier = self._get_copier(value)
+            if copier is None:
+                self._deep_names.append(name)
+            else:
+                self._copiers.append((name, copier))
+
+    def _is_immutable(self, value):
+        """Return whether VALUE can be shared between copies."""
+        if id(value) in self._shared_ids:
+            return True
+        value_type = type(value)
+        if value_type is tuple:
+            return all(self._is_immutable(item) for item in value)
+        return value_type in self._IMMUTABLE_TYPES
+
+    @staticmethod
+    def _get_copier(value):
+        """Return a function to quickly copy values like VALUE, or None
+        if it needs a deep copy."""
+        value_type = type(value)
+        if isinstance(value, Loc):
+            return _copy_loc
+        if value_type in (list, dict, set) and not value:
+            # Copying an empty container makes a new one.
+            return value_type
+        if value_type is FTickFunction:
+            return _copy_tick_function
+        if value_type is tuple and all(isinstance(item, Loc) for item in value):
+            return lambda value: tuple([_copy_loc(item) for item in value])
+        return None
+
+    def clone(self):
+        """Return a new copy of the prototype."""
+        prototype = self._prototype
+        clone = object.__new__(type(prototype))
+        attributes = dict(vars(prototype))
+
+        for name, copier in self._copiers:
+            attributes[name] = copier(attributes[name])
+        if self._deep_names:
+            memo = {id(prototype): clone}
+            for name in self._deep_names:
+                attributes[name] = deepcopy(attributes[name], memo)
+
+        clone.__dict__ = attributes
+        return clone
+
+def _copy_tick_function(tick_function):
+    """Return a copy of a tick function, faster than copy.copy."""
+    new_tick_function = FTickFunction.__new__(FTickFunction)
+    for name in FTickFunction.__slots__:
+        setattr(new_tick_function, name, getattr(tick_function, name))
+    return new_tick_function
+
+def _copy_loc(value):
+    """Return a copy of a Loc, or subclass of Loc, holding numbers."""
+    # Constructors of subclasses may not accept another instance.
+    new_value = list.__new__(type(value))
+    list.extend(new_value, value)
+    return new_value
+
 class World(EngineObject):
     """
     Manages all content that makes up a level as well as keeping
@@ -171,15 +361,57 @@ class World(EngineObject):
             group: set() for group in range(ETickGroup.MAX)
             }
 
+        ## Components to receive tick events, grouped by tick priority
+        ## then by component class. Each class maps to a dictionary used
+        ## as an ordered set of components.
+        self._ticking_components = {
+            group: {} for group in range(ETickGroup.MAX)
+            }
+
         ## All spawned actors in the world.
         self._actors            = []
 
+        ## Spawned actors of each class, including subclasses. Each class
+        ## maps to a dictionary used as an ordered set of actors.
+        self._actors_by_class   = {}
+
+        ## Spawned actors with each tag, as ordered sets like above.
+        self._actors_by_tag     = {}
+
         ## List of actors to destroy next tick.
         self._to_destroy        = []
 
         ## Tkinter object reference for tick loop timer.
         self._tk_obj            = None
 
+        ## Id of the next tick loop timer, to cancel it when destroyed.
+        self._tick_after_id     = None
+
+        ## Asyncio task running the tick loop, if the engine uses asyncio.
+        self._tick_task         = None
+
+        ## Event broadcast with the actor when an actor finishes spawning.
+        self.on_actor_spawned   = MulticastDelegate()
+
+        ## Event broadcast with the actor when an actor is destroyed.
+        self.on_actor_destroyed = MulticastDelegate()
+
+        ## Timers fired at the start of each frame.
+        self._timer_manager     = TimerManager()
+
+        ## Latent actions resumed at the start of each frame.
+        self._latent_action_manager = LatentActionManager(self._timer_manager)
+
+    @property
+    def timer_manager(self):
+        """Timer manager used for delayed and repeating callbacks."""
+        return self._timer_manager
+
+    @property
+    def latent_action_manager(self):
+        """Manager that resumes latent actions when they are due."""
+        return self._latent_action_manager
+
     def __init_world__(self, tk_obj):
         """Initialise world with any active tkinter object TK_OBJ."""
 
@@ -232,6 +464,80 @@ class World(EngineObject):
         # to pass in to finish_deferred_spawn_actor
         return actor_object
 
+    def spawn_actors(self, actor_class, locations, **props):
+        """
+        Spawn many actors of the same class at once, much faster than
+        calling spawn_actor for each.
+
+        One prototype actor is constructed and given PROPS, then copied
+        for each location instead of running the constructor again.
+        Values made by the constructor are copied, but PROPS are shared.
+        Classes with values that must differ between actors, such as
+        ids, should reset them in `__init_clone__`. Ticks are registered
+        together, then begin_play is called on each actor once all are
+        in the world.
+
+        :param actor_class: Class of actor to spawn.
+
+        :param locations: (iterable) Location of each actor, eg a list of
+        Loc or an array of shape (N, 2).
+
+        :param props: Attributes to set on each actor before spawning.
+        The same objects are given to every actor.
+
+        :return: (list) Spawned actors, in the order of LOCATIONS.
+        """
+        try:
+            # Converting arrays to lists in one call is faster.
+            locations = locations.tolist()
+        except AttributeError:
+            pass
+
+        prototype = actor_class()
+        for name, value in props.items():
+            setattr(prototype, name, value)
+        cloner = _PrototypeCloner(prototype, props)
+
+        actors = []
+        ticking_actors = {}
+        for location in locations:
+            actor = cloner.clone()
+            actor.__init_clone__()
+            actor.__spawn__(self, Loc(location), register_tick=False)
+            actors.append(actor)
+
+            tick_func = actor.primary_actor_tick
+            if tick_func.can_ever_tick:
+                tick_func.target = actor
+                if tick_func.start_with_tick_enabled:
+                    tick_func._tick_enabled = True
+                    ticking_actors.setdefault(
+                        tick_func.tick_group, []).append(actor)
+
+        # Register ticks in bulk.
+        for group, group_actors in ticking_actors.items():
+            try:
+                self._ticking_actors[group].update(group_actors)
+            except KeyError:
+                pass
+
+        self._actors.extend(actors)
+        self._add_to_indexes(actors)
+
+        # Call begin play once everything is in the world.
+        for actor in actors:
+            for component in actor.components:
+                component.begin_play()
+            actor._has_begun_play = True
+            actor.begin_play()
+
+        on_actor_spawned = self.on_actor_spawned
+        if on_actor_spawned:
+            for actor in actors:
+                on_actor_spawned.broadcast(actor)
+
+        return actors
+
     def finish_deferred_spawn_actor(self, actor_object):
         """
         Finish spawning an actor in this world, allowing gameplay
@@ -249,10 +555,16 @@ class World(EngineObject):
         # update world references
         actor_object._world = self
         self._actors.append(actor_object)
+        self._add_to_indexes((actor_object,))
 
-        # call begin play
+        # call begin play, letting components prepare first
+        for component in actor_object.components:
+            component.begin_play()
+        actor_object._has_begun_play = True
         actor_object.begin_play()
 
+        self.on_actor_spawned.broadcast(actor_object)
+
         # schedule ticks if necessary
         # if actor_object.primary_actor_tick.start_with_tick_enabled:
         #     self.set_actor_tick_enabled(actor_object, True)
@@ -281,16 +593,79 @@ class World(EngineObject):
         for actor in self._to_destroy:
             actor.begin_destroy()
             self._actors.remove(actor)
+            self._remove_from_indexes(actor)
+            self.on_actor_destroyed.broadcast(actor)
 
         # Clear pending destruction. It's done already!
         self._to_destroy = []
 
+    def get_all_actors_of_class(self, actor_class):
+        """
+        Return all spawned actors that are instances of a class.
+
+        :param actor_class: Class of actors to find, including
+        subclasses. Can also be a mixin class, such as Drawable.
+
+        :return: (KeysView) Live view of the actors, in spawn order,
+        which updates as actors are spawned and destroyed. Copy it, eg
+        with tuple(), to spawn or destroy actors while looping over it.
+        """
+        return self._actors_by_class.setdefault(actor_class, {}).keys()
+
+    def get_actors_with_tag(self, tag):
+        """
+        Return all spawned actors with a tag, added by `Actor.add_tag`.
+
+        :return: (KeysView) Live view of the actors, like
+        get_all_actors_of_class.
+        """
+        return self._actors_by_tag.setdefault(tag, {}).keys()
+
+    def _add_to_indexes(self, actors):
+        """Add newly spawned actors to the class and tag indexes."""
+        actors_by_class = self._actors_by_class
+        classes_cache = {}
+        for actor in actors:
+            actor_type = type(actor)
+            classes = classes_cache.get(actor_type)
+            if classes is None:
+                classes = classes_cache[actor_type] = [
+                    actors_by_class.setdefault(cls, {})
+                    for cls in actor_type.__mro__ if cls is not object]
+
+            for class_actors in classes:
+                class_actors[actor] = None
+
+            for tag in actor._tags or ():
+                self._actors_by_tag.setdefault(tag, {})[actor] = None
+
+    def _remove_from_indexes(self, actor):
+        """Remove a destroyed actor from the class and tag indexes."""
+        actors_by_class = self._actors_by_class
+        for cls in type(actor).__mro__:
+            class_actors = actors_by_class.get(cls)
+            if class_actors is not None:
+                class_actors.pop(actor, None)
+
+        for tag in actor._tags or ():
+            self._actors_by_tag[tag].pop(actor, None)
+
+    def _is_actor_indexed(self, actor):
+        """Return whether an actor has been added to the indexes."""
+        return actor in self._actors_by_class.get(Actor, ())
+
     def __try_start_tick_loop(self):
         """
         Attempt to start a tick loop.
 
         :return bool: Whether the tick loop was started successfully.
         """
+        engine = GameplayStatics.game_engine
+        event_loop = engine.event_loop if engine is not None else None
+        if event_loop is not None:
+            self._tick_task = event_loop.create_task(self._tick_loop_async())
+            return True
+
         if not self._tk_obj:
             return False
 
@@ -298,21 +673,58 @@ class World(EngineObject):
         return True        
 
     def _tick_loop(self):
+        dt = self._tick_frame()
+
+        # schedule next tick
+        self._tick_after_id = self._tk_obj.after(dt, self._tick_loop)
+
+    async def _tick_loop_async(self):
+        """Tick the world at the frame rate, as an asyncio task."""
+        loop = asyncio.get_running_loop()
+        next_time = loop.time()
+        while True:
+            dt = self._tick_frame()
+
+            # Keep to the frame rate, without catching up on late frames.
+            now = loop.time()
+            next_time = max(next_time + dt * 0.001, now)
+            await asyncio.sleep(next_time - now)
+
+    def _tick_frame(self):
+        """
+        Update everything in the world for one frame.
+
+        :return: (int) Delta time used, in milliseconds.
+        """
         # Perform actor cleanup.
         self._destroy_pending()
 
         # get delta time
         dt = GameplayStatics.game_engine.FRAME_TIME # in miliseconds, as integer
 
-        # call tick event on other actors
+        # Resume latent actions and fire due timers before anything
+        # ticks. Actions resumed by timers wait for next_tick until the
+        # next frame.
+        self._latent_action_manager.tick()
+        self._timer_manager.tick(dt)
+
+        self._tick_groups(dt)
+        return dt
+
+    def _tick_groups(self, dt):
+        """Call tick events on actors and components, in tick group
+        order."""
         for group in range(ETickGroup.MAX):
             # Call the groups in order.
             actor_set = self._ticking_actors[group]
             for actor in actor_set:
                 actor.tick(dt)
 
-        # schedule next tick
-        self._tk_obj.after(dt, self._tick_loop)
+            # Tick all components of each class together.
+            component_classes = self._ticking_components[group]
+            for component_class, components in tuple(component_classes.items()):
+                if components:
+                    component_class.tick_batch(tuple(components), dt)
 
     def set_actor_tick_enabled(self, tick_function, new_tick_enabled):
         """
@@ -328,6 +740,10 @@ class World(EngineObject):
 
         actor = tick_function.target
 
+        if isinstance(actor, ActorComponent):
+            self._set_component_tick_enabled(tick_function, new_tick_enabled)
+            return
+
         # Ensure we are adding a valid actor with a valid tick function.
         try:
             func = actor.tick
@@ -360,6 +776,28 @@ class World(EngineObject):
                 except KeyError:
                     pass
 
+    def _set_component_tick_enabled(self, tick_function, new_tick_enabled):
+        """
+        Add or remove a component from the batch of components of its
+        class in its tick group.
+
+        :param tick_function: (FTickFunction) Tick function of component.
+        """
+        try:
+            group = self._ticking_components[tick_function.tick_group]
+        except KeyError:
+            return
+
+        component = tick_function.target
+        component_class = type(component)
+        if new_tick_enabled:
+            group.setdefault(component_class, {})[component] = None
+            return
+
+        components = group.get(component_class)
+        if components is not None:
+            components.pop(component, None)
+
     def begin_destroy(self):
         """Destroy all actors."""
         for actor in self._actors:
@@ -367,6 +805,24 @@ class World(EngineObject):
             self._actors.pop(0)
         
         self._ticking_actors = {group: set() for group in range(ETickGroup.MAX)}
+        self._ticking_components = {group: {} for group in range(ETickGroup.MAX)}
+        # Empty the indexes in place, so live views stay valid.
+        for index in (self._actors_by_class, self._actors_by_tag):
+            for actors in index.values():
+                actors.clear()
+        self._latent_action_manager.stop_all()
+        self._timer_manager.clear_all_timers()
+
+        # Stop the tick loop.
+        if self._tick_task is not None:
+            self._tick_task.cancel()
+            self._tick_task = None
+        if self._tick_after_id is not None:
+            try:
+                self._tk_obj.after_cancel(self._tick_after_id)
+            except TclError:
+                pass
+            self._tick_after_id = None
             # try:
             #     self._ticking_actors.remove(actor)
             # except KeyError:
@@ -390,6 +846,9 @@ class FTickFunction:
     Contains data about how a particular object should tick.
     """
 
+    __slots__ = ("target", "can_ever_tick", "start_with_tick_enabled",
+        "tick_group", "priority", "_tick_enabled", "tick_even_when_paused")
+
     @property
     def tick_enabled(self):
         return self._tick_enabled
@@ -472,12 +931,171 @@ class Actor(EngineObject):
         lambda self, value: self.__set_location(value))
 
     def __get_location(self):
+        if self._location_dirty:
+            # Parent has moved since location was last found.
+            self._location = self._attach_parent.location \
+                + self._relative_location
+            self._location_dirty = False
         return self._location
     def __set_location(self, value):
-        self._location = Loc(value)
+        parent = self._attach_parent
+        if parent is None:
+            self._location = Loc(value)
+        else:
+            self._relative_location = Loc(value) - parent.location
+            self._location_dirty = True
+
+        self._on_location_set()
+
+    @property
+    def relative_location(self):
+        """Location relative to the attach parent, or the location if not
+        attached."""
+        if self._attach_parent is None:
+            return self.location
+        return self._relative_location
+
+    @relative_location.setter
+    def relative_location(self, value):
+        if self._attach_parent is None:
+            self.location = value
+            return
+
+        self._relative_location = Loc(value)
+        self._location_dirty = True
+        self._on_location_set()
 
-    def __spawn__(self, world, location):
-        """Called when actor is spawned by world. Shouldn't be called directly."""
+    def _on_location_set(self):
+        """Update attached actors and tell listeners after the location
+        or relative location is set."""
+        if self._attach_children:
+            self._mark_children_dirty()
+
+        delegate = self._on_location_changed
+        if delegate is not None:
+            delegate.broadcast(self)
+
+    @property
+    def tags(self):
+        """Frozen set of this actor's tags."""
+        return frozenset(self._tags or ())
+
+    def add_tag(self, tag):
+        """
+        Add a tag to find this actor by. Can be called in the
+        constructor.
+
+        :param tag: Hashable tag, usually a string.
+        """
+        if self._tags is None:
+            self._tags = set()
+        self._tags.add(tag)
+
+        world = getattr(self, "_world", None)
+        if world is not None and world._is_actor_indexed(self):
+            world._actors_by_tag.setdefault(tag, {})[self] = None
+
+    def remove_tag(self, tag):
+        """Remove a tag. Does nothing if this actor doesn't have it."""
+        if not self._tags or tag not in self._tags:
+            return
+        self._tags.remove(tag)
+
+        world = getattr(self, "_world", None)
+        if world is not None:
+            world._actors_by_tag.get(tag, {}).pop(self, None)
+
+    def has_tag(self, tag):
+        """Return whether this actor has a tag."""
+        return bool(self._tags) and tag in self._tags
+
+    @property
+    def attach_parent(self):
+        """Actor this actor is attached to, or None."""
+        return self._attach_parent
+
+    @property
+    def attached_children(self):
+        """Tuple of actors directly attached to this actor."""
+        return tuple(self._attach_children or ())
+
+    def attach_to_actor(self, parent, keep_world_location=True):
+        """
+        Attach to another actor so this actor moves with it.
+
+        :param parent: (Actor) Actor to attach to.
+
+        :param keep_world_location: (bool) Whether to stay at the current
+        location. If False, the current location is used as the offset
+        from the parent instead.
+        """
+        # Don't allow loops in the hierarchy.
+        ancestor = parent
+        while ancestor is not None:
+            if ancestor is self:
+                raise ValueError("Cannot attach %s to itself or its "
+                    "children" % self)
+            ancestor = ancestor._attach_parent
+
+        location = self.location
+        self.detach_from_actor()
+
+        if parent._attach_children is None:
+            parent._attach_children = {}
+        parent._attach_children[self] = None
+        self._attach_parent = parent
+        self._relative_location = (location - parent.location
+            if keep_world_location else Loc(location))
+        self._location_dirty = True
+        if self._attach_children:
+            self._mark_children_dirty()
+
+    def detach_from_actor(self):
+        """Stop moving with the attach parent, keeping the current
+        location. Does nothing if not attached."""
+        parent = self._attach_parent
+        if parent is None:
+            return
+
+        # Keep the last location.
+        self.location
+        del parent._attach_children[self]
+        self._attach_parent = None
+        self._relative_location = None
+
+    def _mark_children_dirty(self):
+        """Mark locations of all actors attached below this one to be
+        found again when next used."""
+        stack = [self]
+        while stack:
+            for child in stack.pop()._attach_children or ():
+                # Children of dirty actors are already dirty.
+                if not child._location_dirty:
+                    child._location_dirty = True
+                    if child._attach_children:
+                        stack.append(child)
+
+    @property
+    def on_location_changed(self):
+        """
+        Event broadcast with this actor when its location is set. Not
+        broadcast when the location is changed in place, eg by
+        `actor.location.x = 1`, or for attached actors when an actor
+        they are attached to moves. Listen to the top actor of an
+        attachment hierarchy to follow all of it.
+        """
+        # Made when first used, as most actors don't need it.
+        if self._on_location_changed is None:
+            self._on_location_changed = MulticastDelegate()
+        return self._on_location_changed
+
+    def __spawn__(self, world, location, register_tick=True):
+        """
+        Called when actor is spawned by world. Shouldn't be called directly.
+
+        :param register_tick: (bool) Whether to register the tick
+        function. False when the world registers many actors at once.
+        """
 
         ## World actor is in.
         self._world = world
@@ -491,14 +1109,127 @@ class Actor(EngineObject):
         except AttributeError:
             pass
         else:
-            if tick_func.can_ever_tick:
+            if tick_func.can_ever_tick and register_tick:
                 tick_func.target = self
                 tick_func.tick_enabled = tick_func.start_with_tick_enabled
 
+        # Register tick functions of components added in the constructor.
+        for component in self._components:
+            component.register_component()
+
+    def __init_clone__(self):
+        """
+        Called on each actor copied from a prototype by
+        `World.spawn_actors`, before it is spawned. Override to reset
+        values that must be unique to each actor.
+        """
+        pass
+
     def __init__(self):
         ## Tick options for this actor. Can be further modified by children.
         self.primary_actor_tick = FTickFunction()
 
+        ## Components owned by this actor.
+        self._components = []
+
+        ## Whether begin play has been called, so new components can
+        ## start straight away.
+        self._has_begun_play = False
+
+        ## Running latent actions started by this actor. Dictionary used
+        ## as an ordered set.
+        self._latent_actions = {}
+
+        ## Delegate for on_location_changed, or None if not used yet.
+        self._on_location_changed = None
+
+        ## Tags to find this actor by with `World.get_actors_with_tag`,
+        ## or None if there are none.
+        self._tags = None
+
+        ## Actor this actor is attached to, or None.
+        self._attach_parent = None
+
+        ## Actors attached to this actor, as a dictionary used as an
+        ## ordered set, or None if there have never been any.
+        self._attach_children = None
+
+        ## Offset from the attach parent's location, if attached.
+        self._relative_location = None
+
+        ## Whether the cached location is out of date because the attach
+        ## parent moved.
+        self._location_dirty = False
+
+    @property
+    def components(self):
+        """Tuple of components owned by this actor."""
+        return tuple(self._components)
+
+    def add_component(self, component_class):
+        """
+        Create a component owned by this actor. Can be called in the
+        constructor, in which case the component starts when the actor is
+        spawned.
+
+        :param component_class: (ActorComponent) Class of component.
+
+        :return: (ActorComponent) The new component.
+        """
+        component = component_class()
+        component.owning_actor = self
+        self._components.append(component)
+
+        if getattr(self, "_world", None) is not None:
+            component.register_component()
+            if self._has_begun_play:
+                component.begin_play()
+
+        return component
+
+    def get_component(self, component_class):
+        """
+        Return the first component that is an instance of a class, or
+        None if there isn't one.
+        """
+        for component in self._components:
+            if isinstance(component, component_class):
+                return component
+        return None
+
+    def destroy_component(self, component):
+        """Stop and remove a component owned by this actor."""
+        try:
+            self._components.remove(component)
+        except ValueError:
+            return
+        component.begin_destroy()
+
+    def start_latent_action(self, coroutine):
+        """
+        Run a latent action that is stopped when this actor is destroyed.
+        The actor must be spawned.
+
+        :param coroutine: Coroutine of an `async def` function awaiting
+        `delay`, `next_tick` or `until`, or a generator yielding them.
+
+        :return: (LatentAction) Handle to stop the action.
+        """
+        action = self.world.latent_action_manager.start(coroutine, self)
+        if action.is_running:
+            self._latent_actions[action] = None
+        return action
+
+    def stop_latent_action(self, action):
+        """Stop a latent action started by this actor."""
+        self.world.latent_action_manager.stop(action)
+
+    def stop_all_latent_actions(self):
+        """Stop all latent actions started by this actor."""
+        manager = self.world.latent_action_manager
+        for action in tuple(self._latent_actions):
+            manager.stop(action)
+
     def tick(self, delta_time):
         """
         Called every frame if the actor is set to tick.
@@ -507,8 +1238,106 @@ class Actor(EngineObject):
         raise NotImplementedError("Actor %s has tick enabled but default tick "
               "function is being called" % self)
 
+    def on_significance_changed(self, level):
+        """
+        Called when a significance manager moves this actor to a new
+        significance level, where 0 is the most significant. Override to
+        eg. use cheaper visuals when far from the view.
+        """
+        pass
+
+    def catch_up(self, delta_time):
+        """
+        Called when a significance manager resumes ticking this actor
+        after suspending it, before it next ticks. Override to cheaply
+        simulate the missed time, eg. by jumping to where it would be.
+
+        :param delta_time: Time the actor was suspended, in milliseconds.
+        """
+        pass
+
+    def get_streaming_state(self):
+        """
+        Return a dictionary of attributes to save when a world partition
+        unloads this actor. They are set on the new actor before it is
+        spawned when loaded again. Values must be picklable.
+        """
+        return {}
+
     def begin_destroy(self):
         super().begin_destroy()
-        
+
         # Stop ticking
         self.world.set_actor_tick_enabled(self.primary_actor_tick, False)
+        self.stop_all_latent_actions()
+
+        # Leave attached actors where they are.
+        for child in self.attached_children:
+            child.detach_from_actor()
+        self.detach_from_actor()
+
+        for component in self._components:
+            component.begin_destroy()
+        self._components = []
+
+class ActorComponent(EngineObject):
+    """
+    Reusable behaviour that can be added to any actor with
+    `Actor.add_component`. Components are ticked by the world in batches
+    of the same class, so classes can update all their components at
+    once by overriding `tick_batch`.
+    """
+
+    def __init__(self):
+        ## Actor this component belongs to. Set when added to an actor.
+        self.owning_actor = None
+
+        ## Tick options for this component. Can be further modified by
+        ## children. Tick events are only received if tick_component or
+        ## tick_batch is overridden.
+        self.primary_component_tick = FTickFunction()
+
+    def register_component(self):
+        """
+        Start receiving tick events if the tick function allows it.
+        Called automatically when the owning actor is spawned.
+        """
+        tick_func = self.primary_component_tick
+        if tick_func.can_ever_tick and self._can_tick():
+            tick_func.target = self
+            tick_func.tick_enabled = tick_func.start_with_tick_enabled
+
+    def _can_tick(self):
+        """Return whether this class overrides a tick method."""
+        cls = type(self)
+        return (cls.tick_component is not ActorComponent.tick_component
+            or cls.tick_batch.__func__ is not ActorComponent.tick_batch.__func__)
+
+    def tick_component(self, delta_time):
+        """
+        Called every frame if the component is set to tick, by the
+        default `tick_batch`.
+
+        :param delta_time: Time since last frame, in milliseconds.
+        """
+
+    @classmethod
+    def tick_batch(cls, components, delta_time):
+        """
+        Called every frame with every ticking component of this class in
+        a tick group. Override for a faster update of all components at
+        once.
+
+        :param components: (tuple) Components to tick.
+
+        :param delta_time: Time since last frame, in milliseconds.
+        """
+        for component in components:
+            component.tick_component(delta_time)
+
+    def begin_destroy(self):
+        super().begin_destroy()
+
+        # Stop ticking.
+        if self.primary_component_tick.target is not None:
+            self.primary_component_tick.tick_enabled = False
@@ -19,6 +19,8 @@ class FKey:
     Holder for an input key. Should not be used directly, use EKeys instead.
     """
 
+    __slots__ = ("_key_name",)
+
     def __init__(self, in_name):
         self._key_name = in_name
 
@@ -0,0 +1,219 @@
+"""
+Latent actions: behaviour that runs over many frames, written as one
+function.
+
+A latent action is an `async def` function (or a generator) that awaits
+(or yields) `delay`, `next_tick` or `until` to wait. For example:
+
+    async def patrol(self):
+        while True:
+            self.location = Loc(0, 0)
+            await delay(2.0)
+            self.location = Loc(100, 0)
+            await until(lambda: self.is_ready)
+
+    actor.start_latent_action(actor.patrol())
+
+Waiting actions are only resumed when they are due, so they cost nothing
+while they wait. Delays use the world's timer manager, and so follow its
+time dilation.
+"""
+
+class _LatentRequest(object):
+    """Something a latent action waits for. Yielded to the manager."""
+
+    __slots__ = ()
+
+    def __await__(self):
+        yield self
+
+class _Delay(_LatentRequest):
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+class _NextTick(_LatentRequest):
+    __slots__ = ()
+
+class _Until(_LatentRequest):
+    __slots__ = ("predicate",)
+
+    def __init__(self, predicate):
+        self.predicate = predicate
+
+def delay(seconds):
+    """Wait in a latent action for some time, in seconds."""
+    return _Delay(seconds)
+
+def next_tick():
+    """Wait in a latent action until the next frame."""
+    return _NextTick()
+
+def until(predicate):
+    """
+    Wait in a latent action until a function returns True. The function
+    is called once when awaited, then once per frame.
+    """
+    return _Until(predicate)
+
+class LatentAction(object):
+    """Handle to a running latent action."""
+
+    __slots__ = ("coroutine", "owner", "_timer", "_predicate", "_is_running")
+
+    def __init__(self, coroutine, owner):
+        ## Coroutine or generator being run.
+        self.coroutine = coroutine
+
+        ## Actor that started the action, or None.
+        self.owner = owner
+
+        ## Timer handle while waiting for a delay.
+        self._timer = None
+
+        ## Function to check each frame while waiting for it.
+        self._predicate = None
+
+        ## Whether the action hasn't finished or been stopped.
+        self._is_running = True
+
+    @property
+    def is_running(self):
+        """Whether the action hasn't finished or been stopped."""
+        return self._is_running
+
+class LatentActionManager(object):
+    """
+    Runs latent actions, resuming each when what it waits for is done.
+    """
+
+    def __init__(self, timer_manager):
+        """
+        :param timer_manager: (TimerManager) Timers to use for delays.
+        """
+        ## Timers to use for delays.
+        self._timer_manager = timer_manager
+
+        ## Actions to resume next frame, waiting for next_tick.
+        self._next_tick = []
+
+        ## Actions waiting for a predicate to be true.
+        self._waiting_until = []
+
+        ## All running actions. Dictionary used as an ordered set.
+        self._running = {}
+
+    def __len__(self):
+        return len(self._running)
+
+    def start(self, coroutine, owner=None):
+        """
+        Run a coroutine or generator until it first waits.
+
+        :param coroutine: Coroutine object of an `async def` function, or
+        a generator.
+
+        :param owner: (Actor) Actor the action belongs to, if any.
+
+        :return: (LatentAction) Handle to stop the action.
+        """
+        action = LatentAction(coroutine, owner)
+        self._running[action] = None
+        self._resume(action)
+        return action
+
+    def stop(self, action):
+        """Stop a running action. Does nothing if it isn't running."""
+        if not action._is_running:
+            return
+
+        self._finish(action)
+        # Let the action run any finally blocks. If the action stopped
+        # itself it is still running, so is closed when it next waits.
+        try:
+            action.coroutine.close()
+        except ValueError:
+            pass
+
+    def stop_all(self):
+        """Stop all running actions."""
+        for action in tuple(self._running):
+            self.stop(action)
+        self._next_tick = []
+        self._waiting_until = []
+
+    def tick(self):
+        """Resume actions waiting for the next frame or a predicate."""
+        if self._next_tick:
+            actions, self._next_tick = self._next_tick, []
+            for action in actions:
+                if action._is_running:
+                    self._resume(action)
+
+        if self._waiting_until:
+            actions, self._waiting_until = self._waiting_until, []
+            for action in actions:
+                if not action._is_running:
+                    continue
+                if action._predicate():
+                    action._predicate = None
+                    self._resume(action)
+                elif action._is_running:
+                    self._waiting_until.append(action)
+
+    def _resume(self, action):
+        """Continue an action until it waits or finishes."""
+        coroutine = action.coroutine
+        while True:
+            try:
+                request = coroutine.send(None)
+            except StopIteration:
+                self._finish(action)
+                return
+            except BaseException:
+                self._finish(action)
+                raise
+
+            if not action._is_running:
+                # Stopped while running.
+                coroutine.close()
+                return
+
+            if isinstance(request, _Delay):
+                action._timer = self._timer_manager.set_timer(
+                    lambda: self._on_delay_finished(action), request.seconds)
+                return
+            if isinstance(request, _NextTick):
+                self._next_tick.append(action)
+                return
+            if isinstance(request, _Until):
+                if request.predicate():
+                    continue
+                action._predicate = request.predicate
+                self._waiting_until.append(action)
+                return
+
+            self.stop(action)
+            raise TypeError("Latent action waited for %r. Use delay, "
+                "next_tick or until." % (request,))
+
+    def _on_delay_finished(self, action):
+        action._timer = None
+        self._resume(action)
+
+    def _finish(self, action):
+        """Mark an action as no longer running and forget what it is
+        waiting for."""
+        if not action._is_running:
+            return
+        action._is_running = False
+        action._predicate = None
+        if action._timer is not None:
+            self._timer_manager.clear_timer(action._timer)
+            action._timer = None
+        del self._running[action]
+
+        owner = action.owner
+        if owner is not None:
+            owner._latent_actions.pop(action, None)
@@ -0,0 +1,300 @@
+"""
+Particle effects drawn by a single actor.
+
+Particles are stored in NumPy arrays and updated together each tick,
+then drawn into one image so an emitter only has one canvas item no
+matter how many particles it has.
+
+Requires NumPy.
+"""
+
+import struct, zlib
+from math import pi
+from tkinter import PhotoImage
+import numpy as np
+from factorygame.utils.loc import Loc
+from factorygame.core.blueprint import DrawnActor, FColor
+
+class ParticleEmitter(DrawnActor):
+    """
+    Actor that spawns, moves and draws many short lived particles.
+
+    Particles are simulated in world coordinates, so they don't follow
+    the emitter after they are spawned.
+    """
+
+    def __init__(self):
+        """Set default values."""
+        super().__init__()
+
+        ## Most particles alive at once.
+        self.max_particles = 50000
+
+        ## Number of particles to spawn per second.
+        self.spawn_rate = 100.0
+
+        ## Shortest and longest time each particle lives, in seconds.
+        self.lifetime_range = (1.0, 2.0)
+
+        ## Slowest and fastest initial speed, in world units per second.
+        self.speed_range = (100.0, 200.0)
+
+        ## Direction particles are spawned in, in radians from the y axis
+        ## like GeomHelper, and the total angle they spread over.
+        self.direction = 0.0
+        self.spread = 2 * pi
+
+        ## Constant acceleration of particles, in world units per second
+        ## squared.
+        self.acceleration = Loc(0.0, 0.0)
+
+        ## Color of particles when spawned and when they die. Particles
+        ## fade between them over their life.
+        self.start_color = FColor.white()
+        self.end_color = FColor.black()
+
+        ## Width of each particle on screen, in pixels.
+        self.particle_size = 2
+
+        ## Number of particles currently alive, at the start of the arrays.
+        self._num_alive = 0
+
+        ## Part of a particle not yet spawned from the spawn rate.
+        self._spawn_remainder = 0.0
+
+        ## Image particles were last drawn into. Kept referenced so tk
+        ## doesn't delete it while shown.
+        self._image = None
+
+        ## Random number generator for spawned particles.
+        self._rng = np.random.default_rng()
+
+        # Arrays are resized to max_particles when particles are first
+        # spawned.
+
+        ## Location of each particle, shape (N, 2).
+        self._positions = np.zeros((0, 2))
+        ## Velocity of each particle, shape (N, 2).
+        self._velocities = np.zeros((0, 2))
+        ## Time since each particle spawned, in seconds.
+        self._ages = np.zeros(0)
+        ## Time each particle lives for, in seconds.
+        self._lifetimes = np.ones(0)
+        ## RGB color of each particle, shape (N, 3).
+        self._colors = np.zeros((0, 3), dtype=np.uint8)
+
+    def _allocate(self, capacity):
+        """Resize particle arrays to hold CAPACITY particles, keeping as
+        many living particles as fit."""
+        count = self._num_alive = min(self._num_alive, capacity)
+
+        for name in ("_positions", "_velocities", "_ages", "_lifetimes",
+            "_colors"):
+            old_array = getattr(self, name)
+            new_array = np.zeros((capacity,) + old_array.shape[1:],
+                dtype=old_array.dtype)
+            new_array[:count] = old_array[:count]
+            setattr(self, name, new_array)
+
+    @property
+    def num_particles(self):
+        """Number of particles currently alive."""
+        return self._num_alive
+
+    def emit(self, count):
+        """
+        Spawn particles at the emitter's location. Particles past
+        max_particles are not spawned.
+
+        :param count: (int) Number of particles to spawn.
+
+        :return: (int) Number of particles spawned.
+        """
+        if len(self._ages) != self.max_particles:
+            self._allocate(self.max_particles)
+
+        start = self._num_alive
+        count = max(0, min(int(count), self.max_particles - start))
+        if not count:
+            return 0
+        end = start + count
+        rng = self._rng
+
+        angles = self.direction + (rng.random(count) - 0.5) * self.spread
+        speeds = rng.uniform(*self.speed_range, size=count)
+
+        location = self.location
+        self._positions[start:end] = (location[0], location[1])
+        # Angles are measured from the y axis, clockwise.
+        self._velocities[start:end, 0] = np.sin(angles) * speeds
+        self._velocities[start:end, 1] = np.cos(angles) * speeds
+        self._ages[start:end] = 0.0
+        self._lifetimes[start:end] = rng.uniform(*self.lifetime_range,
+            size=count)
+        self._colors[start:end] = tuple(self.start_color)
+
+        self._num_alive = end
+        return count
+
+    def clear_particles(self):
+        """Remove all particles."""
+        self._num_alive = 0
+
+    def tick(self, dt):
+        # Convert delta time ms to seconds.
+        delta_seconds = dt * 0.001
+
+        # Spawn particles for this frame.
+        self._spawn_remainder += self.spawn_rate * delta_seconds
+        to_spawn = int(self._spawn_remainder)
+        self._spawn_remainder -= to_spawn
+        self.emit(to_spawn)
+
+        self._update_particles(delta_seconds)
+
+        # Continue drawing actor.
+        super().tick(dt)
+
+    def _update_particles(self, delta_seconds):
+        """Move, age and remove dead particles in one step."""
+        count = self._num_alive
+        if not count:
+            return
+
+        positions = self._positions[:count]
+        velocities = self._velocities[:count]
+        ages = self._ages[:count]
+        lifetimes = self._lifetimes[:count]
+
+        # Move with current velocity, then accelerate, like projectiles.
+        positions += velocities * delta_seconds
+        acceleration = self.acceleration
+        velocities += (acceleration[0] * delta_seconds,
+            acceleration[1] * delta_seconds)
+        ages += delta_seconds
+
+        # Move living particles to the start of the arrays.
+        alive = ages < lifetimes
+        num_alive = int(np.count_nonzero(alive))
+        if num_alive != count:
+            for array in (self._positions, self._velocities, self._ages,
+                self._lifetimes):
+                array[:num_alive] = array[:count][alive]
+            count = self._num_alive = num_alive
+
+        # Fade colors over each particle's life.
+        bias = (self._ages[:count] / self._lifetimes[:count])[:, np.newaxis]
+        start_color = np.array(tuple(self.start_color), dtype=float)
+        end_color = np.array(tuple(self.end_color), dtype=float)
+        self._colors[:count] = start_color + (end_color - start_color) * bias
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Start of drawable interface.
+
+    def _should_draw(self):
+        """Only draw if there are particles."""
+        return self._num_alive > 0
+
+    def _draw(self):
+        graph = self.world
+        canvas_dim, tr, bl = graph.get_view_transform()
+
+        # Convert all particles to canvas coordinates at once.
+        count = self._num_alive
+        positions = self._positions[:count]
+        canvas_x = (positions[:, 0] - bl[0]) * (canvas_dim[0] / (tr[0] - bl[0]))
+        canvas_y = canvas_dim[1] - (positions[:, 1] - bl[1]) \
+            * (canvas_dim[1] / (tr[1] - bl[1]))
+
+        raster = rasterize_points(canvas_x, canvas_y, self._colors[:count],
+            int(canvas_dim[0]), int(canvas_dim[1]), self.particle_size)
+        if raster is None:
+            return
+
+        left, top, rgba = raster
+        image = PhotoImage(master=graph, data=encode_png(rgba), format="png")
+        graph.create_image(left, top, image=image, anchor="nw",
+            tags=(self.unique_id))
+
+        # Replace the previous image only after the new one is shown.
+        self._image = image
+
+    # End of drawable interface.
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def begin_destroy(self):
+        super().begin_destroy()
+        self._clear()
+        self._image = None
+
+def rasterize_points(xs, ys, colors, width, height, size=1):
+    """
+    Draw points as squares into the smallest RGBA image that holds them.
+    Points outside of width and height are left out.
+
+    :param xs: (array) X coordinate of each point, in pixels.
+
+    :param ys: (array) Y coordinate of each point, in pixels.
+
+    :param colors: (array) RGB color of each point, shape (N, 3).
+
+    :param width: (int) Width of area to draw in, in pixels.
+
+    :param height: (int) Height of area to draw in, in pixels.
+
+    :param size: (int) Width of each square, in pixels.
+
+    :return: (tuple) Left and top pixel of image in the area, and RGBA
+    image as an array of shape (rows, columns, 4). None if no points are
+    in the area.
+    """
+    xs = np.floor(xs).astype(np.intp)
+    ys = np.floor(ys).astype(np.intp)
+    visible = (xs > -size) & (xs < width) & (ys > -size) & (ys < height)
+    if not visible.any():
+        return None
+    xs, ys, colors = xs[visible], ys[visible], colors[visible]
+
+    left = max(int(xs.min()), 0)
+    top = max(int(ys.min()), 0)
+    right = min(int(xs.max()) + size, width)
+    bottom = min(int(ys.max()) + size, height)
+
+    rgba = np.zeros((bottom - top, right - left, 4), dtype=np.uint8)
+    xs -= left
+    ys -= top
+    for offset_y in range(size):
+        for offset_x in range(size):
+            px = xs + offset_x
+            py = ys + offset_y
+            inside = ((px >= 0) & (px < rgba.shape[1])
+                & (py >= 0) & (py < rgba.shape[0]))
+            rgba[py[inside], px[inside], :3] = colors[inside]
+            rgba[py[inside], px[inside], 3] = 255
+
+    return left, top, rgba
+
+def encode_png(rgba):
+    """
+    Encode an RGBA image as PNG file data, which tk can show without
+    any other libraries.
+
+    :param rgba: (array) Image of shape (rows, columns, 4), as uint8.
+
+    :return: (bytes) PNG file data.
+    """
+    height, width = rgba.shape[:2]
+
+    # Each row starts with a filter type of 0, meaning no filter.
+    rows = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    rows[:, 1:] = rgba.reshape(height, width * 4)
+
+    def chunk(chunk_type, data):
+        return (struct.pack(">I", len(data)) + chunk_type + data
+            + struct.pack(">I", zlib.crc32(chunk_type + data) & 0xFFFFFFFF))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(rows.tobytes(), 1))
+        + chunk(b"IEND", b""))
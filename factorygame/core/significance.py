@@ -0,0 +1,322 @@
+"""
+Reducing the cost of actors far from what the player can see.
+"""
+
+from math import inf, sqrt
+from factorygame.core.engine_base import Actor, ETickGroup
+
+class SignificanceManager(Actor):
+    """
+    Scores registered actors by their distance from the viewport, and
+    ticks less significant actors less often or not at all.
+
+    Actors at a level with a tick interval of 1 tick normally. Actors
+    at other levels are removed from the world's tick groups and
+    ticked by this manager instead, every few frames with the total
+    time since they last ticked. Actors resuming from suspension get
+    `catch_up` with the time they missed.
+
+    The manager ticks in the ENGINE group, so it can change which actors
+    the world ticks before their groups run. Throttled actors due this
+    frame are then ticked in their own tick group, after the engine's
+    work for the frame. Only the actor's own tick is throttled. Its
+    components keep ticking normally.
+    """
+
+    def __init__(self):
+        """Set default values."""
+        super().__init__()
+
+        self.primary_actor_tick.tick_group = ETickGroup.ENGINE
+
+        ## Significance levels. Set with the levels property.
+        self._level_settings = ((0.0, 1), (2000.0, 4), (inf, 0))
+
+        ## Extra distance an actor must move past a level's furthest
+        ## distance before it becomes less significant, so actors near
+        ## the boundary don't keep changing level.
+        self.hysteresis = 200.0
+
+        ## Time between scoring all actors, in milliseconds. Actors are
+        ## also scored when the view changes.
+        self.update_interval = 250
+
+        ## Bottom left and top right corners (Loc) of the area to measure
+        ## distance from, or None to use the graph's viewport.
+        self.view_bounds = None
+
+        ## Significance level of each registered actor.
+        self._levels = {}
+
+        ## Whether each registered actor ticked before being registered,
+        ## so its tick can be restored when unregistered.
+        self._wants_tick = {}
+
+        ## Manager time each throttled or suspended actor last ticked,
+        ## in milliseconds.
+        self._last_tick_times = {}
+
+        ## Buckets of throttled actors for each level, one bucket per
+        ## frame of the level's tick interval. Each bucket is a
+        ## dictionary used as an ordered set.
+        self._buckets = {}
+
+        ## Level and bucket index of each throttled actor.
+        self._actor_buckets = {}
+
+        ## Next bucket to add actors to, for each level.
+        self._next_bucket = {}
+
+        ## Actors spawned to tick throttled actors in each tick group
+        ## after ENGINE.
+        self._group_tickers = {}
+
+        ## Time since the manager started, in milliseconds.
+        self._time = 0
+
+        ## Number of frames ticked.
+        self._frame = 0
+
+        ## Time since actors were last scored, in milliseconds.
+        self._time_since_update = 0
+
+        ## Whether to score actors next tick regardless of the interval.
+        self._needs_update = True
+
+    @property
+    def levels(self):
+        """
+        Significance levels, from most to least significant, as tuples of
+        (furthest distance from the view, tick interval in frames). A
+        tick interval of 0 suspends ticking. The first interval should be
+        1 and the last distance should be inf. Registered actors are
+        moved to the new levels when set.
+        """
+        return self._level_settings
+
+    @levels.setter
+    def levels(self, value):
+        old_levels = self._level_settings
+        self._level_settings = levels = tuple(value)
+
+        # Place every actor again, as the buckets depend on intervals.
+        self._buckets = {}
+        self._actor_buckets = {}
+        self._next_bucket = {}
+        max_level = len(levels) - 1
+        for actor, old_level in tuple(self._levels.items()):
+            self._set_level(actor, min(old_level, max_level),
+                old_levels[old_level][1])
+
+        self._needs_update = True
+
+    def begin_play(self):
+        super().begin_play()
+
+        world = self.world
+        for group, ticker_class in _GROUP_TICKER_CLASSES.items():
+            self._group_tickers[group] = world.spawn_actor(ticker_class,
+                self.location)
+
+        world.on_actor_destroyed.add(self.unregister_actor)
+        try:
+            world.on_view_changed.add(self.mark_needs_update)
+        except AttributeError:
+            # The world is not a graph.
+            pass
+
+    def register_actor(self, actor):
+        """
+        Start managing how often a spawned actor ticks. Does nothing if
+        it is already registered. Don't change the actor's tick_enabled
+        while it is registered.
+        """
+        if actor in self._levels:
+            return
+
+        if actor.primary_actor_tick.tick_group <= ETickGroup.ENGINE:
+            raise ValueError("Cannot manage significance of %s, as it ticks "
+                "in the ENGINE group" % actor)
+
+        self._levels[actor] = 0
+        self._wants_tick[actor] = actor.primary_actor_tick.tick_enabled
+        self._needs_update = True
+
+    def unregister_actor(self, actor):
+        """Stop managing an actor, restoring its tick if it was stopped.
+        Does nothing if it is not registered."""
+        level = self._levels.pop(actor, None)
+        if level is None:
+            return
+
+        self._remove_from_bucket(actor)
+        self._last_tick_times.pop(actor, None)
+        wants_tick = self._wants_tick.pop(actor)
+        if (wants_tick and self.levels[level][1] != 1
+            and self.world._is_actor_indexed(actor)):
+            # Actor is still in the world.
+            actor.primary_actor_tick.tick_enabled = True
+
+    def get_significance(self, actor):
+        """Return the significance level of an actor, where 0 is the most
+        significant, or None if it is not registered."""
+        return self._levels.get(actor)
+
+    def mark_needs_update(self, *args):
+        """Score all actors again next tick."""
+        self._needs_update = True
+
+    def get_distance_from_view(self, location):
+        """Return the distance from a location to the nearest point in
+        the view, or 0 if it is in the view."""
+        bl, tr = self.view_bounds or self.world.get_view_bounds()
+        dx = max(bl[0] - location[0], 0.0, location[0] - tr[0])
+        dy = max(bl[1] - location[1], 0.0, location[1] - tr[1])
+        return sqrt(dx * dx + dy * dy)
+
+    def tick(self, dt):
+        self._time += dt
+        self._frame += 1
+
+        self._time_since_update += dt
+        if self._needs_update or self._time_since_update >= self.update_interval:
+            self._update_levels()
+
+        self._tick_throttled_actors()
+
+    def _update_levels(self):
+        """Score all registered actors and move those whose level
+        changed."""
+        self._needs_update = False
+        self._time_since_update = 0
+
+        levels = self.levels
+        max_level = len(levels) - 1
+        hysteresis = self.hysteresis
+        get_distance = self.get_distance_from_view
+
+        changed = []
+        for actor, old_level in self._levels.items():
+            distance = get_distance(actor.location)
+
+            # Become more significant as soon as in range, but only less
+            # significant once past the hysteresis distance.
+            level = old_level
+            while level > 0 and distance <= levels[level - 1][0]:
+                level -= 1
+            while level < max_level and distance > levels[level][0] + hysteresis:
+                level += 1
+
+            if level != old_level:
+                changed.append((actor, level))
+
+        for actor, level in changed:
+            self._set_level(actor, level)
+
+    def _set_level(self, actor, level, old_interval=None):
+        """
+        Move an actor to a new significance level.
+
+        :param old_interval: (int) Tick interval the actor currently has,
+        if not the interval of its current level.
+        """
+        old_level = self._levels[actor]
+        if old_interval is None:
+            old_interval = self.levels[old_level][1]
+        interval = self.levels[level][1]
+        self._levels[actor] = level
+        wants_tick = self._wants_tick[actor]
+
+        if old_interval == 0 and interval != 0 and wants_tick:
+            # Resuming from suspension.
+            missed_time = self._time - self._last_tick_times[actor]
+            self._last_tick_times[actor] = self._time
+            actor.catch_up(missed_time)
+
+        self._remove_from_bucket(actor)
+        if wants_tick:
+            if interval == 1:
+                # Let the world tick it again.
+                self._last_tick_times.pop(actor, None)
+                if old_interval != 1:
+                    actor.primary_actor_tick.tick_enabled = True
+            else:
+                if old_interval == 1:
+                    actor.primary_actor_tick.tick_enabled = False
+                    self._last_tick_times[actor] = self._time
+                if interval > 1:
+                    self._add_to_bucket(actor, level, interval)
+
+        if level != old_level:
+            actor.on_significance_changed(level)
+
+    def _add_to_bucket(self, actor, level, interval):
+        """Add an actor to the next bucket of a level, so actors at a
+        level are spread evenly over frames."""
+        buckets = self._buckets.get(level)
+        if buckets is None:
+            buckets = self._buckets[level] = [{} for _ in range(interval)]
+            self._next_bucket[level] = 0
+
+        index = self._next_bucket[level]
+        self._next_bucket[level] = (index + 1) % interval
+        buckets[index][actor] = None
+        self._actor_buckets[actor] = (level, index)
+
+    def _remove_from_bucket(self, actor):
+        """Remove an actor from its bucket, if it is in one."""
+        bucket = self._actor_buckets.pop(actor, None)
+        if bucket is not None:
+            level, index = bucket
+            del self._buckets[level][index][actor]
+
+    def _tick_throttled_actors(self):
+        """Queue the bucket of each throttled level due this frame to
+        tick in the actors' own tick groups."""
+        time = self._time
+        last_tick_times = self._last_tick_times
+        group_tickers = self._group_tickers
+        for buckets in self._buckets.values():
+            bucket = buckets[self._frame % len(buckets)]
+            for actor in bucket:
+                delta_time = time - last_tick_times[actor]
+                last_tick_times[actor] = time
+                group_tickers[actor.primary_actor_tick.tick_group] \
+                    .pending.append((actor, delta_time))
+
+    def begin_destroy(self):
+        super().begin_destroy()
+        for actor in tuple(self._levels):
+            self.unregister_actor(actor)
+
+        for ticker in self._group_tickers.values():
+            self.world.destroy_actor(ticker)
+        self._group_tickers = {}
+
+class _ThrottledTicker(Actor):
+    """Ticks actors throttled by a SignificanceManager in its tick
+    group. Subclassed for each group, as the group must be set before
+    spawning."""
+
+    ## Tick group to tick throttled actors in.
+    group = ETickGroup.GAME
+
+    def __init__(self):
+        """Set default values."""
+        super().__init__()
+
+        self.primary_actor_tick.tick_group = self.group
+
+        ## Tuples of (actor, delta time) to tick this frame.
+        self.pending = []
+
+    def tick(self, dt):
+        pending, self.pending = self.pending, []
+        for actor, delta_time in pending:
+            actor.tick(delta_time)
+
+## Ticker class for each tick group after ENGINE.
+_GROUP_TICKER_CLASSES = {
+    group: type("_ThrottledTicker%d" % group, (_ThrottledTicker,),
+        {"group": group})
+    for group in range(ETickGroup.ENGINE + 1, ETickGroup.MAX)}
@@ -0,0 +1,249 @@
+"""
+Delayed and repeating callbacks, fired by the world each frame.
+"""
+
+from heapq import heappush, heappop, heapify
+from itertools import count
+
+class TimerHandle(object):
+    """
+    Handle to a timer made by `TimerManager.set_timer`. Pass it back to
+    the timer manager to clear, pause or inspect the timer.
+    """
+
+    __slots__ = ("callback", "interval", "loop", "_entry_id", "_fire_time",
+        "_remaining")
+
+    def __init__(self, callback, interval, loop):
+        ## Function called with no arguments when the timer fires.
+        self.callback = callback
+
+        ## Time between fires of a looping timer, in seconds.
+        self.interval = interval
+
+        ## Whether the timer fires repeatedly until cleared.
+        self.loop = loop
+
+        ## Id of this timer's current entry in the heap, or None if the
+        ## timer isn't waiting to fire.
+        self._entry_id = None
+
+        ## Time the timer is due to fire, in timer manager time.
+        self._fire_time = 0.0
+
+        ## Time left before firing, while paused. None if not paused.
+        self._remaining = None
+
+class TimerManager(object):
+    """
+    Fires timers when they are due, once per frame.
+
+    Timers wait in a heap ordered by fire time, so each frame only looks
+    at the timers that are due. Clearing or pausing a timer marks its
+    heap entry as stale instead of searching for it, and stale entries
+    are skipped when they reach the top or removed when there are too
+    many of them.
+    """
+
+    ## Least number of stale heap entries before the heap is rebuilt.
+    MIN_STALE_TO_REBUILD = 1024
+
+    def __init__(self):
+        """Set default values."""
+
+        ## Multiplier for how fast time passes for all timers.
+        self.time_dilation = 1.0
+
+        ## Time passed for timers, in seconds.
+        self._time = 0.0
+
+        ## Heap of waiting timers as tuples of (fire time, entry id,
+        ## handle). The entry id keeps timers with the same fire time in
+        ## the order they were set.
+        self._heap = []
+
+        ## Source of unique entry ids.
+        self._entry_ids = count()
+
+        ## Number of heap entries that no longer belong to a timer.
+        self._num_stale = 0
+
+        ## Number of timers that are waiting or paused.
+        self._num_timers = 0
+
+        ## Timers that are paused.
+        self._paused = set()
+
+        ## Entries to add to the heap after firing timers, so timers set
+        ## by callbacks don't fire until the next frame. None when not
+        ## firing.
+        self._pending = None
+
+    def __len__(self):
+        return self._num_timers
+
+    @property
+    def time(self):
+        """Time passed for timers, in seconds."""
+        return self._time
+
+    def set_timer(self, callback, delay, loop=False, first_delay=None):
+        """
+        Call a function after a delay.
+
+        :param callback: (callable) Function to call with no arguments.
+
+        :param delay: (float) Time to wait, in seconds. Also the time
+        between fires of looping timers.
+
+        :param loop: (bool) Whether to keep firing every DELAY seconds
+        until cleared.
+
+        :param first_delay: (float) Time to wait before the first fire of
+        a looping timer, if different to DELAY.
+
+        :return: (TimerHandle) Handle to clear or change the timer.
+        """
+        handle = TimerHandle(callback, delay, loop)
+        self._schedule(handle, delay if first_delay is None else first_delay)
+        self._num_timers += 1
+        return handle
+
+    def clear_timer(self, handle):
+        """Stop a timer from firing. Does nothing if it is not active."""
+        if handle._entry_id is not None:
+            self._invalidate(handle)
+        elif handle._remaining is not None:
+            handle._remaining = None
+            self._paused.discard(handle)
+        else:
+            return
+
+        self._num_timers -= 1
+
+    def clear_all_timers(self):
+        """Stop all timers from firing."""
+        for entries in (self._heap, self._pending or []):
+            for _, entry_id, handle in entries:
+                if handle._entry_id == entry_id:
+                    handle._entry_id = None
+            # Clear in place, as tick may be using them.
+            entries.clear()
+        for handle in self._paused:
+            handle._remaining = None
+        self._paused.clear()
+        self._num_stale = 0
+        self._num_timers = 0
+
+    def pause_timer(self, handle):
+        """Stop a timer counting down until it is unpaused."""
+        if handle._entry_id is None:
+            return
+
+        handle._remaining = max(handle._fire_time - self._time, 0.0)
+        self._paused.add(handle)
+        self._invalidate(handle)
+
+    def unpause_timer(self, handle):
+        """Continue counting down a paused timer."""
+        if handle._remaining is None:
+            return
+
+        remaining = handle._remaining
+        handle._remaining = None
+        self._paused.discard(handle)
+        self._schedule(handle, remaining)
+
+    def is_timer_active(self, handle):
+        """Return whether a timer is waiting to fire and not paused."""
+        return handle._entry_id is not None
+
+    def is_timer_paused(self, handle):
+        """Return whether a timer is paused."""
+        return handle._remaining is not None
+
+    def get_timer_remaining(self, handle):
+        """
+        Return time left before a timer fires, in seconds, or None if the
+        timer isn't active or paused.
+        """
+        if handle._remaining is not None:
+            return handle._remaining
+        if handle._entry_id is None:
+            return None
+        return max(handle._fire_time - self._time, 0.0)
+
+    def tick(self, delta_time):
+        """
+        Advance time and fire timers that are due. Each timer fires at
+        most once per call.
+
+        :param delta_time: Time since last frame, in milliseconds.
+        """
+        # Convert delta time ms to seconds.
+        time = self._time = self._time + delta_time * 0.001 * self.time_dilation
+
+        heap = self._heap
+        if not heap or heap[0][0] > time:
+            return
+
+        self._pending = pending = []
+        try:
+            while heap and heap[0][0] <= time:
+                fire_time, entry_id, handle = heappop(heap)
+                if handle._entry_id != entry_id:
+                    self._num_stale -= 1
+                    continue
+
+                if handle.loop:
+                    # Keep to the original schedule, but fire at most
+                    # once per frame.
+                    next_time = max(fire_time + handle.interval, time)
+                    handle._fire_time = next_time
+                    handle._entry_id = next_entry_id = next(self._entry_ids)
+                    pending.append((next_time, next_entry_id, handle))
+                else:
+                    handle._entry_id = None
+                    self._num_timers -= 1
+
+                handle.callback()
+        finally:
+            self._pending = None
+            for entry in pending:
+                if entry[2]._entry_id == entry[1]:
+                    heappush(heap, entry)
+                else:
+                    # Timer was cleared or paused by a callback.
+                    self._num_stale -= 1
+
+            self._rebuild_if_stale()
+
+    def _schedule(self, handle, delay):
+        """Add a heap entry to fire HANDLE after DELAY seconds."""
+        fire_time = self._time + delay
+        handle._fire_time = fire_time
+        handle._entry_id = entry_id = next(self._entry_ids)
+
+        if self._pending is not None:
+            self._pending.append((fire_time, entry_id, handle))
+        else:
+            heappush(self._heap, (fire_time, entry_id, handle))
+
+    def _invalidate(self, handle):
+        """Mark the heap entry of a timer as stale."""
+        handle._entry_id = None
+        self._num_stale += 1
+        if self._pending is None:
+            self._rebuild_if_stale()
+
+    def _rebuild_if_stale(self):
+        """Remove stale entries if they make up most of the heap."""
+        num_stale = self._num_stale
+        if (num_stale < self.MIN_STALE_TO_REBUILD
+            or num_stale * 2 < len(self._heap)):
+            return
+
+        self._heap = [entry for entry in self._heap
+            if entry[2]._entry_id == entry[1]]
+        heapify(self._heap)
+        self._num_stale = 0
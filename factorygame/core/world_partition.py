@@ -0,0 +1,393 @@
+"""
+Streaming actors in and out of the world in chunks around the view.
+"""
+
+import os, pickle, threading, warnings
+from collections import OrderedDict, deque
+from math import floor
+from queue import Queue
+from factorygame.core.engine_base import Actor
+
+class WorldPartition(Actor):
+    """
+    Splits the world into a grid of square chunks stored on disk, and
+    only keeps actors of chunks near the view spawned.
+
+    Chunk files are read and written on a background thread. Actors are
+    spawned and destroyed on the main thread, from a timer, so they are
+    never changed while the world is ticking them. Chunks no longer near
+    the view stay loaded until more than `max_loaded_actors` actors are
+    loaded, then the least recently needed chunks are saved and unloaded
+    first.
+
+    Actors are saved as their class, location and the attributes
+    returned by `Actor.get_streaming_state`, which are set again before
+    they are spawned. Actors are saved to the chunk they were loaded into
+    or added to, even if they have moved since. All loaded chunks are
+    saved when the partition is destroyed.
+
+    Chunk files that can't be read or written are reported with a
+    RuntimeWarning. Chunks that can't be read are loaded empty, and
+    their files are only replaced if actors are added to them.
+    """
+
+    ## Extension of chunk file names.
+    CHUNK_EXTENSION = ".chunk"
+
+    def __init__(self):
+        """Set default values."""
+        super().__init__()
+
+        # Streaming is updated by a timer.
+        self.primary_actor_tick.can_ever_tick = False
+
+        ## Width and height of each chunk, in world units.
+        self.chunk_size = 2000.0
+
+        ## Distance around the view to keep chunks loaded.
+        self.load_distance = 500.0
+
+        ## Number of loaded actors above which chunks not near the view
+        ## are unloaded.
+        self.max_loaded_actors = 20000
+
+        ## Time between checking which chunks are needed, in seconds.
+        self.update_interval = 0.1
+
+        ## Bottom left and top right corners (Loc) of the area to load
+        ## chunks around, or None to use the graph's viewport.
+        self.view_bounds = None
+
+        ## Directory chunk files are stored in, or None before
+        ## `set_directory`.
+        self._directory = None
+
+        ## Keys (x, y) of chunks that have a file.
+        self._chunks_on_disk = set()
+
+        ## Actors of each loaded chunk, in least to most recently needed
+        ## order. Each value is a dictionary used as an ordered set.
+        self._loaded_chunks = OrderedDict()
+
+        ## Chunk key of each loaded actor.
+        self._actor_chunks = {}
+
+        ## Keys of chunks being read on the background thread.
+        self._loading_chunks = set()
+
+        ## Tuples of (chunk key, records, error) read on the background
+        ## thread, waiting to be spawned.
+        self._finished_loads = deque()
+
+        ## Jobs for the background thread, as tuples of (function, args).
+        self._jobs = Queue()
+
+        ## Tuples of (chunk key, exception) for jobs that failed on the
+        ## background thread, waiting to be reported.
+        self._job_errors = deque()
+
+        ## Background thread reading and writing chunk files.
+        self._worker = None
+
+        ## Timer handle for updating streaming.
+        self._update_timer = None
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Start and stop.
+
+    def set_directory(self, directory):
+        """
+        Set the directory to store chunk files in, making it if it
+        doesn't exist. Chunks already in it are loaded when needed.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._chunks_on_disk = set()
+        for filename in os.listdir(directory):
+            key = self._get_chunk_key_from_filename(filename)
+            if key is not None:
+                self._chunks_on_disk.add(key)
+
+    def begin_play(self):
+        super().begin_play()
+
+        self._worker = threading.Thread(target=self._run_jobs, daemon=True)
+        self._worker.start()
+
+        world = self.world
+        world.on_actor_destroyed.add(self._on_actor_destroyed)
+        self._update_timer = world.timer_manager.set_timer(
+            self.update_streaming, self.update_interval, loop=True)
+
+    def begin_destroy(self):
+        super().begin_destroy()
+
+        if self._update_timer is not None:
+            self.world.timer_manager.clear_timer(self._update_timer)
+            self._update_timer = None
+
+        if self._worker is None:
+            # Destroyed before it began play, so nothing was loaded.
+            return
+
+        # Save everything, without spawning chunks still being read.
+        self._save_loaded_chunks()
+        self._jobs.put(None)
+        self._worker.join()
+        self._worker = None
+        self._report_errors()
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Chunks.
+
+    def get_chunk_key(self, location):
+        """Return the key (x, y) of the chunk containing a location."""
+        chunk_size = self.chunk_size
+        return (floor(location[0] / chunk_size),
+            floor(location[1] / chunk_size))
+
+    def is_chunk_loaded(self, key):
+        """Return whether the actors of a chunk are spawned."""
+        return key in self._loaded_chunks
+
+    @property
+    def num_loaded_actors(self):
+        """Number of actors spawned from or added to chunks."""
+        return len(self._actor_chunks)
+
+    def get_needed_chunks(self):
+        """Return a list of keys of chunks within the load distance of
+        the view."""
+        bl, tr = self.view_bounds or self.world.get_view_bounds()
+        load_distance = self.load_distance
+        min_x, min_y = self.get_chunk_key(
+            (bl[0] - load_distance, bl[1] - load_distance))
+        max_x, max_y = self.get_chunk_key(
+            (tr[0] + load_distance, tr[1] + load_distance))
+        return [(x, y) for x in range(min_x, max_x + 1)
+            for y in range(min_y, max_y + 1)]
+
+    def add_actor(self, actor):
+        """
+        Store a spawned actor in the chunk at its location, loading the
+        chunk first if needed.
+        """
+        key = self.get_chunk_key(actor.location)
+        if key not in self._loaded_chunks:
+            self.load_chunk(key, wait=True)
+        self._loaded_chunks[key][actor] = None
+        self._actor_chunks[actor] = key
+
+    def load_chunk(self, key, wait=False):
+        """
+        Start spawning the actors of a chunk. Does nothing if the chunk is
+        loaded or loading.
+
+        :param key: (tuple) Key (x, y) of chunk.
+
+        :param wait: (bool) Whether to read the chunk file and spawn its
+        actors before returning.
+        """
+        if key in self._loaded_chunks:
+            return
+
+        if key not in self._chunks_on_disk:
+            # Nothing to read.
+            self._loaded_chunks[key] = {}
+            return
+
+        if key not in self._loading_chunks:
+            self._loading_chunks.add(key)
+            self._jobs.put((self._read_chunk, (key,)))
+
+        if wait:
+            self.flush()
+
+    def unload_chunk(self, key):
+        """Save and destroy the actors of a loaded chunk."""
+        actors = self._loaded_chunks.pop(key, None)
+        if actors is None:
+            return
+
+        if actors or key in self._chunks_on_disk:
+            self._save_chunk(key, actors)
+        for actor in actors:
+            del self._actor_chunks[actor]
+            self.world.destroy_actor(actor)
+
+    def save_all(self):
+        """
+        Save all loaded chunks and wait until they are written.
+
+        :raise OSError: If a chunk couldn't be written.
+        """
+        self._save_loaded_chunks()
+        errors = self.flush()
+        for _, error in errors:
+            if isinstance(error, OSError):
+                raise error
+
+    def flush(self):
+        """
+        Wait for all reads and writes to finish, then spawn actors of
+        chunks that were read.
+
+        :return: (list) Tuples of (chunk key, exception) for chunks that
+        couldn't be read or written. They are also reported as warnings.
+        """
+        self._jobs.join()
+        self._spawn_finished_loads(only_needed=False)
+        return self._report_errors()
+
+    def update_streaming(self):
+        """Load chunks near the view, spawn actors of chunks that were
+        read and unload unneeded chunks if over budget."""
+        if self._directory is None:
+            return
+
+        needed = self.get_needed_chunks()
+        loaded_chunks = self._loaded_chunks
+        for key in needed:
+            if key in loaded_chunks:
+                # Mark as most recently needed.
+                loaded_chunks.move_to_end(key)
+            else:
+                self.load_chunk(key)
+
+        needed = set(needed)
+        self._spawn_finished_loads(needed)
+        self._report_errors()
+
+        # Unload least recently needed chunks until within budget.
+        num_needed = len(needed)
+        while (len(self._actor_chunks) > self.max_loaded_actors
+            and len(loaded_chunks) > num_needed):
+            key = next(iter(loaded_chunks))
+            if key in needed:
+                # Needed chunks are the most recent, so all the rest are
+                # needed too.
+                break
+            self.unload_chunk(key)
+
+    def _spawn_finished_loads(self, needed=None, only_needed=True):
+        """Spawn actors of chunks read on the background thread."""
+        finished_loads = self._finished_loads
+        while finished_loads:
+            key, records, error = finished_loads.popleft()
+            self._loading_chunks.discard(key)
+            if error is not None:
+                # Load it empty, and keep the file unless actors are
+                # added to it.
+                self._job_errors.append((key, error))
+                self._chunks_on_disk.discard(key)
+                records = ()
+            if only_needed and key not in needed:
+                # No longer near the view. The file is kept as it is.
+                continue
+
+            actors = self._loaded_chunks[key] = {}
+            world = self.world
+            for actor_class, location, state in records:
+                actor = world.deferred_spawn_actor(actor_class, location)
+                for name, value in state.items():
+                    setattr(actor, name, value)
+                actors[actor] = None
+                self._actor_chunks[actor] = key
+                world.finish_deferred_spawn_actor(actor)
+
+    def _save_loaded_chunks(self):
+        """Start saving all loaded chunks that have actors or a file."""
+        for key, actors in self._loaded_chunks.items():
+            if actors or key in self._chunks_on_disk:
+                self._save_chunk(key, actors)
+
+    def _report_errors(self):
+        """
+        Warn about jobs that failed on the background thread since last
+        reported.
+
+        :return: (list) Tuples of (chunk key, exception).
+        """
+        errors = []
+        job_errors = self._job_errors
+        while job_errors:
+            key, error = job_errors.popleft()
+            warnings.warn("World partition chunk %s failed: %s"
+                % (key, error), RuntimeWarning)
+            errors.append((key, error))
+        return errors
+
+    def _save_chunk(self, key, actors):
+        """Serialize the actors of a chunk and write them in the
+        background."""
+        records = [(type(actor), tuple(actor.location),
+            actor.get_streaming_state()) for actor in actors]
+        data = pickle.dumps(records, pickle.HIGHEST_PROTOCOL)
+        self._chunks_on_disk.add(key)
+        self._jobs.put((self._write_chunk, (key, data)))
+
+    def _on_actor_destroyed(self, actor):
+        """Forget an actor destroyed by the game, so it isn't saved."""
+        key = self._actor_chunks.pop(actor, None)
+        if key is not None:
+            del self._loaded_chunks[key][actor]
+
+    # End of chunks.
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Background thread.
+
+    def _run_jobs(self):
+        """Run jobs in order until given None. Jobs are run in order, so
+        a chunk being saved is written before it is read again."""
+        jobs = self._jobs
+        while True:
+            job = jobs.get()
+            try:
+                if job is None:
+                    return
+                func, args = job
+                try:
+                    func(*args)
+                except Exception as e:
+                    # Keep running, and report on the main thread.
+                    self._job_errors.append((args[0], e))
+            finally:
+                jobs.task_done()
+
+    def _get_chunk_path(self, key):
+        return os.path.join(self._directory,
+            "%d_%d%s" % (key[0], key[1], self.CHUNK_EXTENSION))
+
+    def _get_chunk_key_from_filename(self, filename):
+        """Return the key of a chunk file, or None if it isn't one."""
+        name, extension = os.path.splitext(filename)
+        if extension != self.CHUNK_EXTENSION:
+            return None
+        try:
+            x, y = name.split("_")
+            return (int(x), int(y))
+        except ValueError:
+            return None
+
+    def _read_chunk(self, key):
+        """Read the records of a chunk. Called on the background
+        thread."""
+        records = error = None
+        try:
+            with open(self._get_chunk_path(key), "rb") as fp:
+                records = pickle.load(fp)
+        except Exception as e:
+            error = e
+        self._finished_loads.append((key, records, error))
+
+    def _write_chunk(self, key, data):
+        """Write serialized records of a chunk, replacing the file only
+        once written. Called on the background thread."""
+        path = self._get_chunk_path(key)
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as fp:
+            fp.write(data)
+        os.replace(temp_path, path)
+
+    # End of background thread.
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # #
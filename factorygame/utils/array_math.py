@@ -0,0 +1,72 @@
+"""
+Vectorised versions of MathStat functions for NumPy arrays.
+
+Each function works on a whole array of scalars, points or colors in one
+call, which is much faster than calling MathStat for each element.
+Points and colors are arrays with one row per item, eg shape (N, 2) for
+points and (N, 3) for RGB colors.
+
+Requires NumPy.
+"""
+
+import numpy as np
+
+class ArrayMathStat(object):
+    """Static math library for NumPy arrays."""
+
+    @staticmethod
+    def clamp(vals, min=0, max=1):
+        """returns vals clamped between min and max"""
+        return np.clip(vals, min, max)
+
+    @staticmethod
+    def getpercent(vals, min, max):
+        """returns what percent (0 to 1) each of vals is between min and
+        max. min and max can be given per axis for points."""
+        vals = np.asarray(vals, dtype=float)
+        return (vals - min) / (np.subtract(max, min))
+
+    @staticmethod
+    def map_range(vals, in_a, in_b, out_a=0, out_b=1):
+        """returns vals mapped from range(in_a to in_b) to range(out_a to
+        out_b). Ranges can be given per axis for points, eg to map points
+        in world coordinates to canvas coordinates."""
+        return ArrayMathStat.lerp(out_a, out_b,
+            ArrayMathStat.getpercent(vals, in_a, in_b), False)
+
+    @staticmethod
+    def map_range_clamped(vals, in_a, in_b, out_a=0, out_b=1):
+        """returns vals mapped from range(in_a to in_b) to range(out_a to
+        out_b), clamped to the output range"""
+        return ArrayMathStat.lerp(out_a, out_b,
+            ArrayMathStat.getpercent(vals, in_a, in_b), True)
+
+    @staticmethod
+    def lerp(a, b, bias, clamp=True):
+        """returns interpolation between a and b for each bias. bias 0 = a,
+        bias 1 = b. a and b can be scalars, or arrays of points or colors.
+        A bias with one value per row of a and b is applied to every
+        column. can also extrapolate if clamp is set to False"""
+        a = np.asarray(a, dtype=float)
+        b = np.asarray(b, dtype=float)
+        bias = np.asarray(bias, dtype=float)
+
+        if clamp:
+            bias = np.clip(bias, 0, 1)
+
+        if bias.ndim == 1 and max(a.ndim, b.ndim) == 2:
+            # One bias per row, so apply it to every column.
+            bias = bias[:, np.newaxis]
+
+        return a + (b - a) * bias
+
+    @staticmethod
+    def getdistsquared(locs1, locs2):
+        """returns squared distance between each pair of points"""
+        delta = np.subtract(locs2, locs1, dtype=float)
+        return np.einsum("...i,...i->...", delta, delta)
+
+    @staticmethod
+    def getdist(locs1, locs2):
+        """returns distance between each pair of points"""
+        return np.sqrt(ArrayMathStat.getdistsquared(locs1, locs2))
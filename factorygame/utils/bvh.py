@@ -0,0 +1,244 @@
+"""
+Bounding volume hierarchy for finding objects near a point, box or line.
+"""
+
+from math import inf
+
+class _TreeNode(object):
+    """Node in an AABBTree. Leaves hold an item, other nodes have two
+    children."""
+
+    __slots__ = ("bounds", "parent", "left", "right", "item")
+
+    def __init__(self, bounds, item=None):
+        ## Bounding box as a tuple of (min x, min y, max x, max y).
+        self.bounds = bounds
+        self.parent = None
+        self.left = None
+        self.right = None
+        self.item = item
+
+def _union(a, b):
+    """Return the bounding box containing boxes A and B."""
+    return (a[0] if a[0] < b[0] else b[0], a[1] if a[1] < b[1] else b[1],
+        a[2] if a[2] > b[2] else b[2], a[3] if a[3] > b[3] else b[3])
+
+def _perimeter(box):
+    """Return the perimeter of a box, used as the cost of a node."""
+    return 2.0 * ((box[2] - box[0]) + (box[3] - box[1]))
+
+def _contains(outer, inner):
+    """Return whether box OUTER fully contains box INNER."""
+    return (outer[0] <= inner[0] and outer[1] <= inner[1]
+        and outer[2] >= inner[2] and outer[3] >= inner[3])
+
+class AABBTree(object):
+    """
+    Dynamic tree of axis aligned bounding boxes.
+
+    Items can be inserted, moved and removed at any time, and only the
+    branch of the tree holding the item is updated. Leaf boxes are
+    enlarged by a margin so small movements don't change the tree.
+    """
+
+    def __init__(self, margin=10.0):
+        """
+        :param margin: (float) Distance to enlarge each leaf box by, in
+        world units.
+        """
+        ## Distance to enlarge each leaf box by.
+        self.margin = margin
+
+        ## Top node of the tree, or None if empty.
+        self._root = None
+
+        ## Leaf node of each item.
+        self._leaves = {}
+
+    def __len__(self):
+        return len(self._leaves)
+
+    def __contains__(self, item):
+        return item in self._leaves
+
+    def insert(self, item, bounds):
+        """
+        Add an item to the tree.
+
+        :param item: Hashable object to store, other than None.
+
+        :param bounds: (tuple) Bounding box of item as (min x, min y,
+        max x, max y).
+        """
+        if item in self._leaves:
+            self.remove(item)
+
+        margin = self.margin
+        leaf = _TreeNode((bounds[0] - margin, bounds[1] - margin,
+            bounds[2] + margin, bounds[3] + margin), item)
+        self._leaves[item] = leaf
+        self._insert_leaf(leaf)
+
+    def update(self, item, bounds):
+        """
+        Move an item in the tree, inserting it if it isn't in the tree.
+
+        :return: (bool) Whether the tree changed.
+        """
+        leaf = self._leaves.get(item)
+        if leaf is not None and _contains(leaf.bounds, bounds):
+            # Still within the enlarged box.
+            return False
+
+        self.insert(item, bounds)
+        return True
+
+    def remove(self, item):
+        """Remove an item from the tree. Does nothing if it isn't in the
+        tree."""
+        leaf = self._leaves.pop(item, None)
+        if leaf is None:
+            return
+
+        parent = leaf.parent
+        if parent is None:
+            self._root = None
+            return
+
+        sibling = parent.right if parent.left is leaf else parent.left
+        grandparent = parent.parent
+        sibling.parent = grandparent
+        if grandparent is None:
+            self._root = sibling
+            return
+
+        if grandparent.left is parent:
+            grandparent.left = sibling
+        else:
+            grandparent.right = sibling
+        self._refit(grandparent)
+
+    def clear(self):
+        """Remove all items from the tree."""
+        self._root = None
+        self._leaves.clear()
+
+    def query_box(self, bounds):
+        """
+        Generate items whose boxes overlap a box.
+
+        :param bounds: (tuple) Box as (min x, min y, max x, max y).
+        """
+        if self._root is None:
+            return
+
+        min_x, min_y, max_x, max_y = bounds
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            box = node.bounds
+            if (box[0] > max_x or box[2] < min_x
+                or box[1] > max_y or box[3] < min_y):
+                continue
+
+            if node.item is not None:
+                yield node.item
+            else:
+                stack.append(node.left)
+                stack.append(node.right)
+
+    def query_segment(self, ax, ay, bx, by):
+        """Generate items whose boxes are crossed by a line segment."""
+        if self._root is None:
+            return
+
+        dx, dy = bx - ax, by - ay
+        inv_x = 1.0 / dx if dx else inf
+        inv_y = 1.0 / dy if dy else inf
+
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            box = node.bounds
+
+            # Find where the segment is between the slabs on each axis.
+            if dx:
+                t1, t2 = (box[0] - ax) * inv_x, (box[2] - ax) * inv_x
+                if t1 > t2:
+                    t1, t2 = t2, t1
+            elif box[0] <= ax <= box[2]:
+                t1, t2 = 0.0, 1.0
+            else:
+                continue
+
+            if dy:
+                t3, t4 = (box[1] - ay) * inv_y, (box[3] - ay) * inv_y
+                if t3 > t4:
+                    t3, t4 = t4, t3
+            elif box[1] <= ay <= box[3]:
+                t3, t4 = 0.0, 1.0
+            else:
+                continue
+
+            t_enter = max(t1, t3, 0.0)
+            t_exit = min(t2, t4, 1.0)
+            if t_enter > t_exit:
+                continue
+
+            if node.item is not None:
+                yield node.item
+            else:
+                stack.append(node.left)
+                stack.append(node.right)
+
+    def _insert_leaf(self, leaf):
+        """Find the cheapest place to put a leaf and add it there."""
+        if self._root is None:
+            self._root = leaf
+            return
+
+        bounds = leaf.bounds
+
+        # Walk down the tree choosing the child that grows the least.
+        node = self._root
+        while node.item is None:
+            combined = _perimeter(_union(node.bounds, bounds))
+            # Cost of making a new parent for the leaf and this node.
+            cost = 2.0 * combined
+            # Cost of growing this node to fit the leaf.
+            inherited = 2.0 * (combined - _perimeter(node.bounds))
+
+            child_costs = []
+            for child in (node.left, node.right):
+                child_cost = _perimeter(_union(child.bounds, bounds)) + inherited
+                if child.item is None:
+                    child_cost -= _perimeter(child.bounds)
+                child_costs.append(child_cost)
+
+            if cost < child_costs[0] and cost < child_costs[1]:
+                break
+            node = node.left if child_costs[0] <= child_costs[1] else node.right
+
+        # Make a new parent for the chosen node and the leaf.
+        old_parent = node.parent
+        new_parent = _TreeNode(_union(node.bounds, bounds))
+        new_parent.parent = old_parent
+        new_parent.left = node
+        new_parent.right = leaf
+        node.parent = new_parent
+        leaf.parent = new_parent
+
+        if old_parent is None:
+            self._root = new_parent
+        else:
+            if old_parent.left is node:
+                old_parent.left = new_parent
+            else:
+                old_parent.right = new_parent
+            self._refit(old_parent)
+
+    def _refit(self, node):
+        """Resize NODE and its ancestors to fit their children."""
+        while node is not None:
+            node.bounds = _union(node.left.bounds, node.right.bounds)
+            node = node.parent
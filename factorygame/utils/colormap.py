@@ -0,0 +1,113 @@
+"""
+Batched hex color gradients for coloring many objects at once.
+
+Use `gradient_hex` to get evenly spaced colors between two colors, or a
+`ColorMap` to color a whole array of values, eg a heatmap of node
+throughput, in a single call each frame.
+
+Requires NumPy.
+"""
+
+import numpy as np
+
+## ASCII codes of lowercase hex digits, indexed by digit value.
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+
+def rgb_to_hex(rgb):
+    """
+    Convert an array of RGB colors to hex color codes without formatting
+    each string separately.
+
+    :param rgb: (array) RGB components in range 0 to 255, shape (N, 3).
+
+    :return: (list) Hex color codes in format "#rrggbb".
+    """
+    rgb = np.clip(np.asarray(rgb, dtype=float).reshape(-1, 3), 0, 255)
+    rgb = rgb.astype(np.uint8)
+
+    # Build the ASCII characters of every string in one array.
+    chars = np.empty((len(rgb), 7), dtype=np.uint8)
+    chars[:, 0] = ord("#")
+    chars[:, 1::2] = _HEX_DIGITS[rgb >> 4]
+    chars[:, 2::2] = _HEX_DIGITS[rgb & 15]
+
+    return chars.view("S7").ravel().astype("U7").tolist()
+
+def gradient_hex(start, end, num):
+    """
+    Return NUM hex colors evenly interpolated from START to END,
+    including both ends.
+
+    :param start: (FColor) First color.
+
+    :param end: (FColor) Last color.
+
+    :param num: (int) Number of colors to generate.
+
+    :return: (list) Hex color codes.
+    """
+    bias = np.linspace(0.0, 1.0, num)[:, np.newaxis]
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    return rgb_to_hex(start + (end - start) * bias)
+
+class ColorMap(object):
+    """
+    Maps values to hex colors along a gradient of color stops.
+
+    A lookup table of hex strings is built once, so mapping an array of
+    values only finds indexes into the table.
+    """
+
+    def __init__(self, colors, positions=None, num_entries=256):
+        """
+        Build a color map.
+
+        :param colors: (list) FColor stops of the gradient, at least 2.
+
+        :param positions: (list) Position of each stop from 0 to 1, in
+        ascending order. Defaults to evenly spaced stops.
+
+        :param num_entries: (int) Number of colors in the lookup table.
+        More entries gives smoother gradients.
+        """
+        colors = np.asarray(colors, dtype=float)
+        if len(colors) < 2:
+            raise ValueError("Color map must have at least 2 colors")
+
+        if positions is None:
+            positions = np.linspace(0.0, 1.0, len(colors))
+        positions = np.asarray(positions, dtype=float)
+        if len(positions) != len(colors):
+            raise ValueError("Color map must have one position per color")
+
+        # Interpolate each channel separately between the stops.
+        samples = np.linspace(0.0, 1.0, num_entries)
+        rgb = np.column_stack([np.interp(samples, positions, colors[:, i])
+            for i in range(3)])
+
+        ## Hex color for each entry in the lookup table.
+        self._lut = np.array(rgb_to_hex(rgb), dtype=object)
+
+    def __len__(self):
+        return len(self._lut)
+
+    def map_hex(self, values, vmin=0.0, vmax=1.0):
+        """
+        Return the hex color for each value.
+
+        :param values: (array) Values to color.
+
+        :param vmin: (float) Value mapped to the first color. Lower values
+        are clamped.
+
+        :param vmax: (float) Value mapped to the last color. Higher values
+        are clamped.
+
+        :return: (list) Hex color codes, one per value.
+        """
+        values = np.asarray(values, dtype=float)
+        last = len(self._lut) - 1
+        scale = last / (vmax - vmin) if vmax != vmin else 0.0
+        indexes = np.clip(np.rint((values - vmin) * scale), 0, last)
+        return self._lut[indexes.astype(np.intp)].tolist()
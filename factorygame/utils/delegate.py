@@ -0,0 +1,118 @@
+"""
+Events that many listeners can bind to.
+"""
+
+from weakref import ref
+
+class MulticastDelegate(object):
+    """
+    List of functions called together when an event is broadcast.
+
+    Bound methods are held by weak reference, so binding an actor's
+    method doesn't keep the actor alive. Its functions are removed when
+    the actor is deleted. Other functions are held normally.
+
+    Adding and removing functions are O(1). The list of functions to
+    call is only rebuilt on the first broadcast after it changes, so
+    other broadcasts don't make any new objects. Changes made during a
+    broadcast take effect from the next broadcast.
+    """
+
+    __slots__ = ("_entries", "_invocation_list", "__weakref__")
+
+    def __init__(self):
+        ## Entry of each function, keyed by (object id, function) for
+        ## bound methods and by function otherwise. Each entry is a
+        ## tuple of (weak reference to object or None, function).
+        self._entries = {}
+
+        ## Tuple of entries to call on broadcast, or None if it needs to
+        ## be rebuilt.
+        self._invocation_list = ()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __bool__(self):
+        return bool(self._entries)
+
+    def __contains__(self, func):
+        return self._get_key(func) in self._entries
+
+    def add(self, func):
+        """
+        Call a function on broadcast. Does nothing if it is already
+        added.
+
+        :param func: (callable) Function or bound method, called with the
+        broadcast arguments.
+
+        :return: FUNC, so this can be used as a decorator.
+        """
+        key = self._get_key(func)
+        if key in self._entries:
+            return func
+
+        try:
+            obj = func.__self__
+            method = func.__func__
+        except AttributeError:
+            entry = (None, func)
+        else:
+            # Hold the object weakly, and forget the method when the
+            # object is deleted.
+            delegate_ref = ref(self)
+            def on_deleted(_):
+                delegate = delegate_ref()
+                if delegate is not None:
+                    delegate._remove_key(key)
+            entry = (ref(obj, on_deleted), method)
+
+        self._entries[key] = entry
+        self._invocation_list = None
+        return func
+
+    def remove(self, func):
+        """Stop calling a function. Does nothing if it isn't added."""
+        self._remove_key(self._get_key(func))
+
+    def remove_object(self, obj):
+        """Stop calling all bound methods of an object."""
+        obj_id = id(obj)
+        for key, (obj_ref, _) in tuple(self._entries.items()):
+            if obj_ref is not None and key[0] == obj_id and obj_ref() is obj:
+                self._remove_key(key)
+
+    def clear(self):
+        """Stop calling all functions."""
+        self._entries.clear()
+        self._invocation_list = ()
+
+    def broadcast(self, *args):
+        """Call all functions with ARGS."""
+        invocation_list = self._invocation_list
+        if invocation_list is None:
+            invocation_list = self._invocation_list = tuple(
+                self._entries.values())
+
+        for obj_ref, func in invocation_list:
+            if obj_ref is None:
+                func(*args)
+                continue
+
+            obj = obj_ref()
+            if obj is not None:
+                func(obj, *args)
+
+    @staticmethod
+    def _get_key(func):
+        """Return the key of a function in the entries dictionary."""
+        try:
+            return (id(func.__self__), func.__func__)
+        except AttributeError:
+            return func
+
+    def _remove_key(self, key):
+        """Remove the entry with KEY, if there is one."""
+        if self._entries.pop(key, None) is not None:
+            self._invocation_list = None
@@ -1,5 +1,6 @@
 from tkinter import Variable
 from math import sqrt
+from numbers import Number
 
 class Loc(list):
     """Structure for representing coordinates, with basic arithmetic.
@@ -155,11 +156,126 @@ class Loc(list):
         self = self / other
         return self
     def __ifloordiv__(self, other):
-        self = self / other
+        self = self // other
         return self
     def copy(self):
         return Loc(*self)
 
+class Vec2(tuple):
+    """Immutable 2D vector for fast math, usable as a dict key or set member.
+
+    Operators accept a number or any 2 item sequence (Vec2, Loc, tuple).
+    Use `Vec2(loc)` and `to_loc()` to convert to and from Loc.
+
+    Usage example:
+    ```
+    a = Vec2(10, 20)
+    b = a + Loc(5, 5)   # (X=15, Y=25)
+    c = b * 2           # (X=30, Y=50)
+    visited = {a, b}
+    ```
+    """
+    __slots__ = ()
+
+    x = property(lambda self: self[0])
+    y = property(lambda self: self[1])
+
+    def __new__(cls, x=0.0, y=None):
+        """Create a new Vec2 from separate X and Y components, or from
+        a single 2 item iterable. A single number is used for both
+        components.
+
+        Eg,
+        `Vec2(10, 10)` or
+        `Vec2(Loc(10, 10))`
+        """
+        if y is None:
+            if isinstance(x, Number):
+                y = x
+            else:
+                x, y = x
+        return tuple.__new__(cls, (x, y))
+
+    @classmethod
+    def from_loc(cls, loc):
+        """Return the first 2 components of LOC as a Vec2."""
+        return tuple.__new__(cls, (loc[0], loc[1]))
+
+    def to_loc(self):
+        """Return a new, mutable Loc with the same components."""
+        return Loc(self[0], self[1])
+
+    def __repr__(self):
+        return "(%s, %s)" % self
+    def __str__(self):
+        return "(X=%s, Y=%s)" % self
+
+    # Numbers are checked first as scalar operands are most common, and
+    # to avoid using exceptions for control flow.
+
+    def __add__(self, other):
+        if isinstance(other, Number):
+            return tuple.__new__(Vec2, (self[0] + other, self[1] + other))
+        return tuple.__new__(Vec2, (self[0] + other[0], self[1] + other[1]))
+    __radd__ = __add__
+    def __sub__(self, other):
+        if isinstance(other, Number):
+            return tuple.__new__(Vec2, (self[0] - other, self[1] - other))
+        return tuple.__new__(Vec2, (self[0] - other[0], self[1] - other[1]))
+    def __rsub__(self, other):
+        if isinstance(other, Number):
+            return tuple.__new__(Vec2, (other - self[0], other - self[1]))
+        return tuple.__new__(Vec2, (other[0] - self[0], other[1] - self[1]))
+    def __mul__(self, other):
+        if isinstance(other, Number):
+            return tuple.__new__(Vec2, (self[0] * other, self[1] * other))
+        return tuple.__new__(Vec2, (self[0] * other[0], self[1] * other[1]))
+    __rmul__ = __mul__
+    def __truediv__(self, other):
+        if isinstance(other, Number):
+            return tuple.__new__(Vec2, (self[0] / other, self[1] / other))
+        return tuple.__new__(Vec2, (self[0] / other[0], self[1] / other[1]))
+    def __floordiv__(self, other):
+        if isinstance(other, Number):
+            return tuple.__new__(Vec2, (self[0] // other, self[1] // other))
+        return tuple.__new__(Vec2, (self[0] // other[0], self[1] // other[1]))
+    def __mod__(self, other):
+        if isinstance(other, Number):
+            return tuple.__new__(Vec2, (self[0] % other, self[1] % other))
+        return tuple.__new__(Vec2, (self[0] % other[0], self[1] % other[1]))
+    def __neg__(self):
+        return tuple.__new__(Vec2, (-self[0], -self[1]))
+    def __pos__(self):
+        return self
+    def __abs__(self):
+        return sqrt(self[0] * self[0] + self[1] * self[1])
+    def __round__(self, *args):
+        return tuple.__new__(Vec2, (round(self[0], *args), round(self[1], *args)))
+
+    def length(self):
+        """Return the length of this vector."""
+        return sqrt(self[0] * self[0] + self[1] * self[1])
+
+    def length_squared(self):
+        """Return the squared length of this vector, avoiding a sqrt."""
+        return self[0] * self[0] + self[1] * self[1]
+
+    def dot(self, other):
+        """Return the dot product with OTHER."""
+        return self[0] * other[0] + self[1] * other[1]
+
+    def cross(self, other):
+        """Return the z component of the cross product with OTHER."""
+        return self[0] * other[1] - self[1] * other[0]
+
+    def normalized(self):
+        """Return the unit vector in the same direction, or a zero vector
+        if this vector has no length."""
+        length = sqrt(self[0] * self[0] + self[1] * self[1])
+        if not length:
+            return tuple.__new__(Vec2, (0.0, 0.0))
+        return tuple.__new__(Vec2, (self[0] / length, self[1] / length))
+
 class LocVar(Variable):
     """Value holder for Loc variables."""
     _default = Loc(0.0, 0.0)
@@ -0,0 +1,76 @@
+"""Utilities for measuring memory used by gameplay objects."""
+
+import sys, gc
+from types import ModuleType, FunctionType, MethodType
+
+## Objects of these types are shared between instances, so are never
+## counted towards an object's size.
+_SHARED_TYPES = (type, ModuleType, FunctionType, MethodType)
+
+def get_deep_size(obj, boundary_types=()):
+    """
+    Return the number of bytes used by an object and everything it
+    references that isn't shared, such as classes and functions.
+
+    :param obj: Object to measure.
+
+    :param boundary_types: (tuple) Types of referenced objects not to
+    follow, eg other actors or the world. The measured object itself is
+    always counted.
+
+    :return: (int) Size of the object, in bytes.
+    """
+    seen = {id(obj)}
+    size = 0
+    to_visit = [obj]
+
+    while to_visit:
+        it = to_visit.pop()
+        size += sys.getsizeof(it)
+
+        refs = gc.get_referents(it)
+        # Instance dicts may be stored inline, hidden from the collector.
+        instance_dict = getattr(it, "__dict__", None)
+        if type(instance_dict) is dict:
+            refs.append(instance_dict)
+
+        for ref in refs:
+            if (id(ref) in seen
+                or isinstance(ref, _SHARED_TYPES)
+                or isinstance(ref, boundary_types)
+                or ref is None
+            ):
+                continue
+            seen.add(id(ref))
+            to_visit.append(ref)
+
+    return size
+
+def get_actor_memory_report(actor_classes=None):
+    """
+    Return the number of bytes used by a freshly constructed actor of
+    each class. Actors are not spawned, so the world they would be in is
+    not counted.
+
+    :param actor_classes: (iterable) Actor classes to measure. Defaults
+    to the standard actor types.
+
+    :return: (dict) Bytes per actor, keyed by actor class name.
+    """
+    # Imported here as core modules depend on utils.
+    from tkinter import Misc
+    from factorygame.core.engine_base import EngineObject, Actor
+    from factorygame.core.blueprint import (DrawnActor, NodeBase,
+        PolygonNode, ImageNode, GridGismo, RenderManager)
+
+    if actor_classes is None:
+        actor_classes = (Actor, DrawnActor, NodeBase, PolygonNode,
+            ImageNode, GridGismo, RenderManager)
+
+    # Don't follow references to other engine objects or widgets.
+    boundary_types = (EngineObject, Misc)
+
+    return {
+        actor_class.__name__: get_deep_size(actor_class(), boundary_types)
+        for actor_class in actor_classes
+        }
@@ -1,5 +1,17 @@
 from math import sqrt
 from random import random
+from functools import lru_cache
+from factorygame.utils.loc import Vec2
+
+## Types handled by scalar fast paths.
+_SCALAR_TYPES = (int, float)
+
+@lru_cache(maxsize=1024)
+def _parse_hex(hex_string):
+    """returns tuple of integer components from '#rrggbb...' hex code.
+    cached as the same colors are usually lerped every frame"""
+    return tuple(int(hex_string[i:i+2], 16)
+        for i in range(1, len(hex_string), 2))
 
 class MathStat(object):
     """Static math library."""
@@ -18,6 +30,10 @@ class MathStat(object):
     def map_range(val, in_a, in_b, out_a=0, out_b=1):
         """returns val mapped from range(in_a to in_b) to range(out_a to out_b)
         eg: 15 mapped from 10,20 to 1,100 returns 50"""
+        if (isinstance(val, _SCALAR_TYPES) and isinstance(out_a, _SCALAR_TYPES)
+            and isinstance(out_b, _SCALAR_TYPES)):
+            # Fast path for plain numbers.
+            return out_a + (out_b - out_a) * ((val - in_a) / (in_b - in_a))
         return MathStat.lerp(out_a, out_b,
             MathStat.getpercent(val, in_a, in_b), False)
 
@@ -33,49 +49,59 @@ class MathStat(object):
         """returns interpolation between a and b. bias 0 = a, bias 1 = b.
         also works with iterables by lerping each element of a and b
         can also extrapolate if clamp is set to False"""
-        def lerp1(a, b, bias):
+        if clamp:
+            if isinstance(bias, (list, tuple)):
+                # Clamp each element's bias.
+                bias = [0 if x < 0 else 1 if x > 1 else x for x in bias]
+            else:
+                bias = 0 if bias < 0 else 1 if bias > 1 else bias
+
+        # Check types in order of how commonly they are used, rather than
+        # trying each in turn and catching the errors.
+        if isinstance(a, _SCALAR_TYPES):
+            # simple lerp
             return a + (b-a) * bias
-        def cross_iter(a, b):
-            for i in range(len(a)):
-                yield a[i], b[i]
-        def cross_iter_str(a, b):
+
+        if isinstance(a, str):
+            # string hex code color lerp
             # format: '#rrggbb...' hex codes
-            # yields integers rr, gg, bb, etc for a and b
-            for i in range(1, len(a)):
-                if i % 2 == 1:
-                    yield int("0x%s"%a[i:i+2], 0), int("0x%s"%b[i:i+2], 0)
-        if clamp:
-            #bias = bias if bias > 0 else 1 if bias > 1 else 0
-            bias = MathStat.clamp(bias)
-        try:
-##                cross_lerp = [lerp1(ax, bx, bias)
-##                              for ax, bx in cross_iter_str(a, b)]
-##                return cross_lerp
+            ret_str = "#"
+            for ax, bx in zip(_parse_hex(a), _parse_hex(b)):
+                ret_str += "%02x"%int(ax + (bx-ax) * bias)
+            return ret_str
 
+        if isinstance(a, (list, tuple)):
             # lerp each element in iterable container
-            cross_lerp = [lerp1(ax, bx, bias) for ax, bx in cross_iter(a, b)]
-            try:
-                return type(a)(*cross_lerp)
-            except:
-                return type(a)(cross_lerp)
-        except:
-            # string hex code color lerp
-            if isinstance(a, str):
-                ret_str = "#"
-                for ax, bx in cross_iter_str(a, b):
-                    ret_str += "%02x"%int(lerp1(ax, bx, bias))
-                return ret_str
-            # simple lerp
-            return lerp1(a, b, bias)
+            if isinstance(bias, (list, tuple)):
+                # Separate bias for each element.
+                cross_lerp = [ax + (bx-ax) * bx_bias
+                    for ax, bx, bx_bias in zip(a, b, bias)]
+            else:
+                cross_lerp = [ax + (bx-ax) * bias for ax, bx in zip(a, b)]
+
+            a_type = type(a)
+            if a_type is list or a_type is tuple:
+                return a_type(cross_lerp)
+            # Subclasses such as Loc and Vec2 take each element.
+            return a_type(*cross_lerp)
+
+        # Other number types, such as arrays.
+        return a + (b-a) * bias
 
     @staticmethod
     def getdistsquared(loc1, loc2):
         """returns squared distance between coords"""
+        if len(loc1) == 2:
+            # Fast path for 2D coords.
+            return (Vec2.from_loc(loc2) - loc1).length_squared()
         return sum((loc2-loc1)**2)
 
     @staticmethod
     def getdist(loc1, loc2):
         """returns distance between coords"""
+        if len(loc1) == 2:
+            # Fast path for 2D coords.
+            return (Vec2.from_loc(loc2) - loc1).length()
         return sqrt(sum((loc2-loc1)**2))
 
     @staticmethod
@@ -0,0 +1,293 @@
+"""
+Read-only binary files of static polygons, such as walls and floors,
+that are memory mapped instead of loaded into Python objects.
+
+A layout stores every polygon's vertices in one packed array of doubles,
+with a uniform grid over their bounding boxes to find the polygons in an
+area. Opening a layout only reads its header. Everything else is read
+from the mapped file when used, so it lives in the page cache rather
+than on the Python heap and opening a large layout is near instant.
+
+All numbers are little-endian. The file is a header followed by these
+sections, each padded to a multiple of 8 bytes:
+
+    bounds          double[num_polygons * 4]  min x, min y, max x, max y
+    vertex_starts   uint64[num_polygons + 1]  first vertex of each polygon
+    vertices        double[num_vertices * 2]  x, y of each vertex
+    cell_keys       int64[num_cells]          sorted keys of grid cells
+    cell_starts     uint64[num_cells + 1]     first item of each cell
+    cell_items      uint32[num_cell_items]    polygons in each cell
+    fill_colors     uint32[num_polygons]      0xRRGGBB fill of each polygon
+    outline_colors  uint32[num_polygons]      0xRRGGBB outline
+"""
+
+import mmap, struct, sys
+from array import array
+from bisect import bisect_left
+from math import floor
+
+## Bytes at the start of every layout file.
+LAYOUT_MAGIC = b"FGLAYOUT"
+
+## Version of the file format written.
+LAYOUT_VERSION = 1
+
+## Header: magic, version, number of polygons, vertices, grid cells and
+## grid cell items, then grid cell size.
+_HEADER = struct.Struct("<8sIIQQQd")
+
+## Each section in order, as tuples of (name, type code, count, values
+## per count, extra values). Counts are polygons (p), vertices (v), grid
+## cells (c) and grid cell items (i).
+_SECTIONS = (
+    ("bounds", "d", "p", 4, 0),
+    ("vertex_starts", "Q", "p", 1, 1),
+    ("vertices", "d", "v", 2, 0),
+    ("cell_keys", "q", "c", 1, 0),
+    ("cell_starts", "Q", "c", 1, 1),
+    ("cell_items", "I", "i", 1, 0),
+    ("fill_colors", "I", "p", 1, 0),
+    ("outline_colors", "I", "p", 1, 0),
+)
+
+def _get_cell_key(col, row):
+    """Return a single sortable integer for a grid cell."""
+    return col * 0x100000000 + (row + 0x80000000)
+
+def _pad_size(size):
+    """Return SIZE rounded up to a multiple of 8."""
+    return (size + 7) & ~7
+
+def _pack_color(color):
+    """Return an (r, g, b) color such as an FColor as 0xRRGGBB."""
+    r, g, b = (max(0, min(255, int(c))) for c in color[:3])
+    return (r << 16) | (g << 8) | b
+
+def write_static_layout(filename, polygons, cell_size=500.0):
+    """
+    Write polygons to a static layout file.
+
+    :param filename: (str) Path of file to write.
+
+    :param polygons: (iterable) Tuples of (vertices, fill color, outline
+    color) for each polygon. Vertices are (x, y) world coordinates, eg
+    a PolygonNode's world_vertices. Colors are (r, g, b), eg FColor. The
+    outline color can be None to match the fill color.
+
+    :param cell_size: (float) Width and height of each grid cell used to
+    find polygons in an area, in world units.
+    """
+    bounds = array("d")
+    vertex_starts = array("Q", [0])
+    vertices = array("d")
+    fill_colors = array("I")
+    outline_colors = array("I")
+    cells = {}
+
+    for index, (polygon_vertices, fill_color, outline_color) in enumerate(
+        polygons):
+        xs = []
+        ys = []
+        for vertex in polygon_vertices:
+            xs.append(float(vertex[0]))
+            ys.append(float(vertex[1]))
+        if len(xs) < 3:
+            raise ValueError("Polygon must have at least 3 vertices")
+
+        for x, y in zip(xs, ys):
+            vertices.append(x)
+            vertices.append(y)
+        vertex_starts.append(len(vertices) // 2)
+
+        box = (min(xs), min(ys), max(xs), max(ys))
+        bounds.extend(box)
+
+        fill = _pack_color(fill_color)
+        fill_colors.append(fill)
+        outline_colors.append(fill if outline_color is None
+            else _pack_color(outline_color))
+
+        for col in range(floor(box[0] / cell_size),
+            floor(box[2] / cell_size) + 1):
+            for row in range(floor(box[1] / cell_size),
+                floor(box[3] / cell_size) + 1):
+                cells.setdefault(_get_cell_key(col, row), []).append(index)
+
+    cell_keys = array("q", sorted(cells))
+    cell_starts = array("Q", [0])
+    cell_items = array("I")
+    for key in cell_keys:
+        cell_items.extend(cells[key])
+        cell_starts.append(len(cell_items))
+
+    sections = (bounds, vertex_starts, vertices, cell_keys, cell_starts,
+        cell_items, fill_colors, outline_colors)
+
+    with open(filename, "wb") as fp:
+        fp.write(_HEADER.pack(LAYOUT_MAGIC, LAYOUT_VERSION,
+            len(fill_colors), len(vertices) // 2, len(cell_keys),
+            len(cell_items), cell_size))
+        fp.write(bytes(_pad_size(_HEADER.size) - _HEADER.size))
+
+        for section in sections:
+            if sys.byteorder != "little":
+                section.byteswap()
+            data = section.tobytes()
+            fp.write(data)
+            fp.write(bytes(_pad_size(len(data)) - len(data)))
+
+class StaticLayout(object):
+    """
+    Memory mapped static layout file written by `write_static_layout`.
+
+    Sections of the file are exposed as memoryviews of the mapped
+    buffer, so reading them doesn't copy the file. Close the layout when
+    done with it, or use it in a `with` statement.
+    """
+
+    def __init__(self, filename):
+        """
+        Map a layout file.
+
+        :param filename: (str) Path of file to open.
+        """
+        if sys.byteorder != "little":
+            raise ValueError("Static layouts can only be read on "
+                "little-endian machines")
+
+        ## Views of each section, cast to their number type.
+        self._views = []
+
+        with open(filename, "rb") as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+
+        try:
+            (magic, version, num_polygons, num_vertices, num_cells,
+                num_cell_items, cell_size) = _HEADER.unpack_from(self._buffer)
+        except struct.error:
+            self.close()
+            raise ValueError("'%s' is not a static layout" % filename)
+        if magic != LAYOUT_MAGIC or version != LAYOUT_VERSION:
+            self.close()
+            raise ValueError("'%s' is not a version %d static layout"
+                % (filename, LAYOUT_VERSION))
+
+        ## Number of polygons in the layout.
+        self.num_polygons = num_polygons
+
+        ## Width and height of each grid cell, in world units.
+        self.cell_size = cell_size
+
+        counts = {"p": num_polygons, "v": num_vertices, "c": num_cells,
+            "i": num_cell_items}
+        offset = _pad_size(_HEADER.size)
+        for name, type_code, count_name, per_count, extra in _SECTIONS:
+            length = counts[count_name] * per_count + extra
+            size = length * struct.calcsize(type_code)
+            if offset + size > len(self._buffer):
+                self.close()
+                raise ValueError("'%s' is truncated" % filename)
+
+            view = self._buffer[offset:offset + size].cast(type_code)
+            self._views.append(view)
+            setattr(self, "_" + name, view)
+            offset += _pad_size(size)
+
+    def __len__(self):
+        return self.num_polygons
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Unmap the file. Does nothing if already closed."""
+        if self._mmap is None:
+            return
+
+        for view in self._views:
+            view.release()
+        self._views = []
+        self._buffer.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views returned from get_vertices are still in use, so the
+            # file is unmapped once they are deleted instead.
+            pass
+        self._mmap = None
+
+    @property
+    def closed(self):
+        """Whether the file has been unmapped."""
+        return self._mmap is None
+
+    def get_vertices(self, index):
+        """
+        Return the vertices of a polygon as a flat view of doubles,
+        x0, y0, x1, y1 and so on. Doesn't copy the file.
+        """
+        starts = self._vertex_starts
+        return self._vertices[starts[index] * 2:starts[index + 1] * 2]
+
+    def get_points(self, index):
+        """Return a list of (x, y) tuples of the vertices of a polygon."""
+        vertices = self.get_vertices(index)
+        return list(zip(vertices[0::2], vertices[1::2]))
+
+    def get_bounds(self, index):
+        """Return the bounding box of a polygon as a tuple of (min x,
+        min y, max x, max y)."""
+        return tuple(self._bounds[index * 4:index * 4 + 4])
+
+    def get_fill_color(self, index):
+        """Return the fill color of a polygon as a hex string, eg
+        '#ff0000'."""
+        return "#%06x" % self._fill_colors[index]
+
+    def get_outline_color(self, index):
+        """Return the outline color of a polygon as a hex string."""
+        return "#%06x" % self._outline_colors[index]
+
+    def query_box(self, bounds):
+        """
+        Return the polygons whose bounding boxes overlap a box.
+
+        :param bounds: (tuple) Box as (min x, min y, max x, max y).
+
+        :return: (list) Sorted indexes of polygons.
+        """
+        min_x, min_y, max_x, max_y = bounds
+        size = self.cell_size
+        min_col, max_col = floor(min_x / size), floor(max_x / size)
+        min_row, max_row = floor(min_y / size), floor(max_y / size)
+
+        cell_keys = self._cell_keys
+        cell_starts = self._cell_starts
+        cell_items = self._cell_items
+        num_cells = len(cell_keys)
+
+        candidates = set()
+        for col in range(min_col, max_col + 1):
+            # Cells in a column have consecutive keys, so find the first
+            # in range and read until past the last.
+            cell = bisect_left(cell_keys, _get_cell_key(col, min_row))
+            last_key = _get_cell_key(col, max_row)
+            while cell < num_cells and cell_keys[cell] <= last_key:
+                candidates.update(
+                    cell_items[cell_starts[cell]:cell_starts[cell + 1]])
+                cell += 1
+
+        polygon_bounds = self._bounds
+        found = []
+        for index in candidates:
+            i = index * 4
+            if (polygon_bounds[i] <= max_x and min_x <= polygon_bounds[i + 2]
+                and polygon_bounds[i + 1] <= max_y
+                and min_y <= polygon_bounds[i + 3]):
+                found.append(index)
+        found.sort()
+        return found
@@ -1,7 +1,9 @@
 """GUI helpers for tkinter application."""
-from tkinter import PhotoImage
+from tkinter import PhotoImage, TclError
 from fractions import Fraction
-import itertools, base64
+from collections import OrderedDict, deque
+from queue import Queue, Empty
+import itertools, threading
 
 from factorygame.utils.loc import Loc
 from factorygame.utils.mymath import MathStat
@@ -209,13 +211,13 @@ class ScalingImage(PhotoImage):
 
     def configure(self, **kw):
         """Configure the image."""
-        # Check if we can store the image data as base64 instead of filename.
+        # Check if we can store the image data instead of filename.
         self._load_image_data(kw)
         super().configure(**kw)
     config = configure
 
     def _load_image_data(self, kw):
-        """Load the image data from FILENAME to base64 encoded data."""
+        """Load the image data from FILENAME to raw image data."""
 
         # Check keywords for valid image data arguments.        
         filename = kw.pop("file", None)
@@ -223,10 +225,7 @@ class ScalingImage(PhotoImage):
 
         if filename:
             with open(filename, "rb") as fp:
-                imgdata = base64.b64encode(fp.read())
-                # For some reason it is faster to decode it straight away!
-                imgdata = base64.b64decode(imgdata)
-                kw["data"] = imgdata
+                imgdata = kw["data"] = fp.read()
 
         elif imgdata is not None: pass
         else: return
@@ -253,14 +252,22 @@ class ScalingImage(PhotoImage):
         self.remainder_tolerance = 1
 
         # Cached image data.        
-        # Use preloaded base64 data so we don't have to read
+        # Use preloaded data so we don't have to read
         # from HDD every time (slower)
         self._imgdata = None
 
+        # Full size image this image was scaled from. If None, this image
+        # is the original.
+        self._original_image = None
+
         # Reference to timer for automatically calling scale_continuous_end
         # after scaling is finished.
         self._end_scale_timer = None
 
+        # Time in milliseconds without further scaling before the timer
+        # calls scale_continuous_end.
+        self.end_scale_delay = 200
+
         # Function to be called when scaling is finished and the reference to the
         # new image must be used somewhere.
         # :param: Reference to new image
@@ -286,27 +293,38 @@ class ScalingImage(PhotoImage):
         """Return a new ScalingImage with the same image as this widget
         but in low quality for fast computation.  Should be used when the
         scaling operation will happen multiple times in quick succession,
-        and the given scale is not final."""
+        and the given scale is not final.
+
+        If `on_assign_image` is set, scale_continuous_end will be called
+        on the new image automatically once scaling has stopped."""
 
         # This should store the input proportions and the current continuous
         # proportion separately so that scale_continuous_end can use the most
         # accurate scaling and this can be as fast as possible.
 
-        # How to make make a timer with _tkinter.tkapp class:
-        # my_timer = self.tk.createtimerhandler(1000, lambda : print("haha"))
-        # my_timer.deletetimerhandler()
-
-        # if self._end_scale_timer is not None:
-        #     # Cancel previously set timer to end scaling.
-        #     self._end_scale_timer.deletetimerhandler()
-
-
         new_img = self._scale(x, y, True)
         new_img.current_fast_input = (x, y)
-        # new_img._end_scale_timer = new_img.tk.createtimerhandler(500, new_img.scale_continuous_end)
+
+        if new_img.on_assign_image is not None:
+            new_img.schedule_scale_continuous_end()
 
         return new_img
 
+    def schedule_scale_continuous_end(self):
+        """Call scale_continuous_end after `end_scale_delay` milliseconds,
+        replacing any previously scheduled call on this image."""
+        self.cancel_scale_continuous_end()
+        self._end_scale_timer = self.tk.createtimerhandler(
+            self.end_scale_delay, self.scale_continuous_end)
+
+    def cancel_scale_continuous_end(self):
+        """Cancel the scheduled call to scale_continuous_end, if any.  Call
+        this on the previous continuous image when scaling again, so only
+        the final scale is computed in high quality."""
+        if self._end_scale_timer is not None:
+            self._end_scale_timer.deletetimerhandler()
+            self._end_scale_timer = None
+
     def scale_continuous_end(self):
         """Return a new ScalingImage with the same image and scale
         as this widget in the highest quality after continuous scaling has
@@ -316,10 +334,8 @@ class ScalingImage(PhotoImage):
         Ensure to assign a function to `on_assign_image` to receive callback
         when the image is finished scaling.
         """
-        if self._end_scale_timer is not None:
-            # Cancel previously set timer to end scaling.
-            self._end_scale_timer.deletetimerhandler()
-            self._end_scale_timer = None
+        # Cancel previously set timer to end scaling.
+        self.cancel_scale_continuous_end()
 
         img = self.get_original_image()
         img = img.scale(*self.current_fast_input)
@@ -411,6 +427,9 @@ class ScalingImage(PhotoImage):
     def get_original_image(self):
         """Return the original full size image. Valid only if an image
         is already loaded (from file or data arguments.)"""
+        if self._original_image is not None:
+            # Reuse the original rather than decoding the data again.
+            return self._original_image
         out_image = ScalingImage(data=self._imgdata, format=self["format"])
         return out_image
 
@@ -434,6 +453,8 @@ class ScalingImage(PhotoImage):
         out_image.current_frac = self.current_frac
         out_image.current_fast_input = self.current_fast_input
         out_image._imgdata = self._imgdata
+        out_image._original_image = (self
+            if self._original_image is None else self._original_image)
         out_image.on_assign_image = self.on_assign_image
         return out_image
 
@@ -466,3 +487,277 @@ class ScalingImage(PhotoImage):
             y = x
         self.tk.call(destImage, 'copy', self.name, '-subsample', x, y)
         return destImage
+
+
+class ScalingImageCache(object):
+    """Shared cache of ScalingImage objects keyed by file path and scale
+    fraction.  Image files are read once while their original image is
+    cached, and their data is shared by every image made from the same
+    file.  Total pixel memory is capped, evicting
+    the least recently used images first.
+
+    Files can be read on a background thread with `load_async`.  Tk can
+    only be used from the Tk thread, so loaded data is put in a queue that
+    the Tk thread checks with `after`.  This works whether events are
+    processed by `mainloop` or by calling `update`.  Scales are
+    precomputed one per idle callback."""
+
+    ## Default limit on the total number of pixels held by the cache.
+    DEFAULT_MAX_PIXELS = 32 * 1024 * 1024
+
+    ## Milliseconds between checks for files read in the background.
+    LOAD_POLL_INTERVAL = 10
+
+    def __init__(self, master=None, max_pixels=None):
+        """Create an empty cache holding at most MAX_PIXELS pixels. MASTER
+        is the widget used to schedule work on the Tk thread."""
+
+        ## Widget used to schedule idle callbacks on the Tk thread.
+        self.master = master
+
+        ## Maximum number of pixels to keep cached before evicting.
+        self.max_pixels = (self.DEFAULT_MAX_PIXELS
+            if max_pixels is None else max_pixels)
+
+        ## Raw file data for each loaded image file, shared between images.
+        ## Dropped when the file's original image is evicted.
+        self._file_data = {}
+
+        ## Cached images in least to most recently used order.
+        ## Keys are (file path, numerator, denominator).
+        self._images = OrderedDict()
+
+        ## Number of pixels held by cached images.
+        self._num_pixels = 0
+
+        ## Callbacks waiting for a file being loaded in the background.
+        self._pending_loads = {}
+
+        ## Tuples of (file path, data, error) read on background threads,
+        ## waiting to be decoded on the Tk thread.
+        self._finished_loads = Queue()
+
+        ## After callback id for checking for finished loads.
+        self._poll_after_id = None
+
+        ## (file path, scale) pairs waiting to be precomputed when idle.
+        self._pending_scales = deque()
+
+        ## Idle callback id for precomputing the next pending scale.
+        self._precompute_after_id = None
+
+    @property
+    def num_pixels(self):
+        return self._num_pixels
+
+    def get_file_data(self, filename):
+        """Return the raw data of FILENAME, only reading it the first time."""
+        imgdata = self._file_data.get(filename)
+        if imgdata is None:
+            with open(filename, "rb") as fp:
+                imgdata = self._file_data[filename] = fp.read()
+        return imgdata
+
+    def load_async(self, filename, callback):
+        """Read FILENAME on a background thread, then call CALLBACK with
+        the original image and None on the Tk thread once it is decoded.
+        If it can't be read or decoded, CALLBACK is called with None and
+        the error instead.  CALLBACK is called immediately if the image is
+        already loaded.  Must be called on the Tk thread."""
+        image = self._get_cached((filename, 1, 1))
+        if image is not None:
+            callback(image, None)
+            return
+
+        callbacks = self._pending_loads.get(filename)
+        if callbacks is not None:
+            # Already loading, so wait for the same file.
+            callbacks.append(callback)
+            return
+
+        self._pending_loads[filename] = [callback]
+        threading.Thread(target=self._read_file_data, args=(filename,),
+            daemon=True).start()
+
+        if self._poll_after_id is None:
+            self._poll_after_id = self.master.after(
+                self.LOAD_POLL_INTERVAL, self._poll_finished_loads)
+
+    def _read_file_data(self, filename):
+        """Read FILENAME on a background thread and queue the data for
+        the Tk thread.  Doesn't use Tk, which isn't thread safe."""
+        imgdata = error = None
+        try:
+            with open(filename, "rb") as fp:
+                imgdata = fp.read()
+        except OSError as e:
+            error = e
+
+        self._finished_loads.put((filename, imgdata, error))
+
+    def _poll_finished_loads(self):
+        """Finish loads read in the background, checking again later while
+        any are still being read."""
+        self._poll_after_id = None
+        try:
+            while True:
+                try:
+                    load = self._finished_loads.get_nowait()
+                except Empty:
+                    break
+                self._finish_load(*load)
+        finally:
+            if self._pending_loads and self._poll_after_id is None:
+                self._poll_after_id = self.master.after(
+                    self.LOAD_POLL_INTERVAL, self._poll_finished_loads)
+
+    def _finish_load(self, filename, imgdata, error):
+        """Decode loaded IMGDATA on the Tk thread and call callbacks
+        waiting for FILENAME with the image and any error."""
+        callbacks = self._pending_loads.pop(filename, None)
+        if callbacks is None:
+            # The cache was cleared while the file was being read.
+            return
+
+        image = None
+        if error is None:
+            self._file_data.setdefault(filename, imgdata)
+            try:
+                image = self.get_original(filename)
+            except TclError as e:
+                # Not an image format Tk can read.
+                self._file_data.pop(filename, None)
+                error = e
+
+        for callback in callbacks:
+            callback(image, error)
+
+    def get_original(self, filename):
+        """Return the full size image for FILENAME."""
+        key = (filename, 1, 1)
+        image = self._get_cached(key)
+        if image is None:
+            image = ScalingImage(data=self.get_file_data(filename))
+            self._add_cached(key, image)
+        return image
+
+    def get_scaled(self, filename, scale):
+        """Return the image for FILENAME scaled by the decimal SCALE, or
+        None if the scale is too small to display."""
+        original = self.get_original(filename)
+        key = self._get_scale_key(original, filename, scale)
+        if key is None:
+            return None
+
+        if key[1] == key[2]:
+            return original
+
+        image = self._get_cached(key)
+        if image is None:
+            # Always scale the original so quality isn't lost.
+            _, numer, denom = key
+            image = original._on_scale(numer, numer, denom, denom)
+            image.current_frac = Loc(Loc(numer, denom), Loc(numer, denom))
+            self._add_cached(key, image)
+        return image
+
+    def find_scaled(self, filename, scale):
+        """Return the image for FILENAME scaled by the decimal SCALE only
+        if it is already cached, otherwise None."""
+        original = self._images.get((filename, 1, 1))
+        if original is None:
+            return None
+
+        key = self._get_scale_key(original, filename, scale)
+        if key is None:
+            return None
+        return self._get_cached(key)
+
+    def _get_scale_key(self, original, filename, scale):
+        """Return the cache key for ORIGINAL scaled by the decimal SCALE,
+        or None if the scale is too small to display."""
+        if not scale:
+            return None
+
+        # Use the same fraction as scaling the image directly would.
+        frac = original._simplify_frac(*original._decimal_to_frac(scale))
+        if frac is None:
+            return None
+
+        numer, denom = frac
+        if numer == denom:
+            return (filename, 1, 1)
+        return (filename, numer, denom)
+
+    def precompute_scales(self, filename, scales):
+        """Scale the image for FILENAME to each decimal in SCALES ahead of
+        time, so later calls to get_scaled are cache hits."""
+        for scale in scales:
+            self.get_scaled(filename, scale)
+
+    def precompute_scales_async(self, filename, scales):
+        """Like precompute_scales, but only scale one image per idle
+        callback so frames aren't blocked."""
+        self._pending_scales.extend((filename, scale) for scale in scales)
+        if self._precompute_after_id is None and self._pending_scales:
+            self._precompute_after_id = self.master.after_idle(
+                self._precompute_next)
+
+    def _precompute_next(self):
+        """Precompute the next pending scale when idle."""
+        self._precompute_after_id = None
+        if not self._pending_scales:
+            return
+
+        filename, scale = self._pending_scales.popleft()
+        self.get_scaled(filename, scale)
+
+        if self._pending_scales:
+            # Idle callbacks added while idle run on the next idle cycle,
+            # so ticks and input are processed in between.
+            self._precompute_after_id = self.master.after_idle(
+                self._precompute_next)
+
+    def clear(self):
+        """Remove all cached images and file data, and cancel pending
+        work."""
+        if self._precompute_after_id is not None:
+            try:
+                self.master.after_cancel(self._precompute_after_id)
+            except TclError:
+                pass
+            self._precompute_after_id = None
+
+        if self._poll_after_id is not None:
+            try:
+                self.master.after_cancel(self._poll_after_id)
+            except TclError:
+                pass
+            self._poll_after_id = None
+
+        self._pending_scales.clear()
+        self._pending_loads.clear()
+        self._file_data.clear()
+        self._images.clear()
+        self._num_pixels = 0
+
+    def _get_cached(self, key):
+        """Return the cached image at KEY, marking it recently used."""
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+        return image
+
+    def _add_cached(self, key, image):
+        """Add IMAGE at KEY then evict old images if over the pixel limit."""
+        self._images[key] = image
+        self._num_pixels += image.width() * image.height()
+
+        # Never evict the image that was just added.
+        while self._num_pixels > self.max_pixels and len(self._images) > 1:
+            (filename, numer, denom), old_image = self._images.popitem(
+                last=False)
+            self._num_pixels -= old_image.width() * old_image.height()
+            if numer == denom:
+                # The file is read again if the original is needed.
+                self._file_data.pop(filename, None)
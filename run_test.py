@@ -16,10 +16,192 @@ else:
 ## Whether to run GUI tests.
 RUN_GUI_TESTS = "nogui" not in sys.argv
 
+## Whether to run unit tests that don't need a GUI.
+RUN_UNIT_TESTS = "nounit" not in sys.argv
+
+## Whether to run benchmarks instead of tests.
+RUN_BENCHMARKS = "bench" in sys.argv
+
 
 if __name__ != "__main__":
     exit(1)
 
+if RUN_BENCHMARKS:
+    # Add benchmark for coordinate types.
+    from test.benchmark import loc_benchmark
+    loc_benchmark.run_benchmark()
+
+    # Add benchmark for math libraries.
+    from test.benchmark import mymath_benchmark
+    mymath_benchmark.run_benchmark()
+
+    # Add benchmark for particles.
+    from test.benchmark import particles_benchmark
+    particles_benchmark.run_benchmark()
+
+    # Add benchmark for entity component system.
+    from test.benchmark import ecs_benchmark
+    ecs_benchmark.run_benchmark()
+
+    # Add benchmark for timers.
+    from test.benchmark import timer_manager_benchmark
+    timer_manager_benchmark.run_benchmark()
+
+    # Add benchmark for bulk spawning.
+    from test.benchmark import spawn_actors_benchmark
+    spawn_actors_benchmark.run_benchmark()
+
+    # Add benchmark for static layouts.
+    from test.benchmark import static_layout_benchmark
+    static_layout_benchmark.run_benchmark()
+
+    exit(0)
+
+if RUN_UNIT_TESTS:
+    import unittest
+    unit_test_suite = unittest.TestSuite()
+    unit_test_loader = unittest.defaultTestLoader
+
+    # Add test for memory footprint.
+    from test.utils.memory_test import MemoryFootprintTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(MemoryFootprintTest))
+
+    # Add test for coordinate types.
+    from test.utils.loc_test import Vec2Test, LocTest
+    unit_test_suite.addTest(unit_test_loader.loadTestsFromTestCase(Vec2Test))
+    unit_test_suite.addTest(unit_test_loader.loadTestsFromTestCase(LocTest))
+
+    # Add test for math libraries.
+    from test.utils.mymath_test import MathStatTest, ArrayMathStatTest
+    unit_test_suite.addTest(unit_test_loader.loadTestsFromTestCase(MathStatTest))
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(ArrayMathStatTest))
+
+    # Add test for colors.
+    from test.utils.colormap_test import FColorPaletteTest, ColorMapTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(FColorPaletteTest))
+    unit_test_suite.addTest(unit_test_loader.loadTestsFromTestCase(ColorMapTest))
+
+    # Add test for polygon generation.
+    from test.core.geom_helper_test import GeomHelperTest
+    unit_test_suite.addTest(unit_test_loader.loadTestsFromTestCase(GeomHelperTest))
+
+    # Add test for polygon nodes.
+    from test.core.polygon_node_test import PolygonNodeTransformTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(PolygonNodeTransformTest))
+
+    # Add test for collision.
+    from test.core.collision_test import (CollisionManagerTest,
+        ProjectileCollisionTest, CollisionQueryTest)
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(CollisionManagerTest))
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(ProjectileCollisionTest))
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(CollisionQueryTest))
+
+    # Add test for bounding volume hierarchy.
+    from test.utils.bvh_test import AABBTreeTest
+    unit_test_suite.addTest(unit_test_loader.loadTestsFromTestCase(AABBTreeTest))
+
+    # Add test for projectile trajectories.
+    from test.components.trajectory_test import ProjectileTrajectoryTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(ProjectileTrajectoryTest))
+
+    # Add test for particles.
+    from test.core.particles_test import ParticleEmitterTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(ParticleEmitterTest))
+
+    # Add test for actor components.
+    from test.core.component_test import ActorComponentTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(ActorComponentTest))
+
+    # Add test for entity component system.
+    from test.core.ecs_test import EntityManagerTest, EntitySystemTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(EntityManagerTest))
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(EntitySystemTest))
+
+    # Add test for timers.
+    from test.core.timer_manager_test import TimerManagerTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(TimerManagerTest))
+
+    # Add test for latent actions.
+    from test.core.latent_test import LatentActionTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(LatentActionTest))
+
+    # Add tests for the shared image cache.
+    from test.utils.image_cache_test import (ScalingImageCacheLoadTest,
+        ScalingImageCacheMemoryTest)
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(ScalingImageCacheLoadTest))
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(ScalingImageCacheMemoryTest))
+
+    # Add test for asyncio tick loop.
+    from test.core.engine_async_test import AsyncTickLoopTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(AsyncTickLoopTest))
+
+    # Add test for delegates and engine events.
+    from test.utils.delegate_test import MulticastDelegateTest, EngineEventTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(MulticastDelegateTest))
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(EngineEventTest))
+
+    # Add test for actor attachment.
+    from test.core.attachment_test import ActorAttachmentTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(ActorAttachmentTest))
+
+    # Add test for bulk spawning.
+    from test.core.spawn_actors_test import SpawnActorsTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(SpawnActorsTest))
+
+    # Add test for actor indexes.
+    from test.core.actor_index_test import ActorIndexTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(ActorIndexTest))
+
+    # Add test for hovered nodes.
+    from test.core.render_manager_test import RenderManagerHoverTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(RenderManagerHoverTest))
+
+    # Add test for significance manager.
+    from test.core.significance_test import SignificanceManagerTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(SignificanceManagerTest))
+
+    # Add test for world partition streaming.
+    from test.core.world_partition_test import WorldPartitionTest
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(WorldPartitionTest))
+
+    # Add tests for static layout files.
+    from test.utils.static_layout_test import (StaticLayoutTest,
+        StaticLayoutCollisionTest)
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(StaticLayoutTest))
+    unit_test_suite.addTest(
+        unit_test_loader.loadTestsFromTestCase(StaticLayoutCollisionTest))
+
+    # Run unit tests before showing any GUI tests.
+    unit_test_result = unittest.TextTestRunner().run(unit_test_suite)
+    if not RUN_GUI_TESTS:
+        exit(not unit_test_result.wasSuccessful())
+
 if RUN_GUI_TESTS:
     # Create gui_test_manager object for root window.
     from test.template.template_gui import GuiTestManager
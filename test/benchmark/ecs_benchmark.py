@@ -0,0 +1,46 @@
+"""Time moving many entities compared with moving the same number of
+plain objects."""
+
+from timeit import timeit
+from factorygame import Loc
+from factorygame.core.ecs import EntityManager, MovementSystem
+
+## Number of entities to move.
+NUM_ENTITIES = 100000
+
+## Number of frames to time.
+NUMBER = 20
+
+class _Mover(object):
+    """Object with a location and velocity, like a simple actor."""
+
+    def __init__(self):
+        self.location = Loc(0.0, 0.0)
+        self.velocity = Loc(10.0, 5.0)
+
+def run_benchmark():
+    """Print time per frame to move entities and objects."""
+    manager = EntityManager()
+    manager.define_component("location", float, (2,))
+    manager.define_component("velocity", float, (2,))
+    manager.create_entities(NUM_ENTITIES, location=(0, 0), velocity=(10, 5))
+    system = MovementSystem()
+
+    def update_entities():
+        for entities, columns in manager.query("location", "velocity"):
+            system.update(16, entities, *columns)
+
+    movers = [_Mover() for _ in range(NUM_ENTITIES)]
+
+    def update_objects():
+        for mover in movers:
+            mover.location += mover.velocity * 0.016
+
+    print("Moving %d entities (%d frames)" % (NUM_ENTITIES, NUMBER))
+    for name, func in (("entities", update_entities),
+        ("objects", update_objects)):
+        frame_time = timeit(func, number=NUMBER) / NUMBER
+        print("  %-12s %.2fms per frame" % (name, frame_time * 1000))
+
+if __name__ == "__main__":
+    run_benchmark()
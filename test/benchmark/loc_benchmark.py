@@ -0,0 +1,28 @@
+"""Compare Loc and Vec2 arithmetic speed."""
+
+from timeit import timeit
+from factorygame.utils.loc import Loc, Vec2
+
+## Number of times to run each statement.
+NUMBER = 100000
+
+def run_benchmark():
+    """Print how long common operations take with Loc and Vec2."""
+    statements = (
+        ("vector add", "a + b"),
+        ("scalar multiply", "a * 2.5"),
+        ("length", "abs(a)"),
+        ("chained", "(a - b) * 0.5 + b"),
+        )
+
+    print("Loc vs Vec2 (%d runs each)" % NUMBER)
+    for name, stmt in statements:
+        loc_time = timeit(stmt, number=NUMBER,
+            globals={"a": Loc(1.5, 2.5), "b": Loc(3.0, 4.0)})
+        vec_time = timeit(stmt, number=NUMBER,
+            globals={"a": Vec2(1.5, 2.5), "b": Vec2(3.0, 4.0)})
+        print("  %-16s Loc %.4fs  Vec2 %.4fs  speedup %.1fx"
+            % (name, loc_time, vec_time, loc_time / vec_time))
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,113 @@
+"""Compare MathStat scalar functions with their implementation before
+type dispatch, and with ArrayMathStat arrays."""
+
+from timeit import timeit
+from random import random
+from factorygame.utils.loc import Loc
+from factorygame.utils.mymath import MathStat
+from factorygame.utils.array_math import ArrayMathStat
+import numpy as np
+
+## Number of values in each batch.
+BATCH_SIZE = 10000
+
+## Number of times to run each batch.
+NUMBER = 10
+
+class _BaselineMathStat(object):
+    """MathStat.lerp and map_range before they dispatched on type, kept
+    to measure the scalar fast paths against."""
+
+    @staticmethod
+    def map_range(val, in_a, in_b, out_a=0, out_b=1):
+        return _BaselineMathStat.lerp(out_a, out_b,
+            MathStat.getpercent(val, in_a, in_b), False)
+
+    @staticmethod
+    def lerp(a, b, bias, clamp=True):
+        def lerp1(a, b, bias):
+            return a + (b-a) * bias
+        def cross_iter(a, b):
+            for i in range(len(a)):
+                yield a[i], b[i]
+        def cross_iter_str(a, b):
+            for i in range(1, len(a)):
+                if i % 2 == 1:
+                    yield int("0x%s"%a[i:i+2], 0), int("0x%s"%b[i:i+2], 0)
+        if clamp:
+            bias = MathStat.clamp(bias)
+        try:
+            cross_lerp = [lerp1(ax, bx, bias) for ax, bx in cross_iter(a, b)]
+            try:
+                return type(a)(*cross_lerp)
+            except:
+                return type(a)(cross_lerp)
+        except:
+            if isinstance(a, str):
+                ret_str = "#"
+                for ax, bx in cross_iter_str(a, b):
+                    ret_str += "%02x"%int(lerp1(ax, bx, bias))
+                return ret_str
+            return lerp1(a, b, bias)
+
+def run_benchmark():
+    """Print how long it takes to process a batch of values and points."""
+    vals = [random() * 100 for _ in range(BATCH_SIZE)]
+    points = [Loc(random() * 100, random() * 100) for _ in range(BATCH_SIZE)]
+    vals_array = np.array(vals)
+    points_array = np.array(points)
+    origin = Loc(0, 0)
+
+    cases = (
+        ("map_range values",
+            lambda: [MathStat.map_range(v, 0, 100, 0, 1920) for v in vals],
+            lambda: ArrayMathStat.map_range(vals_array, 0, 100, 0, 1920)),
+        ("map_range points",
+            lambda: [MathStat.map_range(p, Loc(0, 0), Loc(100, 100),
+                Loc(0, 1080), Loc(1920, 0)) for p in points],
+            lambda: ArrayMathStat.map_range(points_array, (0, 0), (100, 100),
+                (0, 1080), (1920, 0))),
+        ("lerp values",
+            lambda: [MathStat.lerp(0, v, 0.5) for v in vals],
+            lambda: ArrayMathStat.lerp(0, vals_array, 0.5)),
+        ("getdist points",
+            lambda: [MathStat.getdist(origin, p) for p in points],
+            lambda: ArrayMathStat.getdist((0, 0), points_array)),
+        )
+
+    baseline_cases = (
+        ("lerp values",
+            lambda: [_BaselineMathStat.lerp(0, v, 0.5) for v in vals],
+            lambda: [MathStat.lerp(0, v, 0.5) for v in vals]),
+        ("lerp points",
+            lambda: [_BaselineMathStat.lerp(origin, p, 0.5) for p in points],
+            lambda: [MathStat.lerp(origin, p, 0.5) for p in points]),
+        ("lerp hex colors",
+            lambda: [_BaselineMathStat.lerp("#000000", "#ff8040", v / 100)
+                for v in vals],
+            lambda: [MathStat.lerp("#000000", "#ff8040", v / 100)
+                for v in vals]),
+        ("map_range values",
+            lambda: [_BaselineMathStat.map_range(v, 0, 100, 0, 1920)
+                for v in vals],
+            lambda: [MathStat.map_range(v, 0, 100, 0, 1920) for v in vals]),
+        )
+
+    print("MathStat vs before type dispatch (%d items, %d runs each)"
+        % (BATCH_SIZE, NUMBER))
+    for name, baseline_func, scalar_func in baseline_cases:
+        baseline_time = timeit(baseline_func, number=NUMBER)
+        scalar_time = timeit(scalar_func, number=NUMBER)
+        print("  %-18s before %.4fs  MathStat %.4fs  speedup %.1fx"
+            % (name, baseline_time, scalar_time, baseline_time / scalar_time))
+
+    print("MathStat vs ArrayMathStat (%d items, %d runs each)"
+        % (BATCH_SIZE, NUMBER))
+    for name, scalar_func, array_func in cases:
+        scalar_time = timeit(scalar_func, number=NUMBER)
+        array_time = timeit(array_func, number=NUMBER)
+        print("  %-18s MathStat %.4fs  ArrayMathStat %.4fs  speedup %.0fx"
+            % (name, scalar_time, array_time, scalar_time / array_time))
+
+if __name__ == "__main__":
+    run_benchmark()
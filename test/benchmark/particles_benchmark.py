@@ -0,0 +1,45 @@
+"""Time updating and rasterising a large particle emitter."""
+
+from timeit import timeit
+import numpy as np
+from factorygame import Loc
+from factorygame.core.particles import (ParticleEmitter, rasterize_points,
+    encode_png)
+
+## Number of particles to simulate.
+NUM_PARTICLES = 50000
+
+## Number of frames to time.
+NUMBER = 50
+
+def run_benchmark():
+    """Print time per frame for each stage of a full particle emitter."""
+    emitter = ParticleEmitter()
+    emitter.location = Loc(400, 300)
+    emitter.max_particles = NUM_PARTICLES
+    emitter.lifetime_range = (100.0, 100.0)
+    emitter.emit(NUM_PARTICLES)
+
+    # Spread particles over the screen, as they would be after a while.
+    count = emitter.num_particles
+    emitter._positions[:count] = np.random.default_rng(0).uniform(
+        (0, 0), (800, 600), size=(count, 2))
+    colors = emitter._colors[:count]
+    xs = emitter._positions[:count, 0]
+    ys = emitter._positions[:count, 1]
+    _, _, rgba = rasterize_points(xs, ys, colors, 800, 600)
+
+    stages = (
+        ("update", lambda: emitter._update_particles(0.016)),
+        ("rasterize", lambda: rasterize_points(xs, ys, colors, 800, 600)),
+        ("encode png", lambda: encode_png(rgba)),
+        )
+
+    print("ParticleEmitter with %d particles (%d frames)"
+        % (NUM_PARTICLES, NUMBER))
+    for name, func in stages:
+        frame_time = timeit(func, number=NUMBER) / NUMBER
+        print("  %-12s %.2fms per frame" % (name, frame_time * 1000))
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,41 @@
+"""Time spawning many nodes in bulk compared with one at a time."""
+
+from timeit import timeit
+from factorygame import Loc, GameplayStatics
+from factorygame.core.engine_base import World
+from factorygame.core.blueprint import PolygonNode, GeomHelper
+
+## Number of nodes to spawn.
+NUM_ACTORS = 50000
+
+## Number of times to spawn all nodes.
+NUMBER = 3
+
+def run_benchmark():
+    """Print time to spawn nodes with spawn_actor and spawn_actors."""
+    vertices = tuple(GeomHelper.generate_reg_poly(6, radius=20))
+    locations = [Loc(i % 250 * 50, i // 250 * 50) for i in range(NUM_ACTORS)]
+
+    def spawn_one_at_a_time():
+        world = World()
+        GameplayStatics.set_world(world)
+        for location in locations:
+            node = world.deferred_spawn_actor(PolygonNode, location)
+            node.vertices = vertices
+            world.finish_deferred_spawn_actor(node)
+
+    def spawn_in_bulk():
+        world = World()
+        GameplayStatics.set_world(world)
+        world.spawn_actors(PolygonNode, locations, vertices=vertices)
+
+    print("Spawning %d polygon nodes (%d runs)" % (NUM_ACTORS, NUMBER))
+    for name, func in (("spawn_actor", spawn_one_at_a_time),
+        ("spawn_actors", spawn_in_bulk)):
+        run_time = timeit(func, number=NUMBER) / NUMBER
+        print("  %-12s %.0fms" % (name, run_time * 1000))
+
+    GameplayStatics.clear_all()
+
+if __name__ == "__main__":
+    run_benchmark()
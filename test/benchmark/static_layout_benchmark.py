@@ -0,0 +1,61 @@
+"""Time opening and querying a static layout compared with spawning
+polygon nodes."""
+
+import os, tempfile
+from time import perf_counter
+from factorygame import Loc, GameplayStatics
+from factorygame.core.engine_base import World
+from factorygame.core.blueprint import PolygonNode, GeomHelper, FColor
+from factorygame.utils.memory import get_deep_size
+from factorygame.utils.static_layout import write_static_layout, StaticLayout
+
+## Number of polygons in the layout.
+NUM_POLYGONS = 50000
+
+def run_benchmark():
+    """Print time and memory to load polygons as nodes and as a layout."""
+    vertices = tuple(GeomHelper.generate_reg_poly(6, radius=20))
+    locations = [Loc(i % 250 * 50, i // 250 * 50)
+        for i in range(NUM_POLYGONS)]
+    color = FColor.default()
+    view = (2000, 2000, 3000, 3000)
+
+    print("Loading %d static polygons" % NUM_POLYGONS)
+
+    world = World()
+    GameplayStatics.set_world(world)
+    start = perf_counter()
+    nodes = world.spawn_actors(PolygonNode, locations, vertices=vertices)
+    spawn_time = perf_counter() - start
+    start = perf_counter()
+    in_view = [node for node in nodes
+        if node.overlaps_bounds(view[:2], view[2:])]
+    query_time = perf_counter() - start
+    print("  %-14s load %5.0fms  query %6.2fms  %d in view" % (
+        "PolygonNode", spawn_time * 1000, query_time * 1000, len(in_view)))
+    print("  %-14s %.1fMB on heap" % ("",
+        get_deep_size(world._actors) / 1024 / 1024))
+    GameplayStatics.clear_all()
+    del world, nodes, in_view
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        filename = os.path.join(temp_dir, "layout.fgl")
+        write_static_layout(filename, (
+            ([v + location for v in vertices], color, None)
+            for location in locations))
+
+        start = perf_counter()
+        layout = StaticLayout(filename)
+        open_time = perf_counter() - start
+        start = perf_counter()
+        in_view = layout.query_box(view)
+        query_time = perf_counter() - start
+        print("  %-14s open %5.2fms  query %6.2fms  %d in view" % (
+            "StaticLayout", open_time * 1000, query_time * 1000,
+            len(in_view)))
+        print("  %-14s %.1fMB mapped" % ("",
+            os.path.getsize(filename) / 1024 / 1024))
+        layout.close()
+
+if __name__ == "__main__":
+    run_benchmark()
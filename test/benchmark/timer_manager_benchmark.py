@@ -0,0 +1,32 @@
+"""Time firing frames with many active timers."""
+
+from random import Random
+from timeit import timeit
+from factorygame.core.timer_manager import TimerManager
+
+## Number of active timers.
+NUM_TIMERS = 100000
+
+## Number of frames to time.
+NUMBER = 100
+
+def run_benchmark():
+    """Print time per frame and time to set and clear timers."""
+    timers = TimerManager()
+    rng = Random(0)
+    callback = lambda: None
+
+    set_time = timeit(lambda: timers.set_timer(callback,
+        rng.uniform(1.0, 100.0), loop=True), number=NUM_TIMERS)
+    handles = [timers.set_timer(callback, 1000.0) for _ in range(NUM_TIMERS)]
+    frame_time = timeit(lambda: timers.tick(33), number=NUMBER) / NUMBER
+    clear_time = timeit(lambda: timers.clear_timer(handles.pop()),
+        number=NUM_TIMERS)
+
+    print("TimerManager with %d timers" % (NUM_TIMERS * 2))
+    print("  %-12s %.2fus per timer" % ("set", set_time / NUM_TIMERS * 1e6))
+    print("  %-12s %.2fms per frame" % ("tick", frame_time * 1000))
+    print("  %-12s %.2fus per timer" % ("clear", clear_time / NUM_TIMERS * 1e6))
+
+if __name__ == "__main__":
+    run_benchmark()
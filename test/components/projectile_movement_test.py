@@ -12,7 +12,7 @@ from factorygame.core.blueprint import (
 )
 from factorygame.core.input_base import EKeys, EInputEvent
 from factorygame.components.projectile_movement import (
-    ProjectileAimOffsetStruct, ProjectileMovementComponent, HitResult
+    ProjectileAimOffsetStruct, ProjectileMovementComponent
 )
 
 
@@ -28,15 +28,18 @@ class Bullet(PolygonNode):
         self.generate_click_events = False
 
         # Create projectile movement component to move like a projectile.
-        proj = self.projectile_movement = GameplayUtilities.create_engine_object(
+        proj = self.projectile_movement = self.add_component(
             ProjectileMovementComponent
         )
-        proj.owning_actor = self
         proj.max_speed = max_speed_var.get()
+        proj.should_bounce = True
         proj.max_num_bounces = 10
         proj.bounce_speed_multiplier = 1.0 # don't lose speed on bounce
         proj.gravity_strength = grav_scale_var.get()
 
+        ## Number of bounces last frame, to change color when bouncing.
+        self._num_bounces = 0
+
     def begin_play(self):
         super().begin_play()
         if self.projectile_movement:
@@ -47,9 +50,8 @@ class Bullet(PolygonNode):
         self.vertices = tuple(GeomHelper.generate_reg_poly(3, radius=30))
 
     def tick(self, dt):
+        # Projectile movement component has already moved bullet actor.
         proj = self.projectile_movement
-        # Tell projectile movement component to move bullet actor.
-        proj.tick_physics(dt)
 
         # Set triangle vertices at rotation of current velocity.
         rotation = atan2(*proj.velocity)
@@ -57,15 +59,9 @@ class Bullet(PolygonNode):
             3, radius=30, radial_offset=rotation
         ))
 
-        if self.location.y <= 0:
-            # Create the hit result data structure with current state.
-            hit_result = HitResult()
-            hit_result.surface_normal = Loc(0.0, 1.0) # flat upward
-            hit_result.impact_velocity = proj.velocity
-            hit_result.location = self.location
-            hit_result.other_actor = None
-
-            proj.bounce(hit_result)
+        if proj._current_num_bounces != self._num_bounces:
+            # Bounced off the floor this frame.
+            self._num_bounces = proj._current_num_bounces
             self.fill_color = FColor(
                 randrange(0, 256), randrange(0, 256), randrange(0, 256)
             )
@@ -191,6 +187,10 @@ class ProjectileTestWorld(WorldGraph):
         self.spawn_actor(GridGismo, Loc(0, 0))
         self.spawn_actor(AimingPlayer, Loc(0, 0))
 
+        # Add a floor for projectiles to bounce off.
+        self.collision_manager.set_geometry(
+            "floor", (Loc(-100000, 0), Loc(100000, 0)), closed=False)
+
 
 class ProjectileTestEngine(GameEngine):
     """Game engine for testing projectile motion.
@@ -218,9 +218,8 @@ def on_grav_strength_changed(new_gravity):
 
     grav_scale_display_var.set(str(round(float(new_gravity), 3)).ljust(5, "0"))
 
-    for actor in GameplayStatics.world._actors:
-        if isinstance(actor, Bullet):
-            actor.projectile_movement.gravity_strength = float(new_gravity)
+    for actor in GameplayStatics.world.get_all_actors_of_class(Bullet):
+        actor.projectile_movement.gravity_strength = float(new_gravity)
 
 def on_max_speed_changed(new_max_speed):
     if not GameplayStatics.is_game_valid():
@@ -228,9 +227,8 @@ def on_max_speed_changed(new_max_speed):
 
     max_speed_display_var.set(str(round(float(new_max_speed))).rjust(4, "0"))
 
-    for actor in GameplayStatics.world._actors:
-        if isinstance(actor, Bullet):
-            actor.projectile_movement.max_speed = float(new_max_speed)
+    for actor in GameplayStatics.world.get_all_actors_of_class(Bullet):
+        actor.projectile_movement.max_speed = float(new_max_speed)
 
 
 class ProjectileMovementTest(GuiTest):
@@ -0,0 +1,120 @@
+"""Tests for closed form projectile trajectories."""
+
+import unittest
+from factorygame import Loc
+from factorygame.core.collision import CollisionManager
+from factorygame.components.projectile_movement import (
+    ProjectileAimOffsetStruct, ProjectileMovementComponent,
+    ProjectileTrajectory
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class _Owner(object):
+    """Actor stand in with only a location."""
+    def __init__(self, location):
+        self.location = Loc(location)
+
+
+class ProjectileTrajectoryTest(unittest.TestCase):
+
+    def assertLocAlmostEqual(self, first, second, places=6):
+        self.assertAlmostEqual(first[0], second[0], places)
+        self.assertAlmostEqual(first[1], second[1], places)
+
+    def test_matches_tick_physics(self):
+        owner = _Owner(Loc(10, 20))
+        proj = ProjectileMovementComponent()
+        proj.owning_actor = owner
+        proj.enable_collision = False
+        proj.gravity_strength = 0.5
+        proj.rotation_direction = Loc(3, 4)
+        proj.initial_speed = 500
+        proj.launch()
+
+        expected = ProjectileTrajectory.get_location(
+            Loc(10, 20), Loc(300, 400), 50 * 0.02, 0.5, step=0.02)
+        self.assertLocAlmostEqual(proj.predict_location(1.0, step=0.02),
+            expected)
+
+        for _ in range(50):
+            proj.tick_physics(20)
+        self.assertLocAlmostEqual(owner.location, expected)
+        self.assertLocAlmostEqual(proj.velocity,
+            ProjectileTrajectory.get_velocity(Loc(300, 400), 1.0, 0.5))
+
+    def test_get_location(self):
+        location = ProjectileTrajectory.get_location(
+            Loc(0, 0), Loc(100, 0), 2.0)
+        self.assertLocAlmostEqual(location,
+            Loc(200, -0.5 * ProjectileTrajectory.GRAVITY * 4))
+
+    @unittest.skipIf(np is None, "requires NumPy")
+    def test_sample_locations(self):
+        samples = ProjectileTrajectory.sample_locations(
+            Loc(5, 5), Loc(100, 200), 2.0, 11, 0.7)
+        self.assertEqual(samples.shape, (11, 2))
+        for i, sample in enumerate(samples):
+            self.assertLocAlmostEqual(sample, ProjectileTrajectory.get_location(
+                Loc(5, 5), Loc(100, 200), i * 0.2, 0.7))
+
+    def test_solve_launch_velocity(self):
+        start, target = Loc(0, 0), Loc(800, 100)
+        for high_arc in (False, True):
+            velocity = ProjectileTrajectory.solve_launch_velocity(
+                start, target, 1200, high_arc=high_arc)
+            self.assertAlmostEqual(abs(velocity), 1200)
+
+            # Follow the trajectory to when it reaches the target's x.
+            time = target.x / velocity.x
+            self.assertLocAlmostEqual(ProjectileTrajectory.get_location(
+                start, velocity, time), target, 4)
+
+        low = ProjectileTrajectory.solve_launch_velocity(start, target, 1200)
+        high = ProjectileTrajectory.solve_launch_velocity(
+            start, target, 1200, high_arc=True)
+        self.assertLess(low.y, high.y)
+
+        # Aiming backwards.
+        velocity = ProjectileTrajectory.solve_launch_velocity(
+            start, Loc(-800, 100), 1200)
+        self.assertLess(velocity.x, 0)
+
+    def test_out_of_range(self):
+        self.assertIsNone(ProjectileTrajectory.solve_launch_velocity(
+            Loc(0, 0), Loc(100000, 0), 100))
+
+    def test_solve_for_time(self):
+        velocity = ProjectileTrajectory.solve_launch_velocity_for_time(
+            Loc(0, 0), Loc(300, -50), 1.5, 2.0)
+        self.assertLocAlmostEqual(ProjectileTrajectory.get_location(
+            Loc(0, 0), velocity, 1.5, 2.0), Loc(300, -50))
+
+    def test_aim_struct(self):
+        aim = ProjectileAimOffsetStruct(Loc(0, 0))
+        self.assertTrue(aim.set_velocity_to_hit(Loc(500, 0), 1000))
+        self.assertAlmostEqual(abs(aim.fire_velocity), 1000)
+
+        aim.fire_velocity = Loc(1, 1)
+        self.assertFalse(aim.set_velocity_to_hit(Loc(100000, 0), 10))
+        self.assertEqual(aim.fire_velocity, Loc(1, 1))
+
+    def test_predict_hit(self):
+        manager = CollisionManager()
+        manager.set_geometry("floor",
+            (Loc(-10000, 0), Loc(10000, 0)), closed=False)
+
+        # Launched flat, lands after sqrt(2 * h / g) seconds.
+        height = 490.0
+        hit = ProjectileTrajectory.predict_hit(Loc(0, height), Loc(100, 0),
+            manager, 5.0, num_segments=200)
+        self.assertEqual(hit.other_actor, "floor")
+        self.assertAlmostEqual(hit.location.x, 100.0, 0)
+        self.assertAlmostEqual(hit.impact_velocity.y, -980.0, -1)
+
+        self.assertIsNone(ProjectileTrajectory.predict_hit(
+            Loc(0, height), Loc(100, 0), manager, 0.5))
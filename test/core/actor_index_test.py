@@ -0,0 +1,91 @@
+"""Tests for finding actors by class and tag."""
+
+from factorygame import Loc, Actor
+from test.template.template_world import IdleActor, WorldTest
+
+
+class _Conveyor(IdleActor):
+    def __init__(self):
+        super().__init__()
+        self.add_tag("conveyor")
+
+
+class _FastConveyor(_Conveyor):
+    pass
+
+
+class ActorIndexTest(WorldTest):
+
+    def _spawn(self, actor_class):
+        return self.world.spawn_actor(actor_class, Loc(0, 0))
+
+    def test_get_all_actors_of_class(self):
+        idle = self._spawn(IdleActor)
+        conveyor = self._spawn(_Conveyor)
+        fast = self._spawn(_FastConveyor)
+
+        world = self.world
+        self.assertEqual(list(world.get_all_actors_of_class(_Conveyor)),
+            [conveyor, fast])
+        self.assertEqual(list(world.get_all_actors_of_class(_FastConveyor)),
+            [fast])
+        self.assertEqual(list(world.get_all_actors_of_class(Actor)),
+            [idle, conveyor, fast])
+
+    def test_live_view(self):
+        conveyors = self.world.get_all_actors_of_class(_Conveyor)
+        tagged = self.world.get_actors_with_tag("conveyor")
+        self.assertEqual(len(conveyors), 0)
+
+        conveyor = self._spawn(_Conveyor)
+        self.assertEqual(list(conveyors), [conveyor])
+        self.assertEqual(list(tagged), [conveyor])
+
+        self.world.destroy_actor(conveyor)
+        self.world._destroy_pending()
+        self.assertEqual(len(conveyors), 0)
+        self.assertEqual(len(tagged), 0)
+
+    def test_tags(self):
+        conveyor = self._spawn(_Conveyor)
+        idle = self._spawn(IdleActor)
+        self.assertTrue(conveyor.has_tag("conveyor"))
+        self.assertFalse(idle.has_tag("conveyor"))
+        self.assertEqual(idle.tags, frozenset())
+
+        idle.add_tag("conveyor")
+        idle.add_tag("broken")
+        self.assertEqual(list(self.world.get_actors_with_tag("conveyor")),
+            [conveyor, idle])
+
+        conveyor.remove_tag("conveyor")
+        conveyor.remove_tag("missing")
+        self.assertEqual(list(self.world.get_actors_with_tag("conveyor")),
+            [idle])
+        self.assertEqual(idle.tags, {"conveyor", "broken"})
+
+    def test_deferred_spawn(self):
+        actor = self.world.deferred_spawn_actor(IdleActor, Loc(0, 0))
+        actor.add_tag("late")
+        self.assertEqual(len(self.world.get_actors_with_tag("late")), 0)
+        self.assertEqual(len(self.world.get_all_actors_of_class(IdleActor)), 0)
+
+        self.world.finish_deferred_spawn_actor(actor)
+        self.assertEqual(list(self.world.get_actors_with_tag("late")), [actor])
+
+    def test_spawn_actors(self):
+        actors = self.world.spawn_actors(_FastConveyor, [(0, 0)] * 5)
+        self.assertEqual(list(self.world.get_all_actors_of_class(_Conveyor)),
+            actors)
+        self.assertEqual(list(self.world.get_actors_with_tag("conveyor")),
+            actors)
+
+        actors[0].remove_tag("conveyor")
+        self.assertTrue(actors[1].has_tag("conveyor"))
+        self.assertEqual(len(self.world.get_actors_with_tag("conveyor")), 4)
+
+    def test_destroy_world(self):
+        conveyors = self.world.get_all_actors_of_class(_Conveyor)
+        self._spawn(_Conveyor)
+        self.world.begin_destroy()
+        self.assertEqual(len(conveyors), 0)
@@ -0,0 +1,111 @@
+"""Tests for attaching actors to each other."""
+
+from factorygame import Loc
+from test.template.template_world import IdleActor, WorldTest
+
+
+class ActorAttachmentTest(WorldTest):
+
+    def setUp(self):
+        super().setUp()
+        self.parent = self._spawn(100, 100)
+        self.child = self._spawn(110, 120)
+
+    def _spawn(self, x, y):
+        return self.world.spawn_actor(IdleActor, Loc(x, y))
+
+    def test_attach_keeps_world_location(self):
+        self.child.attach_to_actor(self.parent)
+        self.assertIs(self.child.attach_parent, self.parent)
+        self.assertEqual(self.parent.attached_children, (self.child,))
+        self.assertEqual(self.child.location, Loc(110, 120))
+        self.assertEqual(self.child.relative_location, Loc(10, 20))
+
+    def test_attach_keep_relative(self):
+        self.child.attach_to_actor(self.parent, keep_world_location=False)
+        self.assertEqual(self.child.location, Loc(210, 220))
+
+    def test_follow_parent(self):
+        self.child.attach_to_actor(self.parent)
+        self.parent.location = Loc(0, 0)
+        self.assertEqual(self.child.location, Loc(10, 20))
+
+        self.child.location = Loc(50, 50)
+        self.assertEqual(self.child.relative_location, Loc(50, 50))
+        self.parent.location = Loc(-50, 0)
+        self.assertEqual(self.child.location, Loc(0, 50))
+
+        self.child.relative_location = Loc(1, 1)
+        self.assertEqual(self.child.location, Loc(-49, 1))
+
+    def test_deep_hierarchy(self):
+        actors = [self.parent]
+        for i in range(50):
+            actor = self._spawn(100 + i + 1, 100)
+            actor.attach_to_actor(actors[-1])
+            actors.append(actor)
+
+        self.parent.location = Loc(0, 0)
+        self.assertEqual(actors[-1].location, Loc(50, 0))
+
+        # Moving a middle actor moves only those below it.
+        actors[25].location = Loc(0, 500)
+        self.assertEqual(actors[24].location, Loc(24, 0))
+        self.assertEqual(actors[-1].location, Loc(25, 500))
+
+    def test_lazy_update(self):
+        children = [self._spawn(100, 100) for _ in range(1000)]
+        for child in children:
+            child.attach_to_actor(self.parent)
+        for child in children:
+            child.location
+
+        self.parent.location = Loc(0, 0)
+        self.assertTrue(all(child._location_dirty for child in children))
+        self.assertEqual(children[0]._location, Loc(100, 100))
+
+        self.assertEqual(children[0].location, Loc(0, 0))
+        self.assertFalse(children[0]._location_dirty)
+        self.assertTrue(children[1]._location_dirty)
+
+    def test_detach(self):
+        self.child.attach_to_actor(self.parent)
+        self.parent.location = Loc(0, 0)
+        self.child.detach_from_actor()
+
+        self.assertIsNone(self.child.attach_parent)
+        self.assertEqual(self.parent.attached_children, ())
+        self.parent.location = Loc(500, 500)
+        self.assertEqual(self.child.location, Loc(10, 20))
+
+    def test_reattach(self):
+        other = self._spawn(0, 0)
+        self.child.attach_to_actor(self.parent)
+        self.child.attach_to_actor(other)
+        self.assertEqual(self.parent.attached_children, ())
+        self.assertEqual(self.child.relative_location, Loc(110, 120))
+
+    def test_no_loops(self):
+        self.child.attach_to_actor(self.parent)
+        grandchild = self._spawn(0, 0)
+        grandchild.attach_to_actor(self.child)
+
+        with self.assertRaises(ValueError):
+            self.parent.attach_to_actor(grandchild)
+        with self.assertRaises(ValueError):
+            self.parent.attach_to_actor(self.parent)
+
+    def test_destroy_detaches(self):
+        self.child.attach_to_actor(self.parent)
+        self.parent.location = Loc(0, 0)
+        self.parent.begin_destroy()
+
+        self.assertIsNone(self.child.attach_parent)
+        self.assertEqual(self.child.location, Loc(10, 20))
+
+    def test_location_changed_event(self):
+        self.child.attach_to_actor(self.parent)
+        moved = []
+        self.child.on_location_changed.add(moved.append)
+        self.child.relative_location = Loc(0, 0)
+        self.assertEqual(moved, [self.child])
@@ -0,0 +1,190 @@
+"""Tests for collision detection and automatic bouncing."""
+
+import unittest
+from factorygame import Loc
+from factorygame.core.blueprint import PolygonNode
+from factorygame.core.collision import CollisionManager
+from factorygame.components.projectile_movement import (
+    ProjectileMovementComponent
+)
+
+
+class _CollisionWorld(object):
+    """Minimal world holding a collision manager."""
+    def __init__(self, collision_manager):
+        self.collision_manager = collision_manager
+
+
+class CollisionManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = CollisionManager()
+        self.manager.set_geometry("floor",
+            (Loc(-1000, 0), Loc(1000, 0)), closed=False)
+
+    def test_segment_cells(self):
+        cells = list(self.manager._get_segment_cells(10, 10, 450, 10))
+        self.assertEqual(cells, [(0, 0), (1, 0), (2, 0)])
+
+        cells = list(self.manager._get_segment_cells(-10, 10, 10, -10))
+        self.assertIn((-1, 0), cells)
+        self.assertIn((0, -1), cells)
+
+    def test_sweep_hit(self):
+        hit = self.manager.sweep(Loc(50, 100), Loc(150, -100))
+        self.assertIsNotNone(hit)
+        self.assertEqual(hit.other_actor, "floor")
+        self.assertEqual(hit.location, Loc(100, 0))
+        self.assertEqual(hit.surface_normal, Loc(0, 1))
+        self.assertEqual(hit.impact_velocity, Loc(100, -200))
+
+    def test_normal_faces_movement(self):
+        hit = self.manager.sweep(Loc(0, -10), Loc(0, 10))
+        self.assertEqual(hit.surface_normal, Loc(0, -1))
+
+    def test_sweep_miss(self):
+        self.assertIsNone(self.manager.sweep(Loc(0, 100), Loc(500, 1)))
+        self.assertIsNone(self.manager.sweep(Loc(1100, 10), Loc(1100, -10)))
+        self.assertIsNone(self.manager.sweep(Loc(0, 10), Loc(0, 10)))
+
+    def test_nearest_hit(self):
+        self.manager.set_geometry("box",
+            (Loc(-10, 50), Loc(10, 50), Loc(10, 60), Loc(-10, 60)))
+        hit = self.manager.sweep(Loc(0, 100), Loc(0, -100))
+        self.assertEqual(hit.other_actor, "box")
+        self.assertEqual(hit.location, Loc(0, 60))
+
+        hit = self.manager.sweep(Loc(0, 100), Loc(0, -100), ignore="box")
+        self.assertEqual(hit.other_actor, "floor")
+
+    def test_remove_collider(self):
+        self.manager.remove_collider("floor")
+        self.assertIsNone(self.manager.sweep(Loc(0, 10), Loc(0, -10)))
+        self.assertEqual(self.manager._cells, {})
+
+    def test_polygon_node_follows_movement(self):
+        node = PolygonNode()
+        node.location = Loc(500, 500)
+        node.vertices = (Loc(-10, -10), Loc(10, -10), Loc(0, 10))
+        self.manager.add_collider(node)
+        self.manager.tick(0)
+
+        hit = self.manager.sweep(Loc(500, 400), Loc(500, 600))
+        self.assertIs(hit.other_actor, node)
+        self.assertEqual(hit.location, Loc(500, 490))
+
+        node.location = Loc(-500, 500)
+        self.manager.tick(0)
+        self.assertIsNone(self.manager.sweep(Loc(500, 400), Loc(500, 600)))
+        hit = self.manager.sweep(Loc(-500, 400), Loc(-500, 600))
+        self.assertIs(hit.other_actor, node)
+
+
+class ProjectileCollisionTest(unittest.TestCase):
+
+    def setUp(self):
+        manager = CollisionManager()
+        manager.set_geometry("floor",
+            (Loc(-1000, 0), Loc(1000, 0)), closed=False)
+
+        self.actor = PolygonNode()
+        self.actor._world = _CollisionWorld(manager)
+        self.actor.location = Loc(0, 5)
+
+        proj = self.proj = ProjectileMovementComponent()
+        proj.owning_actor = self.actor
+        proj.gravity_strength = 0.0
+        proj.bounce_speed_multiplier = 1.0
+        proj.rotation_direction = Loc(1, -1)
+        proj.initial_speed = 1000
+        proj.launch()
+
+    def test_bounce_on_hit(self):
+        self.proj.should_bounce = True
+        self.proj.tick_physics(100)
+
+        self.assertEqual(self.proj._current_num_bounces, 1)
+        self.assertAlmostEqual(self.actor.location.y, 0.01)
+        self.assertGreater(self.proj.velocity.x, 0)
+        self.assertGreater(self.proj.velocity.y, 0)
+        self.assertAlmostEqual(abs(self.proj.velocity), 1000)
+
+    def test_stop_on_hit(self):
+        self.proj.tick_physics(100)
+
+        self.assertFalse(self.proj.enable_simulation)
+        self.assertAlmostEqual(self.actor.location.x, 5)
+        self.assertEqual(self.proj.velocity, Loc(0, 0))
+
+    def test_no_hit(self):
+        self.actor.location = Loc(0, 500)
+        self.proj.tick_physics(100)
+
+        self.assertTrue(self.proj.enable_simulation)
+        self.assertAlmostEqual(self.actor.location.y, 500 - 100 / 2 ** 0.5)
+
+
+class CollisionQueryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = CollisionManager()
+        self.manager.set_geometry("near",
+            (Loc(100, -10), Loc(110, -10), Loc(110, 10), Loc(100, 10)))
+        self.manager.set_geometry("far",
+            (Loc(300, -10), Loc(310, -10), Loc(310, 10), Loc(300, 10)))
+        self.manager.set_geometry("wall",
+            (Loc(200, -500), Loc(200, 500)), closed=False)
+
+    def test_line_trace_sorted(self):
+        hits = self.manager.line_trace(Loc(0, 0), Loc(400, 0))
+        self.assertEqual([hit.other_actor for hit in hits],
+            ["near", "wall", "far"])
+        self.assertEqual(hits[0].location, Loc(100, 0))
+        self.assertEqual(hits[0].surface_normal, Loc(-1, 0))
+        self.assertEqual(hits[2].location, Loc(300, 0))
+
+        hits = self.manager.line_trace(Loc(400, 0), Loc(0, 0), ignore="wall")
+        self.assertEqual([hit.other_actor for hit in hits], ["far", "near"])
+        self.assertEqual(hits[0].location, Loc(310, 0))
+
+    def test_line_trace_miss(self):
+        self.assertEqual(self.manager.line_trace(Loc(0, 50), Loc(150, 50)), [])
+
+    def test_multi_line_trace(self):
+        results = self.manager.multi_line_trace(
+            (Loc(0, 0), Loc(0, 100), Loc(250, 0)),
+            (Loc(150, 0), Loc(150, 100), Loc(350, 0)))
+        self.assertEqual([[hit.other_actor for hit in hits] for hits in results],
+            [["near"], [], ["far"]])
+
+    def test_sphere_overlap(self):
+        hits = self.manager.sphere_overlap(Loc(150, 0), 60)
+        self.assertEqual([hit.other_actor for hit in hits], ["near", "wall"])
+        self.assertEqual(hits[0].location, Loc(110, 0))
+        self.assertEqual(hits[0].surface_normal, Loc(1, 0))
+
+        hits = self.manager.sphere_overlap(Loc(105, 0), 1)
+        self.assertEqual([hit.other_actor for hit in hits], ["near"])
+        self.assertEqual(hits[0].location, Loc(105, 0))
+
+    def test_box_overlap(self):
+        hits = self.manager.box_overlap(Loc(190, -5), Loc(305, 5))
+        self.assertEqual([hit.other_actor for hit in hits], ["wall", "far"])
+
+        # Box inside a polygon, and polygon crossing a box edge.
+        hits = self.manager.box_overlap(Loc(102, -2), Loc(104, 2))
+        self.assertEqual([hit.other_actor for hit in hits], ["near"])
+        hits = self.manager.box_overlap(Loc(105, 5), Loc(150, 50))
+        self.assertEqual([hit.other_actor for hit in hits], ["near"])
+
+        self.assertEqual(self.manager.box_overlap(Loc(0, 50), Loc(50, 60)), [])
+
+    def test_queries_follow_changes(self):
+        self.manager.set_geometry("near",
+            (Loc(0, 1000), Loc(10, 1000), Loc(10, 1010)))
+        hits = self.manager.line_trace(Loc(0, 0), Loc(150, 0))
+        self.assertEqual(hits, [])
+
+        self.manager.remove_collider("far")
+        hits = self.manager.line_trace(Loc(0, 0), Loc(400, 0))
+        self.assertEqual([hit.other_actor for hit in hits], ["wall"])
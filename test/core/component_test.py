@@ -0,0 +1,116 @@
+"""Tests for actor components and batched component ticking."""
+
+from factorygame import Loc, ActorComponent
+from factorygame.core.engine_base import ETickGroup
+from factorygame.components.projectile_movement import (
+    ProjectileMovementComponent
+)
+from test.template.template_world import IdleActor, WorldTest
+
+
+class _CountingComponent(ActorComponent):
+    def __init__(self):
+        super().__init__()
+        self.began_play = False
+        self.num_ticks = 0
+
+    def begin_play(self):
+        self.began_play = True
+
+    def tick_component(self, delta_time):
+        self.num_ticks += 1
+
+
+class _BatchComponent(ActorComponent):
+    ## Batches received by all components of this class.
+    batches = []
+
+    @classmethod
+    def tick_batch(cls, components, delta_time):
+        cls.batches.append(components)
+
+
+class _PassiveComponent(ActorComponent):
+    pass
+
+
+class _ComponentActor(IdleActor):
+    def __init__(self):
+        super().__init__()
+        self.counter = self.add_component(_CountingComponent)
+        self.counter_began_first = None
+
+    def begin_play(self):
+        self.counter_began_first = self.counter.began_play
+
+
+class ActorComponentTest(WorldTest):
+
+    def setUp(self):
+        super().setUp()
+        _BatchComponent.batches = []
+
+    def test_owner_bound(self):
+        actor = self.world.spawn_actor(_ComponentActor, Loc(0, 0))
+        self.assertIs(actor.counter.owning_actor, actor)
+        self.assertIs(actor.get_component(_CountingComponent), actor.counter)
+        self.assertIsNone(actor.get_component(_BatchComponent))
+
+    def test_begin_play_before_actor(self):
+        actor = self.world.spawn_actor(_ComponentActor, Loc(0, 0))
+        self.assertTrue(actor.counter_began_first)
+
+        late = actor.add_component(_CountingComponent)
+        self.assertTrue(late.began_play)
+
+    def test_components_tick(self):
+        actors = [self.world.spawn_actor(_ComponentActor, Loc(0, 0))
+            for _ in range(3)]
+        self.world._tick_groups(20)
+        self.world._tick_groups(20)
+        for actor in actors:
+            self.assertEqual(actor.counter.num_ticks, 2)
+
+    def test_batched_by_class(self):
+        actors = [self.world.spawn_actor(_ComponentActor, Loc(0, 0))
+            for _ in range(3)]
+        batch_components = [actor.add_component(_BatchComponent)
+            for actor in actors]
+
+        self.world._tick_groups(20)
+        self.assertEqual(_BatchComponent.batches, [tuple(batch_components)])
+
+    def test_tick_group(self):
+        actor = self.world.spawn_actor(_ComponentActor, Loc(0, 0))
+        self.assertIn(actor.counter,
+            self.world._ticking_components[ETickGroup.GAME][_CountingComponent])
+
+    def test_passive_component_not_ticked(self):
+        actor = self.world.spawn_actor(_ComponentActor, Loc(0, 0))
+        actor.add_component(_PassiveComponent)
+        self.assertNotIn(_PassiveComponent,
+            self.world._ticking_components[ETickGroup.GAME])
+
+    def test_destroy(self):
+        actor = self.world.spawn_actor(_ComponentActor, Loc(0, 0))
+        other = actor.add_component(_CountingComponent)
+        actor.destroy_component(other)
+        self.assertEqual(actor.components, (actor.counter,))
+
+        self.world._tick_groups(20)
+        self.assertEqual(other.num_ticks, 0)
+
+        actor.begin_destroy()
+        self.world._tick_groups(20)
+        self.assertEqual(actor.counter.num_ticks, 1)
+
+    def test_projectile_moves_automatically(self):
+        actor = self.world.spawn_actor(_ComponentActor, Loc(0, 100))
+        proj = actor.add_component(ProjectileMovementComponent)
+        proj.gravity_strength = 0.0
+        proj.rotation_direction = Loc(1, 0)
+        proj.initial_speed = 100
+        proj.launch()
+
+        self.world._tick_groups(500)
+        self.assertEqual(actor.location, Loc(50, 100))
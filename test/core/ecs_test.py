@@ -0,0 +1,158 @@
+"""Tests for entity component storage and systems."""
+
+import unittest
+from factorygame import Loc
+from factorygame.core.engine_base import ETickGroup
+from test.template.template_world import WorldTest
+
+try:
+    import numpy as np
+    from factorygame.core.ecs import EntityManager, EntitySystem, MovementSystem
+except ImportError:
+    np = None
+
+
+if np is not None:
+    class _AgeSystem(EntitySystem):
+        required_components = ("age",)
+
+        def update(self, delta_time, entities, ages):
+            ages += 1
+
+
+@unittest.skipIf(np is None, "requires NumPy")
+class EntityManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = EntityManager()
+        self.manager.define_component("location", float, (2,))
+        self.manager.define_component("velocity", float, (2,))
+        self.manager.define_component("age", int)
+
+    def test_create_entities(self):
+        entities = self.manager.create_entities(5, location=(1, 2), age=3)
+        self.assertEqual(list(entities), [0, 1, 2, 3, 4])
+        self.assertEqual(self.manager.num_entities, 5)
+
+        entity = self.manager.create_entity(age=7)
+        self.assertEqual(entity, 5)
+        self.assertEqual(self.manager.get_entity_component(entity, "age"), 7)
+        np.testing.assert_array_equal(
+            self.manager.get_entity_component(2, "location"), (1, 2))
+
+    def test_per_entity_values(self):
+        self.manager.create_entities(3, age=np.array([10, 20, 30]))
+        self.assertEqual(self.manager.get_entity_component(1, "age"), 20)
+
+    def test_undefined_component(self):
+        with self.assertRaises(KeyError):
+            self.manager.create_entity(colour=1)
+
+    def test_query(self):
+        self.manager.create_entities(3, location=(0, 0), velocity=(1, 0))
+        self.manager.create_entities(2, location=(5, 5))
+        self.manager.create_entities(4, location=(0, 0), velocity=(0, 1),
+            age=0)
+
+        results = list(self.manager.query("location", "velocity"))
+        self.assertEqual([len(entities) for entities, _ in results], [3, 4])
+
+        # Columns are views into storage.
+        for entities, (locations, velocities) in results:
+            locations += velocities
+        np.testing.assert_array_equal(
+            self.manager.get_entity_component(0, "location"), (1, 0))
+        np.testing.assert_array_equal(
+            self.manager.get_entity_component(8, "location"), (0, 1))
+
+        self.assertEqual(sum(len(e) for e, _ in self.manager.query("location")), 9)
+
+    def test_destroy_entity(self):
+        self.manager.create_entities(4, age=np.arange(4))
+        self.manager.destroy_entity(1)
+        self.manager.destroy_entity(1)
+
+        self.assertFalse(self.manager.is_entity_valid(1))
+        self.assertEqual(self.manager.num_entities, 3)
+        entities, (ages,) = next(self.manager.query("age"))
+        self.assertEqual(sorted(entities), [0, 2, 3])
+        for entity in (0, 2, 3):
+            self.assertEqual(self.manager.get_entity_component(entity, "age"),
+                entity)
+
+    def test_access_after_destroy(self):
+        entity = self.manager.create_entity(age=1)
+        other = self.manager.create_entity(age=2)
+        self.manager.destroy_entity(entity)
+
+        with self.assertRaises(KeyError):
+            self.manager.get_entity_component(entity, "age")
+        with self.assertRaises(KeyError):
+            self.manager.set_entity_component(entity, "age", 99)
+        with self.assertRaises(KeyError):
+            self.manager.has_entity_component(entity, "age")
+        with self.assertRaises(KeyError):
+            self.manager.remove_entity_component(entity, "age")
+        with self.assertRaises(KeyError):
+            self.manager.get_entity_component(100, "age")
+        self.assertEqual(self.manager.get_entity_component(other, "age"), 2)
+
+    def test_destroy_entities(self):
+        self.manager.create_entities(6, age=np.arange(6))
+        self.manager.create_entities(2, age=0, location=(0, 0))
+        self.manager.destroy_entities([0, 4, 6, 4, 100])
+
+        self.assertEqual(self.manager.num_entities, 5)
+        self.assertEqual(sum(len(e) for e, _ in self.manager.query("age")), 5)
+        for entity in (1, 2, 3, 5):
+            self.assertEqual(self.manager.get_entity_component(entity, "age"),
+                entity)
+        self.assertTrue(self.manager.is_entity_valid(7))
+
+    def test_change_components(self):
+        entity = self.manager.create_entity(age=4)
+        other = self.manager.create_entity(age=5)
+        self.manager.set_entity_component(entity, "location", (3, 4))
+
+        self.assertTrue(self.manager.has_entity_component(entity, "location"))
+        self.assertEqual(self.manager.get_entity_component(entity, "age"), 4)
+        self.assertEqual(self.manager.get_entity_component(other, "age"), 5)
+        np.testing.assert_array_equal(
+            self.manager.get_entity_component(entity, "location"), (3, 4))
+
+        self.manager.remove_entity_component(entity, "age")
+        self.assertFalse(self.manager.has_entity_component(entity, "age"))
+        self.assertEqual([list(e) for e, _ in self.manager.query("age")],
+            [[other]])
+
+
+@unittest.skipIf(np is None, "requires NumPy")
+class EntitySystemTest(WorldTest):
+
+    def setUp(self):
+        super().setUp()
+
+        self.manager = self.world.spawn_actor(EntityManager, Loc(0, 0))
+        self.manager.define_component("location", float, (2,))
+        self.manager.define_component("velocity", float, (2,))
+        self.manager.define_component("age", int)
+
+    def test_systems_tick(self):
+        self.manager.add_system(MovementSystem)
+        self.manager.add_system(_AgeSystem)
+        self.manager.create_entities(1000, location=(0, 0), velocity=(10, 5),
+            age=0)
+
+        self.world._tick_groups(100)
+        self.world._tick_groups(100)
+
+        for entities, (locations, ages) in self.manager.query("location", "age"):
+            np.testing.assert_allclose(locations, [(2, 1)] * 1000)
+            np.testing.assert_array_equal(ages, 2)
+
+    def test_system_tick_group(self):
+        system = self.manager.add_system(MovementSystem)
+        self.assertEqual(system.primary_component_tick.tick_group,
+            ETickGroup.PHYSICS)
+        self.assertIn(system,
+            self.world._ticking_components[ETickGroup.PHYSICS][MovementSystem])
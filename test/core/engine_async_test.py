@@ -0,0 +1,96 @@
+"""Tests for running the world tick loop in an asyncio event loop."""
+
+import asyncio
+from factorygame import Loc, Actor, GameEngine, GameplayStatics
+from factorygame.core.latent import delay
+from test.template.template_world import WorldTest
+from test.utils.image_cache_test import StubMaster, DataImageCache, IMAGE_PATH
+
+
+class _CountingActor(Actor):
+    def __init__(self):
+        super().__init__()
+        self.num_ticks = 0
+
+    def tick(self, delta_time):
+        self.num_ticks += 1
+
+
+class _FastEngine(GameEngine):
+    def __init__(self):
+        super().__init__()
+        self._frame_rate = 100
+        self._use_asyncio = True
+
+
+class AsyncTickLoopTest(WorldTest):
+
+    def setUp(self):
+        # Set up the parts of the engine used by the world, without a
+        # window.
+        self.engine = _FastEngine()
+        self.engine._event_loop = self.loop = asyncio.new_event_loop()
+        GameplayStatics.set_game_engine(self.engine)
+
+        super().setUp()
+        self.world.__init_world__(None)
+
+    def tearDown(self):
+        self.world.begin_destroy()
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.loop.close()
+        super().tearDown()
+
+    def test_tick_task(self):
+        self.assertIsNotNone(self.world._tick_task)
+        actor = self.world.spawn_actor(_CountingActor, Loc(0, 0))
+
+        self.loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertGreaterEqual(actor.num_ticks, 3)
+
+    def test_async_io_alongside_ticks(self):
+        actor = self.world.spawn_actor(_CountingActor, Loc(0, 0))
+        ticks_during_io = []
+
+        async def slow_io():
+            # Stand in for awaiting a file or socket.
+            await asyncio.sleep(0.05)
+            ticks_during_io.append(actor.num_ticks)
+
+        self.loop.run_until_complete(
+            self.engine.event_loop.create_task(slow_io()))
+        self.assertGreaterEqual(ticks_during_io[0], 2)
+
+    def test_latent_actions(self):
+        fired = []
+        async def wait():
+            await delay(0.02)
+            fired.append(True)
+
+        self.world.latent_action_manager.start(wait())
+        self.loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertEqual(fired, [True])
+
+    def test_destroy_stops_ticking(self):
+        task = self.world._tick_task
+        actor = self.world.spawn_actor(_CountingActor, Loc(0, 0))
+        self.world.begin_destroy()
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+
+        self.assertTrue(task.cancelled())
+        self.assertLessEqual(actor.num_ticks, 1)
+
+    def test_image_load_while_pumping_window(self):
+        # The window is updated by the event loop instead of mainloop.
+        master = self.engine._window = StubMaster()
+        cache = DataImageCache(master)
+        loaded = []
+
+        def on_loaded(image, error):
+            loaded.append(error)
+            master.destroyed = True
+
+        cache.load_async(IMAGE_PATH, on_loaded)
+        self.loop.run_until_complete(
+            asyncio.wait_for(self.engine._pump_window_events(), 5))
+        self.assertEqual(loaded, [None])
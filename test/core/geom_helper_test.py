@@ -0,0 +1,57 @@
+"""Tests for generating polygon vertices."""
+
+import unittest, math
+from factorygame import Loc
+from factorygame.core.blueprint import GeomHelper
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class GeomHelperTest(unittest.TestCase):
+
+    def assertLocsAlmostEqual(self, first, second):
+        self.assertEqual(len(first), len(second))
+        for a, b in zip(first, second):
+            self.assertAlmostEqual(a.x, b[0])
+            self.assertAlmostEqual(a.y, b[1])
+
+    def test_reg_poly(self):
+        vertices = list(GeomHelper.generate_reg_poly(
+            4, radius=2, center=Loc(10, 20)))
+        self.assertIsInstance(vertices[0], Loc)
+        root2 = math.sqrt(2)
+        self.assertLocsAlmostEqual(vertices, [
+            (10 + root2, 20 + root2), (10 + root2, 20 - root2),
+            (10 - root2, 20 - root2), (10 - root2, 20 + root2)])
+
+    def test_reg_poly_radial_offset(self):
+        vertices = list(GeomHelper.generate_reg_poly(
+            3, radial_offset=math.pi / 2))
+        self.assertAlmostEqual(vertices[0].x, 1.0)
+        self.assertAlmostEqual(vertices[0].y, 0.0)
+
+    def test_template_cached(self):
+        template = GeomHelper.get_shape_template(6)
+        self.assertIs(GeomHelper.get_shape_template(6), template)
+        self.assertIsNot(GeomHelper.get_shape_template(6, 0.5), template)
+
+    @unittest.skipIf(np is None, "requires NumPy")
+    def test_batch_matches_single(self):
+        centers = [(0, 0), (100, -50), (3.5, 7)]
+        radii = [1, 20, 0.5]
+        vertices = GeomHelper.generate_reg_polys(5, centers, radii, 0.25)
+        self.assertEqual(vertices.shape, (3, 5, 2))
+        self.assertTrue(vertices.flags.c_contiguous)
+
+        for center, radius, poly in zip(centers, radii, vertices):
+            self.assertLocsAlmostEqual(list(GeomHelper.generate_reg_poly(
+                5, center=center, radius=radius, radial_offset=0.25)), poly)
+
+    @unittest.skipIf(np is None, "requires NumPy")
+    def test_batch_shared_radius(self):
+        vertices = GeomHelper.generate_reg_polys(3, [(1, 1), (2, 2)], 10)
+        self.assertEqual(vertices.shape, (2, 3, 2))
+        np.testing.assert_allclose(vertices[1] - vertices[0], 1.0)
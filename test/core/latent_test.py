@@ -0,0 +1,148 @@
+"""Tests for latent actions."""
+
+from factorygame import Loc
+from factorygame.core.latent import delay, next_tick, until
+from test.template.template_world import IdleActor, WorldTest
+
+
+class _Waiter(IdleActor):
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    async def fire_after(self, seconds):
+        self.events.append("start")
+        await delay(seconds)
+        self.events.append("fire")
+
+    def count_frames(self, count):
+        for i in range(count):
+            self.events.append(i)
+            yield next_tick()
+
+
+class LatentActionTest(WorldTest):
+
+    def setUp(self):
+        super().setUp()
+        self.actor = self.world.spawn_actor(_Waiter, Loc(0, 0))
+
+    def _step(self, dt=100, count=1):
+        """Resume actions like the world's tick loop."""
+        for _ in range(count):
+            self.world.latent_action_manager.tick()
+            self.world.timer_manager.tick(dt)
+
+    def test_delay(self):
+        action = self.actor.start_latent_action(self.actor.fire_after(0.5))
+        self.assertEqual(self.actor.events, ["start"])
+        self.assertTrue(action.is_running)
+
+        self._step(count=4)
+        self.assertEqual(self.actor.events, ["start"])
+        self._step()
+        self.assertEqual(self.actor.events, ["start", "fire"])
+        self.assertFalse(action.is_running)
+        self.assertEqual(len(self.world.latent_action_manager), 0)
+        self.assertEqual(self.actor._latent_actions, {})
+
+    def test_next_tick_generator(self):
+        self.actor.start_latent_action(self.actor.count_frames(3))
+        self.assertEqual(self.actor.events, [0])
+        self._step()
+        self.assertEqual(self.actor.events, [0, 1])
+        self._step(count=5)
+        self.assertEqual(self.actor.events, [0, 1, 2])
+
+    def test_until(self):
+        state = {"ready": False, "checks": 0}
+        def is_ready():
+            state["checks"] += 1
+            return state["ready"]
+
+        async def wait():
+            await until(is_ready)
+            self.actor.events.append("ready")
+            await until(lambda: True)
+            self.actor.events.append("done")
+
+        self.actor.start_latent_action(wait())
+        self._step(count=3)
+        self.assertEqual(self.actor.events, [])
+        self.assertEqual(state["checks"], 4)
+
+        state["ready"] = True
+        self._step()
+        self.assertEqual(self.actor.events, ["ready", "done"])
+
+    def test_delay_then_next_tick(self):
+        async def wait():
+            await delay(0.1)
+            self.actor.events.append("delayed")
+            await next_tick()
+            self.actor.events.append("ticked")
+
+        self.actor.start_latent_action(wait())
+        self._step()
+        self.assertEqual(self.actor.events, ["delayed"])
+        self._step()
+        self.assertEqual(self.actor.events, ["delayed", "ticked"])
+
+    def test_stop(self):
+        cleaned_up = []
+        async def wait():
+            try:
+                await delay(1.0)
+                self.actor.events.append("fire")
+            finally:
+                cleaned_up.append(True)
+
+        action = self.actor.start_latent_action(wait())
+        self.actor.stop_latent_action(action)
+        self.assertEqual(cleaned_up, [True])
+        self.assertEqual(len(self.world.timer_manager), 0)
+
+        self._step(count=20)
+        self.assertEqual(self.actor.events, [])
+
+    def test_stop_self(self):
+        async def wait():
+            await next_tick()
+            self.actor.stop_all_latent_actions()
+            await next_tick()
+            self.actor.events.append("resumed")
+
+        action = self.actor.start_latent_action(wait())
+        self._step()
+        self.assertFalse(action.is_running)
+        self._step(count=2)
+        self.assertEqual(self.actor.events, [])
+        self.assertEqual(len(self.world.latent_action_manager), 0)
+
+    def test_destroy_stops_actions(self):
+        self.actor.start_latent_action(self.actor.fire_after(0.1))
+        self.actor.start_latent_action(self.actor.count_frames(10))
+        self.actor.begin_destroy()
+        self.assertEqual(len(self.world.latent_action_manager), 0)
+
+        self._step(count=5)
+        self.assertEqual(self.actor.events, ["start", 0])
+
+    def test_invalid_wait(self):
+        def bad():
+            yield 5
+
+        with self.assertRaises(TypeError):
+            self.world.latent_action_manager.start(bad())
+        self.assertEqual(len(self.world.latent_action_manager), 0)
+
+    def test_waiting_actions_cost_nothing(self):
+        actors = [self.world.spawn_actor(_Waiter, Loc(0, 0))
+            for _ in range(1000)]
+        for actor in actors:
+            actor.start_latent_action(actor.fire_after(10.0))
+
+        manager = self.world.latent_action_manager
+        self.assertEqual(len(manager), 1000)
+        self.assertEqual(manager._next_tick, [])
+        self.assertEqual(manager._waiting_until, [])
@@ -0,0 +1,110 @@
+"""Tests for particle emitters."""
+
+import unittest, struct, zlib
+from factorygame import Loc, FColor
+
+try:
+    import numpy as np
+    from factorygame.core.particles import (ParticleEmitter,
+        rasterize_points, encode_png)
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "requires NumPy")
+class ParticleEmitterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.emitter = ParticleEmitter()
+        self.emitter.location = Loc(100, 50)
+        self.emitter.max_particles = 1000
+        self.emitter.lifetime_range = (1.0, 1.0)
+        self.emitter.speed_range = (10.0, 10.0)
+
+    def test_emit(self):
+        self.assertEqual(self.emitter.emit(10), 10)
+        self.assertEqual(self.emitter.num_particles, 10)
+        np.testing.assert_array_equal(self.emitter._positions[:10],
+            [(100, 50)] * 10)
+
+        speeds = np.hypot(*self.emitter._velocities[:10].T)
+        np.testing.assert_allclose(speeds, 10.0)
+
+    def test_capacity(self):
+        self.assertEqual(self.emitter.emit(5000), 1000)
+        self.assertEqual(self.emitter.emit(1), 0)
+
+        # Shrinking keeps as many particles as fit.
+        self.emitter.max_particles = 100
+        self.emitter.emit(1)
+        self.assertEqual(self.emitter.num_particles, 100)
+        self.assertEqual(len(self.emitter._positions), 100)
+
+    def test_update(self):
+        self.emitter.direction = 0.0
+        self.emitter.spread = 0.0
+        self.emitter.acceleration = Loc(0, -10)
+        self.emitter.emit(3)
+        self.emitter._update_particles(0.5)
+
+        np.testing.assert_allclose(self.emitter._positions[:3],
+            [(100, 55)] * 3)
+        np.testing.assert_allclose(self.emitter._velocities[:3],
+            [(0, 5)] * 3)
+
+    def test_particles_die(self):
+        self.emitter.emit(5)
+        self.emitter._update_particles(0.6)
+        self.emitter.lifetime_range = (2.0, 2.0)
+        self.emitter.emit(3)
+        self.assertEqual(self.emitter.num_particles, 8)
+
+        self.emitter._update_particles(0.6)
+        self.assertEqual(self.emitter.num_particles, 3)
+        np.testing.assert_allclose(self.emitter._ages[:3], 0.6)
+
+    def test_colors_fade(self):
+        self.emitter.start_color = FColor(200, 0, 100)
+        self.emitter.end_color = FColor(0, 200, 100)
+        self.emitter.emit(2)
+        self.emitter._update_particles(0.5)
+        np.testing.assert_array_equal(self.emitter._colors[:2],
+            [(100, 100, 100)] * 2)
+
+    def test_spawn_rate(self):
+        # Tick without drawing.
+        self.emitter.start_cycle = lambda: None
+        self.emitter.spawn_rate = 25.0
+        for _ in range(10):
+            self.emitter.tick(20)
+        self.assertEqual(self.emitter.num_particles, 5)
+
+    def test_rasterize(self):
+        xs = np.array([10.5, 12.0, 500.0, -30.0])
+        ys = np.array([20.0, 21.0, 5.0, 5.0])
+        colors = np.array([(255, 0, 0), (0, 255, 0), (1, 1, 1), (2, 2, 2)],
+            dtype=np.uint8)
+        left, top, rgba = rasterize_points(xs, ys, colors, 100, 100, size=2)
+
+        self.assertEqual((left, top), (10, 20))
+        self.assertEqual(rgba.shape, (3, 4, 4))
+        np.testing.assert_array_equal(rgba[0, 0], (255, 0, 0, 255))
+        np.testing.assert_array_equal(rgba[2, 3], (0, 255, 0, 255))
+        np.testing.assert_array_equal(rgba[2, 0], (0, 0, 0, 0))
+
+        self.assertIsNone(rasterize_points(xs[2:], ys[2:], colors[2:],
+            100, 100))
+
+    def test_encode_png(self):
+        rgba = np.arange(2 * 3 * 4, dtype=np.uint8).reshape(2, 3, 4)
+        data = encode_png(rgba)
+        self.assertTrue(data.startswith(b"\x89PNG\r\n\x1a\n"))
+
+        width, height = struct.unpack(">II", data[16:24])
+        self.assertEqual((width, height), (3, 2))
+
+        idat_length = struct.unpack(">I", data[33:37])[0]
+        rows = zlib.decompress(data[41:41 + idat_length])
+        self.assertEqual(rows, b"\x00" + rgba[0].tobytes()
+            + b"\x00" + rgba[1].tobytes())
+        self.assertTrue(data.endswith(b"IEND\xaeB`\x82"))
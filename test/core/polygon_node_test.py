@@ -0,0 +1,58 @@
+"""Tests for polygon node transforms and bounds."""
+
+import unittest
+from factorygame import Loc
+from factorygame.core.blueprint import PolygonNode
+
+
+class PolygonNodeTransformTest(unittest.TestCase):
+
+    def setUp(self):
+        self.node = PolygonNode()
+        self.node.location = Loc(100, 200)
+        self.node.vertices = (Loc(-10, -5), Loc(10, -5), Loc(0, 20))
+
+    def test_world_vertices(self):
+        self.assertEqual(self.node.world_vertices,
+            (Loc(90, 195), Loc(110, 195), Loc(100, 220)))
+
+    def test_world_vertices_cached(self):
+        self.assertIs(self.node.world_vertices, self.node.world_vertices)
+
+    def test_world_vertices_follow_location(self):
+        self.node.world_vertices
+        self.node.location = Loc(0, 0)
+        self.assertEqual(self.node.world_vertices[0], Loc(-10, -5))
+
+        # Moving the location in place is also detected.
+        self.node.location.x += 5
+        self.assertEqual(self.node.world_vertices[0], Loc(-5, -5))
+
+    def test_world_vertices_follow_vertices(self):
+        self.node.world_vertices
+        self.node.vertices = (Loc(0, 0), Loc(1, 0), Loc(0, 1))
+        self.assertEqual(self.node.world_vertices[1], Loc(101, 200))
+
+        self.node.vertices[1].x = 2
+        self.node.mark_vertices_dirty()
+        self.assertEqual(self.node.world_vertices[1], Loc(102, 200))
+
+    def test_too_few_vertices(self):
+        with self.assertRaises(ValueError):
+            self.node.vertices = (Loc(0, 0), Loc(1, 1))
+
+    def test_bounds(self):
+        self.assertEqual(self.node.get_bounds(), (Loc(90, 195), Loc(110, 220)))
+        self.node.location = Loc(0, 0)
+        self.assertEqual(self.node.get_bounds(), (Loc(-10, -5), Loc(10, 20)))
+
+    def test_overlaps_bounds(self):
+        self.assertTrue(self.node.overlaps_bounds(Loc(0, 0), Loc(95, 200)))
+        self.assertTrue(self.node.overlaps_bounds(Loc(0, 0), Loc(1000, 1000)))
+        self.assertFalse(self.node.overlaps_bounds(Loc(0, 0), Loc(80, 1000)))
+        self.assertFalse(self.node.overlaps_bounds(Loc(0, 221), Loc(1000, 300)))
+
+    def test_point_in_bounds(self):
+        self.assertTrue(self.node.is_point_in_bounds(Loc(100, 200)))
+        self.assertTrue(self.node.is_point_in_bounds(Loc(110, 220)))
+        self.assertFalse(self.node.is_point_in_bounds(Loc(111, 200)))
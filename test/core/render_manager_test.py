@@ -0,0 +1,174 @@
+"""Tests for finding hovered nodes only when something changes."""
+
+from types import SimpleNamespace
+from factorygame import Loc, MulticastDelegate
+from factorygame.core.engine_base import World, ETickGroup
+from factorygame.core.blueprint import (NodeBase, PolygonNode, RenderManager,
+    WorldGraph)
+from test.template.template_world import IdleActor, WorldTest
+
+
+class _HoverWorld(World):
+    """World standing in for a graph without a window. Nodes are drawn
+    as boxes in a list of canvas items."""
+
+    on_graph_pointer_movement_input = \
+        WorldGraph.on_graph_pointer_movement_input
+    multi_box_trace_for_objects = WorldGraph.multi_box_trace_for_objects
+
+    def __init__(self):
+        super().__init__()
+        self.on_view_changed = MulticastDelegate()
+        self.render_manager = None
+
+        ## Offset subtracted from locations to get canvas coordinates.
+        self.view_offset = Loc(0, 0)
+
+        ## Canvas items drawn, as {id: (node, bottom left, top right)}.
+        self.items = {}
+        self._next_item_id = 0
+
+    def bind(self, sequence, func, add=None):
+        pass
+
+    def create_box(self, node, location, half_size):
+        self._next_item_id += 1
+        center = location - self.view_offset
+        self.items[self._next_item_id] = (
+            node, center - half_size, center + half_size)
+        return self._next_item_id
+
+    def find_overlapping(self, x1, y1, x2, y2):
+        return [item_id for item_id, (_, bl, tr) in self.items.items()
+            if bl.x <= x2 and x1 <= tr.x and bl.y <= y2 and y1 <= tr.y]
+
+
+class _HoverNode(NodeBase):
+    def __init__(self):
+        super().__init__()
+        self.hover_events = []
+
+    def on_begin_cursor_over(self, event):
+        self.hover_events.append(("begin", event))
+
+    def on_end_cursor_over(self, event):
+        self.hover_events.append(("end", event))
+
+    def _clear(self):
+        super()._clear()
+        items = self.world.items
+        for item_id in [item_id for item_id, item in items.items()
+                if item[0] is self]:
+            del items[item_id]
+
+    def _should_draw(self):
+        return True
+
+    def _draw(self):
+        self.register_canvas_id(self.world.create_box(self, self.location, 5))
+
+
+class _Mover(IdleActor):
+    """Moves a node back to the origin the next time it ticks."""
+
+    def __init__(self):
+        super().__init__()
+        self.primary_actor_tick.can_ever_tick = True
+        self.primary_actor_tick.tick_group = ETickGroup.GAME
+        self.node = None
+
+    def tick(self, dt):
+        if self.node is not None:
+            self.node.location = Loc(0, 0)
+            self.node = None
+
+
+class RenderManagerHoverTest(WorldTest):
+
+    world_class = _HoverWorld
+
+    def setUp(self):
+        super().setUp()
+        self.manager = self.world.render_manager = self.world.spawn_actor(
+            RenderManager, Loc(0, 0))
+
+    def _tick(self, num_frames):
+        for _ in range(num_frames):
+            self.world._destroy_pending()
+            self.world._tick_groups(16)
+
+    def _move_pointer(self, x, y):
+        self.manager._on_pointer_moved(SimpleNamespace(x=x, y=y))
+
+    def test_node_moved(self):
+        node = self.world.spawn_actor(_HoverNode, Loc(0, 0))
+        self.manager._hover_dirty = False
+        node.location = Loc(10, 0)
+        self.assertTrue(self.manager._hover_dirty)
+
+    def test_polygon_vertices_changed(self):
+        node = self.world.deferred_spawn_actor(PolygonNode, Loc(0, 0))
+        node.vertices = (Loc(0, 0), Loc(10, 0), Loc(0, 10))
+        self.world.finish_deferred_spawn_actor(node)
+
+        self.manager._hover_dirty = False
+        node.vertices = (Loc(0, 0), Loc(20, 0), Loc(0, 20))
+        self.assertTrue(self.manager._hover_dirty)
+
+    def test_pointer_left(self):
+        node = self.world.spawn_actor(_HoverNode, Loc(0, 0))
+        self.manager._on_pointer_moved("enter")
+        self.manager.hovered_nodes = {node}
+
+        self.manager._on_pointer_left("leave")
+        self.assertEqual(node.hover_events, [("end", "leave")])
+        self.assertEqual(self.manager.hovered_nodes, set())
+        self.assertIsNone(self.manager._pointer_event)
+        self.assertFalse(self.manager._hover_dirty)
+        self.assertFalse(self.manager._hover_ready)
+
+    def test_pointer_moved(self):
+        node = self.world.spawn_actor(_HoverNode, Loc(0, 0))
+        self._tick(1)
+        self._move_pointer(2, 2)
+        self._tick(1)
+        self.assertEqual(self.manager.hovered_nodes, {node})
+
+    def test_view_changed_under_still_pointer(self):
+        node = self.world.spawn_actor(_HoverNode, Loc(0, 0))
+        self._move_pointer(50, 0)
+        self._tick(2)
+        self.assertEqual(self.manager.hovered_nodes, set())
+
+        # Pan so the node is under the pointer.
+        self.world.view_offset = Loc(-50, 0)
+        self.world.on_view_changed.broadcast(self.world)
+        self._tick(2)
+        self.assertEqual(self.manager.hovered_nodes, {node})
+
+    def test_node_moved_under_still_pointer(self):
+        node = self.world.spawn_actor(_HoverNode, Loc(0, 0))
+        self._move_pointer(0, 0)
+        self._tick(2)
+        self.assertEqual(self.manager.hovered_nodes, {node})
+
+        node.location = Loc(100, 0)
+        self._tick(2)
+        self.assertEqual(self.manager.hovered_nodes, set())
+        self.assertEqual([name for name, _ in node.hover_events],
+            ["begin", "end"])
+
+        # Moved back by another actor after the render manager ticked.
+        mover = self.world.spawn_actor(_Mover, Loc(0, 0))
+        mover.node = node
+        self._tick(1)
+        self.assertEqual(node.location, Loc(0, 0))
+        self._tick(2)
+        self.assertEqual(self.manager.hovered_nodes, {node})
+
+    def test_spawned_under_still_pointer(self):
+        self._move_pointer(0, 0)
+        self._tick(2)
+        node = self.world.spawn_actor(_HoverNode, Loc(0, 0))
+        self._tick(2)
+        self.assertEqual(self.manager.hovered_nodes, {node})
@@ -0,0 +1,229 @@
+"""Tests for ticking actors less often when far from the view."""
+
+from factorygame import Loc, Actor
+from factorygame.core.engine_base import ETickGroup
+from factorygame.core.significance import SignificanceManager
+from test.template.template_world import WorldTest
+
+
+class _Machine(Actor):
+    def __init__(self):
+        super().__init__()
+        self.tick_times = []
+        self.caught_up = []
+        self.level_changes = []
+
+    def tick(self, delta_time):
+        self.tick_times.append(delta_time)
+
+    def catch_up(self, delta_time):
+        self.caught_up.append(delta_time)
+
+    def on_significance_changed(self, level):
+        self.level_changes.append(level)
+
+
+class _Recorder(Actor):
+    """Records when actors tick in a shared list."""
+
+    ## Tick group to tick in.
+    group = ETickGroup.GAME
+
+    def __init__(self):
+        super().__init__()
+        self.primary_actor_tick.tick_group = self.group
+        self.events = None
+
+    def tick(self, delta_time):
+        self.events.append(self)
+
+
+class _WorldRecorder(_Recorder):
+    group = ETickGroup.WORLD
+
+
+class SignificanceManagerTest(WorldTest):
+
+    def setUp(self):
+        super().setUp()
+        self.manager = self.world.spawn_actor(SignificanceManager, Loc(0, 0))
+        self.manager.view_bounds = (Loc(0, 0), Loc(100, 100))
+        self.manager.levels = ((0.0, 1), (1000.0, 4), (float("inf"), 0))
+        self.manager.hysteresis = 100.0
+
+    def _spawn(self, location):
+        machine = self.world.spawn_actor(_Machine, location)
+        self.manager.register_actor(machine)
+        return machine
+
+    def _tick(self, num_frames, dt=10):
+        for _ in range(num_frames):
+            self.world._destroy_pending()
+            self.world._tick_groups(dt)
+
+    def test_distance_from_view(self):
+        get_distance = self.manager.get_distance_from_view
+        self.assertEqual(get_distance(Loc(50, 50)), 0)
+        self.assertEqual(get_distance(Loc(130, 50)), 30)
+        self.assertEqual(get_distance(Loc(-30, 140)), 50)
+
+    def test_levels_from_distance(self):
+        near = self._spawn(Loc(50, 50))
+        mid = self._spawn(Loc(600, 50))
+        far = self._spawn(Loc(5000, 50))
+        self._tick(1)
+
+        self.assertEqual(self.manager.get_significance(near), 0)
+        self.assertEqual(self.manager.get_significance(mid), 1)
+        self.assertEqual(self.manager.get_significance(far), 2)
+        self.assertEqual(far.level_changes, [2])
+        self.assertIsNone(self.manager.get_significance(self.manager))
+
+    def test_throttled_tick_rate(self):
+        near = self._spawn(Loc(50, 50))
+        mid = self._spawn(Loc(600, 50))
+        far = self._spawn(Loc(5000, 50))
+        self._tick(20)
+
+        self.assertEqual(len(near.tick_times), 20)
+        self.assertEqual(len(mid.tick_times), 5)
+        self.assertEqual(far.tick_times, [])
+
+        # Throttled actors get all the time since they last ticked.
+        self.assertEqual(mid.tick_times[1:], [40, 40, 40, 40])
+        self.assertFalse(far.primary_actor_tick.tick_enabled)
+
+    def test_throttled_in_own_tick_group(self):
+        events = []
+        world_recorder = self.world.spawn_actor(_WorldRecorder, Loc(0, 0))
+        game_recorder = self.world.spawn_actor(_Recorder, Loc(600, 50))
+        world_recorder.events = game_recorder.events = events
+
+        # Throttled, but ticks in the GAME group.
+        self.manager.register_actor(game_recorder)
+        for _ in range(8):
+            events.append("frame")
+            self._tick(1)
+
+        self.assertEqual(events.count(world_recorder), 8)
+        self.assertEqual(self.manager.get_significance(game_recorder), 1)
+        self.assertEqual(events.count(game_recorder), 2)
+        # Each throttled tick comes after the WORLD group of its frame.
+        for i, actor in enumerate(events):
+            if actor is game_recorder:
+                self.assertIs(events[i - 1], world_recorder)
+
+    def test_throttled_actors_spread_over_frames(self):
+        machines = [self._spawn(Loc(600, 50)) for _ in range(8)]
+        ticks_per_frame = []
+        for _ in range(8):
+            before = sum(len(machine.tick_times) for machine in machines)
+            self._tick(1)
+            after = sum(len(machine.tick_times) for machine in machines)
+            ticks_per_frame.append(after - before)
+
+        self.assertEqual(ticks_per_frame[1:], [2] * 7)
+
+    def test_hysteresis(self):
+        machine = self._spawn(Loc(1150, 50))
+        self._tick(1)
+        # Past the level's distance, but within the hysteresis.
+        self.assertEqual(self.manager.get_significance(machine), 1)
+
+        machine.location = Loc(1250, 50)
+        self.manager.mark_needs_update()
+        self._tick(1)
+        self.assertEqual(self.manager.get_significance(machine), 2)
+
+        # Comes back as soon as it is within the level's distance.
+        machine.location = Loc(1150, 50)
+        self.manager.mark_needs_update()
+        self._tick(1)
+        self.assertEqual(self.manager.get_significance(machine), 2)
+
+        machine.location = Loc(1050, 50)
+        self.manager.mark_needs_update()
+        self._tick(1)
+        self.assertEqual(self.manager.get_significance(machine), 1)
+
+    def test_catch_up_after_suspension(self):
+        machine = self._spawn(Loc(5000, 50))
+        self._tick(1)
+        self._tick(10)
+        self.assertEqual(machine.tick_times, [])
+
+        machine.location = Loc(50, 50)
+        self.manager.mark_needs_update()
+        self._tick(1)
+
+        self.assertEqual(machine.caught_up, [110])
+        self.assertTrue(machine.primary_actor_tick.tick_enabled)
+        self.assertEqual(machine.level_changes, [2, 0])
+
+    def test_update_interval(self):
+        machine = self._spawn(Loc(50, 50))
+        self._tick(1)
+        machine.location = Loc(5000, 50)
+
+        self._tick(10)
+        self.assertEqual(self.manager.get_significance(machine), 0)
+        self._tick(15)
+        self.assertEqual(self.manager.get_significance(machine), 2)
+
+    def test_change_levels(self):
+        machines = [self._spawn(Loc(600, 50)) for _ in range(4)]
+        far = self._spawn(Loc(5000, 50))
+        self._tick(1)
+
+        # Throttled actors move to buckets for the new interval.
+        before = [len(m.tick_times) for m in machines]
+        self.manager.levels = ((0.0, 1), (1000.0, 2), (float("inf"), 0))
+        self._tick(8)
+        self.assertEqual([len(m.tick_times) - num_ticks
+            for m, num_ticks in zip(machines, before)], [4] * 4)
+
+        # Suspended actors resume when their level starts ticking.
+        self.manager.levels = ((0.0, 1), (10000.0, 2))
+        self._tick(2)
+        self.assertEqual(len(far.caught_up), 1)
+        self.assertEqual(len(far.tick_times), 1)
+        self.assertEqual(self.manager.get_significance(far), 1)
+
+        self.manager.unregister_actor(machines[0])
+        self.assertTrue(machines[0].primary_actor_tick.tick_enabled)
+
+    def test_unregister_restores_tick(self):
+        machine = self._spawn(Loc(5000, 50))
+        self._tick(1)
+        self.manager.unregister_actor(machine)
+
+        self.assertTrue(machine.primary_actor_tick.tick_enabled)
+        self.assertIsNone(self.manager.get_significance(machine))
+        self._tick(1)
+        self.assertEqual(len(machine.tick_times), 1)
+
+    def test_destroyed_actor_unregistered(self):
+        machine = self._spawn(Loc(600, 50))
+        self._tick(1)
+        self.world.destroy_actor(machine)
+        self._tick(8)
+
+        self.assertIsNone(self.manager.get_significance(machine))
+        self.assertFalse(machine.primary_actor_tick.tick_enabled)
+
+    def test_not_ticking_actor_stays_off(self):
+        machine = self.world.spawn_actor(_Machine, Loc(5000, 50))
+        machine.primary_actor_tick.tick_enabled = False
+        self.manager.register_actor(machine)
+        self._tick(1)
+
+        machine.location = Loc(50, 50)
+        self.manager.mark_needs_update()
+        self._tick(2)
+        self.assertEqual(machine.tick_times, [])
+        self.assertEqual(machine.caught_up, [])
+
+    def test_engine_group_actor_rejected(self):
+        other = self.world.spawn_actor(SignificanceManager, Loc(0, 0))
+        with self.assertRaises(ValueError):
+            self.manager.register_actor(other)
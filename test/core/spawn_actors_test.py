@@ -0,0 +1,137 @@
+"""Tests for spawning many actors at once."""
+
+import unittest
+from factorygame import Loc, Actor, ActorComponent
+from factorygame.core.engine_base import ETickGroup
+from factorygame.core.blueprint import PolygonNode, GeomHelper
+from test.template.template_world import WorldTest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class _CountingComponent(ActorComponent):
+    def __init__(self):
+        super().__init__()
+        self.began_play = False
+        self.num_ticks = 0
+
+    def begin_play(self):
+        self.began_play = True
+
+    def tick_component(self, delta_time):
+        self.num_ticks += 1
+
+
+class _ItemActor(Actor):
+    ## Number of times the constructor ran.
+    num_constructed = 0
+
+    def __init__(self):
+        super().__init__()
+        type(self).num_constructed += 1
+        self.primary_actor_tick.tick_group = ETickGroup.WORLD
+        self.contents = []
+        self.speed = 1.0
+        self.offset = Loc(1, 1)
+        self.began_play_with = None
+        self.label = None
+        self.num_ticks = 0
+        self.counter = self.add_component(_CountingComponent)
+
+    def begin_play(self):
+        # All actors are in the world before any begins play.
+        self.began_play_with = len(self.world._actors)
+
+    def tick(self, delta_time):
+        self.num_ticks += 1
+
+
+class SpawnActorsTest(WorldTest):
+
+    def setUp(self):
+        super().setUp()
+        _ItemActor.num_constructed = 0
+
+    def test_spawn_actors(self):
+        locations = [Loc(i, -i) for i in range(100)]
+        actors = self.world.spawn_actors(_ItemActor, locations, speed=3.0)
+
+        self.assertEqual(len(actors), 100)
+        self.assertEqual(_ItemActor.num_constructed, 1)
+        for i, actor in enumerate(actors):
+            self.assertIsInstance(actor, _ItemActor)
+            self.assertIs(actor.world, self.world)
+            self.assertEqual(actor.location, Loc(i, -i))
+            self.assertEqual(actor.speed, 3.0)
+            self.assertEqual(actor.began_play_with, 100)
+        self.assertEqual(self.world._actors, actors)
+
+    def test_clones_are_independent(self):
+        actors = self.world.spawn_actors(_ItemActor, [(0, 0), (1, 1)])
+        actors[0].contents.append(1)
+        actors[0].offset.x = 5
+        actors[0].location.x = 5
+
+        self.assertEqual(actors[1].contents, [])
+        self.assertEqual(actors[1].offset, Loc(1, 1))
+        self.assertEqual(actors[1].location, Loc(1, 1))
+        self.assertIsNot(actors[0].primary_actor_tick,
+            actors[1].primary_actor_tick)
+
+    def test_props_are_shared(self):
+        label = object()
+        actors = self.world.spawn_actors(_ItemActor, [(0, 0), (1, 1)],
+            label=label)
+        self.assertIs(actors[0].label, label)
+        self.assertIs(actors[1].label, label)
+
+    def test_ticks_registered(self):
+        actors = self.world.spawn_actors(_ItemActor, [(0, 0)] * 10)
+        self.assertEqual(self.world._ticking_actors[ETickGroup.WORLD],
+            set(actors))
+        self.assertTrue(actors[0].primary_actor_tick.tick_enabled)
+
+        self.world._tick_groups(20)
+        self.assertEqual([actor.num_ticks for actor in actors], [1] * 10)
+
+        actors[0].primary_actor_tick.tick_enabled = False
+        self.world._tick_groups(20)
+        self.assertEqual(actors[0].num_ticks, 1)
+        self.assertEqual(actors[1].num_ticks, 2)
+
+    def test_components_cloned(self):
+        actors = self.world.spawn_actors(_ItemActor, [(0, 0)] * 3)
+        counters = [actor.counter for actor in actors]
+
+        self.assertEqual(len(set(map(id, counters))), 3)
+        for actor in actors:
+            self.assertEqual(actor.components, (actor.counter,))
+            self.assertIs(actor.counter.owning_actor, actor)
+            self.assertTrue(actor.counter.began_play)
+
+        self.world._tick_groups(20)
+        self.assertEqual([counter.num_ticks for counter in counters], [1] * 3)
+
+    def test_spawned_event(self):
+        spawned = []
+        self.world.on_actor_spawned.add(spawned.append)
+        actors = self.world.spawn_actors(_ItemActor, [(0, 0)] * 3)
+        self.assertEqual(spawned, actors)
+
+    def test_unique_ids(self):
+        vertices = tuple(GeomHelper.generate_reg_poly(4, radius=10))
+        nodes = self.world.spawn_actors(PolygonNode, [(0, 0), (100, 0)],
+            vertices=vertices)
+        self.assertNotEqual(nodes[0].unique_id, nodes[1].unique_id)
+        self.assertEqual(nodes[1].world_vertices[0],
+            nodes[0].world_vertices[0] + Loc(100, 0))
+
+    @unittest.skipIf(np is None, "requires NumPy")
+    def test_array_locations(self):
+        locations = np.arange(20, dtype=float).reshape(10, 2)
+        actors = self.world.spawn_actors(_ItemActor, locations)
+        self.assertEqual(actors[3].location, Loc(6.0, 7.0))
+        self.assertIs(type(actors[3].location[0]), float)
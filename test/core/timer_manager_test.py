@@ -0,0 +1,146 @@
+"""Tests for delayed and repeating timers."""
+
+import unittest
+from factorygame.core.engine_base import World
+from factorygame.core.timer_manager import TimerManager
+
+
+class TimerManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.timers = TimerManager()
+        self.fired = []
+
+    def _callback(self, name):
+        return lambda: self.fired.append(name)
+
+    def test_one_shot(self):
+        handle = self.timers.set_timer(self._callback("a"), 0.1)
+        self.assertTrue(self.timers.is_timer_active(handle))
+        self.assertAlmostEqual(self.timers.get_timer_remaining(handle), 0.1)
+
+        self.timers.tick(50)
+        self.assertEqual(self.fired, [])
+        self.timers.tick(50)
+        self.assertEqual(self.fired, ["a"])
+        self.timers.tick(500)
+        self.assertEqual(self.fired, ["a"])
+
+        self.assertFalse(self.timers.is_timer_active(handle))
+        self.assertIsNone(self.timers.get_timer_remaining(handle))
+        self.assertEqual(len(self.timers), 0)
+
+    def test_fire_order(self):
+        self.timers.set_timer(self._callback("c"), 0.3)
+        self.timers.set_timer(self._callback("a"), 0.1)
+        self.timers.set_timer(self._callback("b1"), 0.2)
+        self.timers.set_timer(self._callback("b2"), 0.2)
+        self.timers.tick(1000)
+        self.assertEqual(self.fired, ["a", "b1", "b2", "c"])
+
+    def test_loop(self):
+        handle = self.timers.set_timer(self._callback("a"), 0.1, loop=True,
+            first_delay=0.05)
+        self.timers.tick(50)
+        self.assertEqual(len(self.fired), 1)
+        for _ in range(10):
+            self.timers.tick(100)
+        self.assertEqual(len(self.fired), 11)
+
+        # Fires at most once per frame.
+        self.timers.tick(1000)
+        self.assertEqual(len(self.fired), 12)
+
+        self.timers.clear_timer(handle)
+        self.timers.tick(1000)
+        self.assertEqual(len(self.fired), 12)
+        self.assertEqual(len(self.timers), 0)
+
+    def test_clear(self):
+        handles = [self.timers.set_timer(self._callback(i), 0.1)
+            for i in range(10)]
+        for handle in handles[::2]:
+            self.timers.clear_timer(handle)
+        self.timers.clear_timer(handles[0])
+        self.assertEqual(len(self.timers), 5)
+
+        self.timers.tick(100)
+        self.assertEqual(self.fired, [1, 3, 5, 7, 9])
+
+    def test_rebuild_stale(self):
+        handles = [self.timers.set_timer(self._callback(i), 1.0)
+            for i in range(5000)]
+        for handle in handles[:4000]:
+            self.timers.clear_timer(handle)
+        self.assertLess(len(self.timers._heap), 5000)
+
+        self.timers.tick(1000)
+        self.assertEqual(self.fired, list(range(4000, 5000)))
+        self.assertEqual(len(self.timers._heap), 0)
+
+    def test_pause(self):
+        handle = self.timers.set_timer(self._callback("a"), 0.1)
+        self.timers.tick(60)
+        self.timers.pause_timer(handle)
+        self.assertTrue(self.timers.is_timer_paused(handle))
+        self.assertFalse(self.timers.is_timer_active(handle))
+        self.assertAlmostEqual(self.timers.get_timer_remaining(handle), 0.04)
+
+        self.timers.tick(1000)
+        self.assertEqual(self.fired, [])
+
+        self.timers.unpause_timer(handle)
+        self.timers.tick(30)
+        self.assertEqual(self.fired, [])
+        self.timers.tick(10)
+        self.assertEqual(self.fired, ["a"])
+
+    def test_time_dilation(self):
+        self.timers.time_dilation = 0.5
+        self.timers.set_timer(self._callback("a"), 0.1)
+        self.timers.tick(150)
+        self.assertEqual(self.fired, [])
+        self.timers.tick(50)
+        self.assertEqual(self.fired, ["a"])
+
+    def test_set_in_callback(self):
+        def callback():
+            self.fired.append("a")
+            self.timers.set_timer(self._callback("b"), 0.0)
+
+        self.timers.set_timer(callback, 0.0)
+        self.timers.tick(10)
+        self.assertEqual(self.fired, ["a"])
+        self.timers.tick(10)
+        self.assertEqual(self.fired, ["a", "b"])
+
+    def test_clear_in_callback(self):
+        handles = []
+        def callback():
+            self.fired.append("a")
+            self.timers.clear_timer(handles[0])
+
+        handles.append(self.timers.set_timer(callback, 0.1, loop=True))
+        for _ in range(3):
+            self.timers.tick(100)
+        self.assertEqual(self.fired, ["a"])
+        self.assertEqual(len(self.timers), 0)
+        self.assertEqual(self.timers._num_stale, 0)
+
+    def test_clear_all(self):
+        self.timers.set_timer(self._callback("a"), 0.1)
+        paused = self.timers.set_timer(self._callback("b"), 0.1)
+        self.timers.pause_timer(paused)
+        self.timers.clear_all_timers()
+        self.assertEqual(len(self.timers), 0)
+        self.assertFalse(self.timers.is_timer_paused(paused))
+
+        self.timers.tick(200)
+        self.assertEqual(self.fired, [])
+
+    def test_world_owns_timers(self):
+        world = World()
+        world.timer_manager.set_timer(self._callback("a"), 0.1)
+        world.begin_destroy()
+        world.timer_manager.tick(200)
+        self.assertEqual(self.fired, [])
@@ -0,0 +1,214 @@
+"""Tests for streaming chunks of actors around the view."""
+
+import os, tempfile, warnings
+from factorygame import Loc, Actor
+from factorygame.core.blueprint import PolygonNode, FColor
+from factorygame.core.world_partition import WorldPartition
+from test.template.template_world import IdleActor, WorldTest
+
+
+class _Crate(IdleActor):
+    def __init__(self):
+        super().__init__()
+        self.contents = None
+
+    def get_streaming_state(self):
+        return {"contents": self.contents}
+
+
+class WorldPartitionTest(WorldTest):
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.partition = self._spawn_partition()
+
+    def tearDown(self):
+        self._destroy_partition()
+        super().tearDown()
+        self.temp_dir.cleanup()
+
+    def _spawn_partition(self):
+        partition = self.world.spawn_actor(WorldPartition, Loc(0, 0))
+        partition.set_directory(self.temp_dir.name)
+        partition.chunk_size = 100.0
+        partition.load_distance = 0.0
+        partition.max_loaded_actors = 0
+        partition.view_bounds = (Loc(10, 10), Loc(90, 90))
+        return partition
+
+    def _destroy_partition(self):
+        self.world.destroy_actor(self.partition)
+        self.world._destroy_pending()
+
+    def _add_crate(self, location, contents):
+        crate = self.world.spawn_actor(_Crate, location)
+        crate.contents = contents
+        self.partition.add_actor(crate)
+        return crate
+
+    def _move_view(self, bl, tr):
+        self.partition.view_bounds = (bl, tr)
+        self.partition.update_streaming()
+        self.partition.flush()
+        self.partition.update_streaming()
+        self.world._destroy_pending()
+
+    def _get_crates(self):
+        return sorted(crate.contents
+            for crate in self.world.get_all_actors_of_class(_Crate))
+
+    def test_chunk_key(self):
+        self.assertEqual(self.partition.get_chunk_key(Loc(50, 150)), (0, 1))
+        self.assertEqual(self.partition.get_chunk_key(Loc(-1, 0)), (-1, 0))
+
+    def test_needed_chunks(self):
+        self.partition.view_bounds = (Loc(-50, 10), Loc(150, 90))
+        self.assertEqual(self.partition.get_needed_chunks(),
+            [(-1, 0), (0, 0), (1, 0)])
+
+    def test_unload_far_chunks(self):
+        self._add_crate(Loc(50, 50), "near")
+        self._add_crate(Loc(550, 50), "far")
+
+        self._move_view(Loc(10, 10), Loc(90, 90))
+
+        self.assertEqual(self._get_crates(), ["near"])
+        self.assertFalse(self.partition.is_chunk_loaded((5, 0)))
+        self.assertEqual(self.partition.num_loaded_actors, 1)
+        self.assertTrue(os.path.exists(
+            os.path.join(self.temp_dir.name, "5_0.chunk")))
+
+    def test_load_chunks_near_view(self):
+        self._add_crate(Loc(550, 50), "far")
+        self._move_view(Loc(10, 10), Loc(90, 90))
+        self.assertEqual(self._get_crates(), [])
+
+        self._move_view(Loc(510, 10), Loc(590, 90))
+        self.assertEqual(self._get_crates(), ["far"])
+        crate = tuple(self.world.get_all_actors_of_class(_Crate))[0]
+        self.assertEqual(crate.location, Loc(550, 50))
+
+    def test_keep_chunks_within_budget(self):
+        self.partition.max_loaded_actors = 2
+        self._add_crate(Loc(550, 50), "first")
+        self._add_crate(Loc(850, 50), "second")
+        self._move_view(Loc(10, 10), Loc(90, 90))
+        # Within budget, so nothing is unloaded.
+        self.assertEqual(self._get_crates(), ["first", "second"])
+
+        self._add_crate(Loc(50, 50), "third")
+        self._move_view(Loc(10, 10), Loc(90, 90))
+        # The least recently added chunk is unloaded first.
+        self.assertEqual(self._get_crates(), ["second", "third"])
+
+    def test_least_recently_needed_unloaded(self):
+        self.partition.max_loaded_actors = 2
+        self._add_crate(Loc(550, 50), "first")
+        self._add_crate(Loc(850, 50), "second")
+        self._move_view(Loc(510, 10), Loc(590, 90))
+
+        self._add_crate(Loc(50, 50), "third")
+        self._move_view(Loc(10, 10), Loc(90, 90))
+        self.assertEqual(self._get_crates(), ["first", "third"])
+
+    def test_destroyed_actor_not_saved(self):
+        crate = self._add_crate(Loc(550, 50), "far")
+        self.world.destroy_actor(crate)
+        self.world._destroy_pending()
+        self._move_view(Loc(10, 10), Loc(90, 90))
+
+        self._move_view(Loc(510, 10), Loc(590, 90))
+        self.assertEqual(self._get_crates(), [])
+
+    def _reload_partition(self):
+        """Destroy the partition and its actors, then load the chunks in
+        view again with a new partition."""
+        self._destroy_partition()
+        for crate in tuple(self.world.get_all_actors_of_class(Actor)):
+            self.world.destroy_actor(crate)
+        self.world._destroy_pending()
+
+        self.partition = self._spawn_partition()
+        self._move_view(Loc(10, 10), Loc(90, 90))
+
+    def test_save_all_reloads_in_new_partition(self):
+        self._add_crate(Loc(50, 50), "near")
+        self._add_crate(Loc(550, 50), "far")
+        self.partition.save_all()
+        self.assertEqual(sorted(os.listdir(self.temp_dir.name)),
+            ["0_0.chunk", "5_0.chunk"])
+
+        self._reload_partition()
+        self.assertEqual(self._get_crates(), ["near"])
+
+    def test_save_all_skips_empty_chunks(self):
+        self._move_view(Loc(10, 10), Loc(90, 90))
+        self.partition.save_all()
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_destroy_saves_loaded_chunks(self):
+        self._add_crate(Loc(50, 50), "near")
+        self._reload_partition()
+        self.assertEqual(self._get_crates(), ["near"])
+
+    def test_polygon_node_round_trip(self):
+        vertices = (Loc(0, 0), Loc(20, 0), Loc(10, 15))
+        node = self.world.deferred_spawn_actor(PolygonNode, Loc(50, 50))
+        node.vertices = vertices
+        node.fill_color = FColor.red()
+        node.outline_width = 3.0
+        self.world.finish_deferred_spawn_actor(node)
+        self.partition.add_actor(node)
+
+        self._reload_partition()
+        node, = self.world.get_all_actors_of_class(PolygonNode)
+        self.assertEqual(node.location, Loc(50, 50))
+        self.assertEqual(node.vertices, vertices)
+        self.assertEqual(node.fill_color, FColor.red())
+        self.assertIsNone(node.outline_color)
+        self.assertEqual(node._outline_color_hex, FColor.red().to_hex())
+        self.assertEqual(node.outline_width, 3.0)
+        self.assertEqual(node.world_vertices[1], Loc(70, 50))
+
+    def test_unreadable_chunk_loaded_empty(self):
+        self._add_crate(Loc(150, 50), "next")
+        self.partition.save_all()
+        with open(os.path.join(self.temp_dir.name, "0_0.chunk"), "wb") as fp:
+            fp.write(b"not a chunk")
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self._reload_partition()
+            self._move_view(Loc(10, 10), Loc(190, 90))
+            self._move_view(Loc(510, 10), Loc(590, 90))
+            self._move_view(Loc(10, 10), Loc(190, 90))
+
+        # Reported once, and the other chunk still loads.
+        self.assertEqual(len(caught), 1)
+        self.assertIs(caught[0].category, RuntimeWarning)
+        self.assertTrue(self.partition.is_chunk_loaded((0, 0)))
+        self.assertEqual(self._get_crates(), ["next"])
+        # The file is left alone.
+        with open(os.path.join(self.temp_dir.name, "0_0.chunk"), "rb") as fp:
+            self.assertEqual(fp.read(), b"not a chunk")
+
+    def test_write_error_keeps_worker_running(self):
+        self._add_crate(Loc(50, 50), "near")
+        self.partition._directory = os.path.join(self.temp_dir.name, "gone")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with self.assertRaises(OSError):
+                self.partition.save_all()
+        self.assertEqual(len(caught), 1)
+
+        self.partition.set_directory(self.temp_dir.name)
+        self.partition.save_all()
+        self.assertEqual(os.listdir(self.temp_dir.name), ["0_0.chunk"])
+
+    def test_destroy_before_begin_play(self):
+        partition = self.world.deferred_spawn_actor(WorldPartition, Loc(0, 0))
+        partition.set_directory(self.temp_dir.name)
+        # Never finished spawning, so the world can't destroy it.
+        partition.begin_destroy()
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
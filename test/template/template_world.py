@@ -0,0 +1,30 @@
+"""Template for unit tests that spawn actors in a world without a
+window."""
+
+import unittest
+from factorygame import Actor, GameplayStatics
+from factorygame.core.engine_base import World
+
+
+class IdleActor(Actor):
+    """Actor that never ticks."""
+
+    def __init__(self):
+        super().__init__()
+        self.primary_actor_tick.can_ever_tick = False
+
+
+class WorldTest(unittest.TestCase):
+    """Template class for unit tests that need a world. Makes a new world
+    for each test, then clears gameplay statics afterwards. Call super
+    when overriding `setUp` or `tearDown`."""
+
+    ## Class of world to make for each test.
+    world_class = World
+
+    def setUp(self):
+        self.world = self.world_class()
+        GameplayStatics.set_world(self.world)
+
+    def tearDown(self):
+        GameplayStatics.clear_all()
@@ -0,0 +1,66 @@
+"""Tests for the bounding volume hierarchy."""
+
+import unittest, random
+from factorygame.utils.bvh import AABBTree
+
+
+class AABBTreeTest(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(1)
+        self.tree = AABBTree(margin=1.0)
+        self.boxes = {}
+        for i in range(200):
+            x, y = random.uniform(0, 1000), random.uniform(0, 1000)
+            self.boxes[i] = (x, y, x + 20, y + 20)
+            self.tree.insert(i, self.boxes[i])
+
+    def _brute_box(self, bounds):
+        margin = self.tree.margin
+        return {item for item, box in self.boxes.items()
+            if not (box[0] - margin > bounds[2] or box[2] + margin < bounds[0]
+                or box[1] - margin > bounds[3] or box[3] + margin < bounds[1])}
+
+    def test_len(self):
+        self.assertEqual(len(self.tree), 200)
+        self.assertIn(5, self.tree)
+
+    def test_query_box(self):
+        for bounds in ((0, 0, 100, 100), (400, 300, 800, 350), (-50, -50, -10, -10)):
+            self.assertEqual(set(self.tree.query_box(bounds)),
+                self._brute_box(bounds))
+
+    def test_query_segment(self):
+        found = set(self.tree.query_segment(-10, 500, 1100, 500))
+        expected = {item for item, box in self.boxes.items()
+            if box[1] - 1 <= 500 <= box[3] + 1}
+        self.assertEqual(found, expected)
+
+        # Diagonal line y = x crosses boxes that overlap on both axes.
+        found = set(self.tree.query_segment(-100, -100, 1100, 1100))
+        expected = {item for item, box in self.boxes.items()
+            if max(box[0], box[1]) - 1 <= min(box[2], box[3]) + 1}
+        self.assertEqual(found, expected)
+
+    def test_remove(self):
+        for i in range(0, 200, 2):
+            self.tree.remove(i)
+            del self.boxes[i]
+        self.tree.remove(1000)
+
+        self.assertEqual(len(self.tree), 100)
+        bounds = (0, 0, 1000, 1000)
+        self.assertEqual(set(self.tree.query_box(bounds)), set(self.boxes))
+
+        for i in list(self.boxes):
+            self.tree.remove(i)
+        self.assertEqual(list(self.tree.query_box(bounds)), [])
+
+    def test_update(self):
+        # Small movements stay within the enlarged box.
+        self.assertFalse(self.tree.update(0,
+            tuple(v + 0.5 for v in self.boxes[0])))
+
+        self.assertTrue(self.tree.update(0, (2000, 2000, 2010, 2010)))
+        self.assertEqual(set(self.tree.query_box((1990, 1990, 2100, 2100))), {0})
+        self.assertNotIn(0, set(self.tree.query_box(self.boxes[0])))
@@ -0,0 +1,63 @@
+"""Tests for color palettes and batched gradients."""
+
+import unittest
+from factorygame.core.blueprint import FColor
+from factorygame.utils.mymath import MathStat
+
+try:
+    import numpy as np
+    from factorygame.utils.colormap import rgb_to_hex, gradient_hex, ColorMap
+except ImportError:
+    np = None
+
+
+class FColorPaletteTest(unittest.TestCase):
+
+    def test_to_hex(self):
+        self.assertEqual(FColor(255, 128, 0).to_hex(), "#ff8000")
+        self.assertEqual(FColor(20).to_hex(), "#141414")
+
+    def test_hex_is_interned(self):
+        self.assertIs(FColor(1, 2, 3).to_hex(), FColor(1, 2, 3).to_hex())
+
+    def test_hex_follows_changes(self):
+        color = FColor(0)
+        self.assertEqual(color.to_hex(), "#000000")
+        color.r = 255
+        self.assertEqual(color.to_hex(), "#ff0000")
+
+    def test_from_hex(self):
+        self.assertEqual(FColor.from_hex("#ff8000"), FColor(255, 128, 0))
+
+    def test_lerp_hex(self):
+        self.assertEqual(MathStat.lerp("#000000", "#ff8040", 0.5), "#7f4020")
+
+
+@unittest.skipIf(np is None, "requires NumPy")
+class ColorMapTest(unittest.TestCase):
+
+    def test_rgb_to_hex(self):
+        self.assertEqual(rgb_to_hex([[255, 128, 0], [0, 0, 0]]),
+            ["#ff8000", "#000000"])
+        self.assertEqual(rgb_to_hex([300, -5, 15.0]), ["#ff000f"])
+
+    def test_gradient_matches_to_hex(self):
+        colors = gradient_hex(FColor.black(), FColor.white(), 3)
+        self.assertEqual(colors, ["#000000", "#7f7f7f", "#ffffff"])
+
+    def test_color_map(self):
+        color_map = ColorMap([FColor.blue(), FColor.red()], num_entries=2)
+        self.assertEqual(color_map.map_hex([0.0, 0.4, 0.6, 1.0, 5.0]),
+            ["#0000ff", "#0000ff", "#ff0000", "#ff0000", "#ff0000"])
+
+    def test_color_map_range(self):
+        color_map = ColorMap([FColor.black(), FColor.green(), FColor.white()],
+            positions=[0.0, 0.5, 1.0], num_entries=3)
+        self.assertEqual(color_map.map_hex([0, 50, 100], vmin=0, vmax=100),
+            ["#000000", "#00ff00", "#ffffff"])
+
+    def test_invalid_stops(self):
+        with self.assertRaises(ValueError):
+            ColorMap([FColor.black()])
+        with self.assertRaises(ValueError):
+            ColorMap([FColor.black(), FColor.white()], positions=[0.0])
@@ -0,0 +1,120 @@
+"""Tests for multicast delegates and engine events."""
+
+import gc
+import unittest
+from factorygame import Loc, MulticastDelegate
+from test.template.template_world import IdleActor, WorldTest
+
+
+class _Listener(object):
+    def __init__(self):
+        self.calls = []
+
+    def on_event(self, *args):
+        self.calls.append(args)
+
+
+class MulticastDelegateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.delegate = MulticastDelegate()
+
+    def test_broadcast(self):
+        listener = _Listener()
+        calls = []
+        self.delegate.add(listener.on_event)
+        self.delegate.add(calls.append)
+        self.delegate.broadcast(5)
+
+        self.assertEqual(listener.calls, [(5,)])
+        self.assertEqual(calls, [5])
+        self.assertEqual(len(self.delegate), 2)
+
+    def test_add_twice(self):
+        listener = _Listener()
+        self.delegate.add(listener.on_event)
+        self.delegate.add(listener.on_event)
+        self.delegate.broadcast()
+        self.assertEqual(len(listener.calls), 1)
+
+    def test_remove(self):
+        listeners = [_Listener() for _ in range(3)]
+        for listener in listeners:
+            self.delegate.add(listener.on_event)
+        self.delegate.remove(listeners[1].on_event)
+        self.delegate.remove(listeners[1].on_event)
+        self.delegate.broadcast()
+
+        self.assertEqual([len(l.calls) for l in listeners], [1, 0, 1])
+        self.assertNotIn(listeners[1].on_event, self.delegate)
+        self.assertIn(listeners[0].on_event, self.delegate)
+
+    def test_remove_object(self):
+        listener = _Listener()
+        self.delegate.add(listener.on_event)
+        self.delegate.add(listener.__init__)
+        self.delegate.remove_object(listener)
+        self.assertFalse(self.delegate)
+
+    def test_weak_reference(self):
+        listener = _Listener()
+        self.delegate.add(listener.on_event)
+        del listener
+        gc.collect()
+
+        self.assertEqual(len(self.delegate), 0)
+        self.delegate.broadcast()
+
+    def test_function_held_strongly(self):
+        calls = []
+        self.delegate.add(lambda: calls.append(1))
+        gc.collect()
+        self.delegate.broadcast()
+        self.assertEqual(calls, [1])
+
+    def test_change_during_broadcast(self):
+        listener = _Listener()
+        def remove_listener():
+            self.delegate.remove(listener.on_event)
+
+        self.delegate.add(remove_listener)
+        self.delegate.add(listener.on_event)
+        self.delegate.broadcast()
+        self.delegate.broadcast()
+        self.assertEqual(len(listener.calls), 1)
+
+    def test_decorator(self):
+        calls = []
+
+        @self.delegate.add
+        def on_event(value):
+            calls.append(value)
+
+        self.delegate.broadcast(3)
+        self.assertEqual(calls, [3])
+
+
+class EngineEventTest(WorldTest):
+
+    def test_actor_spawned_and_destroyed(self):
+        spawned, destroyed = [], []
+        self.world.on_actor_spawned.add(spawned.append)
+        self.world.on_actor_destroyed.add(destroyed.append)
+
+        actor = self.world.spawn_actor(IdleActor, Loc(0, 0))
+        self.assertEqual(spawned, [actor])
+
+        self.world.destroy_actor(actor)
+        self.assertEqual(destroyed, [])
+        self.world._destroy_pending()
+        self.assertEqual(destroyed, [actor])
+
+    def test_location_changed(self):
+        actor = self.world.spawn_actor(IdleActor, Loc(0, 0))
+        self.assertIsNone(actor._on_location_changed)
+
+        moved = []
+        actor.on_location_changed.add(moved.append)
+        actor.location = Loc(5, 6)
+        self.assertEqual(moved, [actor])
+        self.assertEqual(actor.location, Loc(5, 6))
@@ -0,0 +1,164 @@
+"""Tests for loading images into the shared image cache in the
+background, without a display."""
+
+import os, threading, time, unittest
+from tkinter import TclError
+from factorygame.utils.tkutils import ScalingImageCache
+
+## Image file next to this test.
+IMAGE_PATH = os.path.join(os.path.dirname(__file__),
+    "ACU_Young_Elise_Arno_tiny.gif")
+
+
+class StubMaster(object):
+    """Stands in for a Tk widget, running after callbacks when updated.
+    Records the threads it is used from."""
+
+    def __init__(self):
+        self.scheduled = {}
+        self.threads = set()
+        self.destroyed = False
+        self._next_id = 0
+
+    def after(self, ms, func, *args):
+        self.threads.add(threading.current_thread())
+        self._next_id += 1
+        self.scheduled[self._next_id] = (func, args)
+        return self._next_id
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, after_id):
+        self.threads.add(threading.current_thread())
+        self.scheduled.pop(after_id, None)
+
+    def update(self):
+        """Run callbacks scheduled before this call."""
+        if self.destroyed:
+            raise TclError("application has been destroyed")
+        self.threads.add(threading.current_thread())
+        scheduled, self.scheduled = self.scheduled, {}
+        for func, args in scheduled.values():
+            func(*args)
+
+
+class DataImageCache(ScalingImageCache):
+    """Cache that returns file data instead of making Tk images, which
+    need a display."""
+
+    def get_original(self, filename):
+        imgdata = self.get_file_data(filename)
+        if not imgdata.startswith(b"GIF"):
+            raise TclError("couldn't recognize image data")
+        return imgdata
+
+
+class ScalingImageCacheLoadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.master = StubMaster()
+        self.cache = DataImageCache(self.master)
+        self.loaded = []
+
+    def _on_loaded(self, image, error):
+        self.loaded.append((image, error))
+
+    def _update_until_loaded(self, num_loaded=1):
+        """Process events until callbacks are called, or fail."""
+        end_time = time.perf_counter() + 5
+        while len(self.loaded) < num_loaded:
+            self.assertLess(time.perf_counter(), end_time)
+            self.master.update()
+            time.sleep(0.001)
+
+    def test_load(self):
+        self.cache.load_async(IMAGE_PATH, self._on_loaded)
+        self.cache.load_async(IMAGE_PATH, self._on_loaded)
+        self.assertEqual(self.loaded, [])
+        self._update_until_loaded(2)
+
+        with open(IMAGE_PATH, "rb") as fp:
+            imgdata = fp.read()
+        self.assertEqual(self.loaded, [(imgdata, None)] * 2)
+        # Stops checking once nothing is loading.
+        self.assertEqual(self.master.scheduled, {})
+        self.assertEqual(self.master.threads, {threading.current_thread()})
+
+    def test_missing_file(self):
+        self.cache.load_async("missing.gif", self._on_loaded)
+        self._update_until_loaded()
+
+        image, error = self.loaded[0]
+        self.assertIsNone(image)
+        self.assertIsInstance(error, FileNotFoundError)
+        self.assertEqual(self.master.threads, {threading.current_thread()})
+
+    def test_invalid_image(self):
+        self.cache.load_async(__file__, self._on_loaded)
+        self._update_until_loaded()
+
+        image, error = self.loaded[0]
+        self.assertIsNone(image)
+        self.assertIsInstance(error, TclError)
+        self.assertNotIn(__file__, self.cache._file_data)
+
+    def test_finish_load(self):
+        self.cache._pending_loads["a.gif"] = [self._on_loaded]
+        self.cache._finish_load("a.gif", b"GIF89a", None)
+        self.assertEqual(self.loaded, [(b"GIF89a", None)])
+
+        # Ignored once the file is no longer waited for.
+        self.cache._finish_load("a.gif", b"GIF89a", None)
+        self.assertEqual(len(self.loaded), 1)
+
+        error = OSError("can't read")
+        self.cache._pending_loads["b.gif"] = [self._on_loaded]
+        self.cache._finish_load("b.gif", None, error)
+        self.assertEqual(self.loaded[1], (None, error))
+
+    def test_clear_cancels_loads(self):
+        self.cache.load_async(IMAGE_PATH, self._on_loaded)
+        self.cache.clear()
+        self.assertEqual(self.master.scheduled, {})
+
+        time.sleep(0.05)
+        self.cache._poll_finished_loads()
+        self.assertEqual(self.loaded, [])
+
+
+class _SizedImage(object):
+    """Stands in for a Tk image with a size."""
+
+    def __init__(self, width, height):
+        self._width = width
+        self._height = height
+
+    def width(self):
+        return self._width
+
+    def height(self):
+        return self._height
+
+
+class ScalingImageCacheMemoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = DataImageCache(StubMaster(), max_pixels=250)
+
+    def test_file_data_dropped_with_original(self):
+        cache = self.cache
+        cache._file_data["a.gif"] = cache._file_data["b.gif"] = b"GIF89a"
+        cache._add_cached(("a.gif", 1, 2), _SizedImage(5, 5))
+        cache._add_cached(("a.gif", 1, 1), _SizedImage(10, 10))
+        cache._add_cached(("b.gif", 1, 1), _SizedImage(10, 10))
+
+        # Evicting a scaled image keeps the file data.
+        cache._add_cached(("b.gif", 1, 4), _SizedImage(10, 5))
+        self.assertNotIn(("a.gif", 1, 2), cache._images)
+        self.assertEqual(sorted(cache._file_data), ["a.gif", "b.gif"])
+
+        cache._add_cached(("c.gif", 1, 1), _SizedImage(10, 10))
+        self.assertNotIn(("a.gif", 1, 1), cache._images)
+        self.assertEqual(list(cache._file_data), ["b.gif"])
+        self.assertEqual(cache.num_pixels, 250)
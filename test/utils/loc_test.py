@@ -0,0 +1,79 @@
+"""Tests for coordinate value types."""
+
+import unittest
+from factorygame.utils.loc import Loc, Vec2
+
+
+class Vec2Test(unittest.TestCase):
+
+    def test_construct(self):
+        self.assertEqual(Vec2(1, 2), (1, 2))
+        self.assertEqual(Vec2(Loc(1, 2)), Vec2(1, 2))
+        self.assertEqual(Vec2.from_loc(Loc(1, 2, 3)), Vec2(1, 2))
+        self.assertEqual(Vec2(3, 4).x, 3)
+        self.assertEqual(Vec2(3, 4).y, 4)
+        self.assertEqual(Vec2(), (0.0, 0.0))
+        self.assertEqual(Vec2(5), (5, 5))
+
+    def test_immutable(self):
+        v = Vec2(1, 2)
+        with self.assertRaises(AttributeError):
+            v.x = 5
+        with self.assertRaises(AttributeError):
+            v.z = 5
+
+    def test_hashable(self):
+        visited = {Vec2(1, 2): "a"}
+        self.assertEqual(visited[Vec2(1.0, 2.0)], "a")
+        self.assertIn(Vec2(0, 0), {Vec2(0, 0), Vec2(1, 1)})
+
+    def test_scalar_operands(self):
+        v = Vec2(4, 6)
+        self.assertEqual(v + 1, (5, 7))
+        self.assertEqual(1 + v, (5, 7))
+        self.assertEqual(v - 1, (3, 5))
+        self.assertEqual(10 - v, (6, 4))
+        self.assertEqual(v * 2, (8, 12))
+        self.assertEqual(2 * v, (8, 12))
+        self.assertEqual(v / 2, (2, 3))
+        self.assertEqual(v // 4, (1, 1))
+        self.assertEqual(v % 4, (0, 2))
+
+    def test_vector_operands(self):
+        v = Vec2(4, 6)
+        self.assertEqual(v + Vec2(1, 2), (5, 8))
+        self.assertEqual(v + Loc(1, 2), (5, 8))
+        self.assertEqual(v + (1, 2), (5, 8))
+        self.assertEqual((1, 2) + v, (5, 8))
+        self.assertEqual(v - (1, 2), (3, 4))
+        self.assertEqual((1, 2) - v, (-3, -4))
+        self.assertEqual(v * (2, 3), (8, 18))
+        self.assertIsInstance(v + (1, 2), Vec2)
+        self.assertIsInstance((1, 2) * v, Vec2)
+
+    def test_loc_interop(self):
+        v = Vec2(1, 2)
+        loc = v.to_loc()
+        self.assertIsInstance(loc, Loc)
+        self.assertEqual(loc, Loc(1, 2))
+        self.assertEqual(Loc(v), Loc(1, 2))
+        self.assertEqual(Loc(1, 1) + v, Loc(2, 3))
+
+    def test_vector_math(self):
+        v = Vec2(3, 4)
+        self.assertEqual(abs(v), 5)
+        self.assertEqual(v.length(), 5)
+        self.assertEqual(v.length_squared(), 25)
+        self.assertEqual(v.dot((1, 1)), 7)
+        self.assertEqual(v.cross((1, 0)), -4)
+        self.assertEqual(v.normalized(), (0.6, 0.8))
+        self.assertEqual(Vec2(0, 0).normalized(), (0, 0))
+        self.assertEqual(-v, (-3, -4))
+
+
+class LocTest(unittest.TestCase):
+
+    def test_inplace_floordiv(self):
+        loc = Loc(7, 9)
+        loc //= 2
+        self.assertEqual(loc, Loc(3, 4))
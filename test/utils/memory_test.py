@@ -0,0 +1,52 @@
+"""Memory footprint tests for small, frequently created objects."""
+
+import unittest
+from factorygame.utils.memory import get_deep_size, get_actor_memory_report
+from factorygame.core.engine_base import FTickFunction
+from factorygame.core.input_base import FKey
+from factorygame.core.collision import HitResult
+from factorygame.components.projectile_movement.projectile_movement import (
+    ProjectileAimStruct, ProjectileAimOffsetStruct
+)
+
+
+class MemoryFootprintTest(unittest.TestCase):
+
+    ## Small structures that should not have a per-instance __dict__.
+    slotted_objects = (
+        lambda: FKey("A"),
+        FTickFunction,
+        HitResult,
+        ProjectileAimStruct,
+        ProjectileAimOffsetStruct,
+        )
+
+    def test_no_instance_dict(self):
+        for make_object in self.slotted_objects:
+            obj = make_object()
+            with self.subTest(type(obj).__name__):
+                self.assertFalse(hasattr(obj, "__dict__"))
+
+    def test_slots_smaller_than_dict(self):
+        class DictTickFunction(object):
+            def __init__(self):
+                FTickFunction.__init__(self)
+
+        slotted_size = get_deep_size(FTickFunction())
+        dict_size = get_deep_size(DictTickFunction())
+        self.assertLess(slotted_size, dict_size)
+
+    def test_deep_size_counts_references(self):
+        hit = HitResult()
+        empty_size = get_deep_size(hit)
+        hit.other_actor = [0.0] * 100
+        self.assertGreater(get_deep_size(hit), empty_size)
+
+    def test_actor_memory_report(self):
+        report = get_actor_memory_report()
+        self.assertIn("PolygonNode", report)
+        for size in report.values():
+            self.assertGreater(size, 0)
+
+        # Derived actors hold everything their parents do.
+        self.assertLess(report["NodeBase"], report["PolygonNode"])
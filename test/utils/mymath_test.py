@@ -0,0 +1,87 @@
+"""Tests for scalar and array math libraries."""
+
+import unittest
+from factorygame.utils.loc import Loc, Vec2
+from factorygame.utils.mymath import MathStat
+
+try:
+    import numpy as np
+    from factorygame.utils.array_math import ArrayMathStat
+except ImportError:
+    np = None
+
+
+class MathStatTest(unittest.TestCase):
+
+    def test_lerp_scalar(self):
+        self.assertEqual(MathStat.lerp(0, 10, 0.25), 2.5)
+        self.assertEqual(MathStat.lerp(0, 10, 2), 10)
+        self.assertEqual(MathStat.lerp(0, 10, 2, False), 20)
+
+    def test_lerp_sequence(self):
+        self.assertEqual(MathStat.lerp(Loc(0, 0), Loc(10, 20), 0.5),
+            Loc(5, 10))
+        self.assertIsInstance(MathStat.lerp(Vec2(0, 0), Vec2(2, 2), 0.5), Vec2)
+        self.assertEqual(MathStat.lerp((0, 0), (2, 4), 0.5), (1, 2))
+        self.assertEqual(MathStat.lerp([0, 0], [2, 4], 0.5), [1, 2])
+
+    def test_lerp_bias_per_element(self):
+        self.assertEqual(MathStat.lerp(Loc(0, 0), Loc(10, 20), (0.5, 2)),
+            Loc(5, 20))
+        self.assertEqual(MathStat.lerp((0, 0), (10, 20), [-1, 0.25]), (0, 5))
+        self.assertEqual(
+            MathStat.lerp((0, 0), (10, 20), (2, -1), clamp=False), (20, -20))
+
+    def test_lerp_hex(self):
+        self.assertEqual(MathStat.lerp("#000000", "#ff8040", 0.5), "#7f4020")
+
+    def test_map_range(self):
+        self.assertEqual(MathStat.map_range(15, 10, 20, 1, 100), 50.5)
+        self.assertEqual(MathStat.map_range_clamped(30, 10, 20, 1, 100), 100)
+        self.assertEqual(MathStat.map_range(
+            Loc(15, 20), Loc(10, 10), Loc(20, 30), Loc(0, 0), Loc(10, 10)),
+            Loc(5, 5))
+
+    def test_getdist(self):
+        self.assertEqual(MathStat.getdist(Loc(0, 0), Loc(3, 4)), 5)
+        self.assertEqual(MathStat.getdistsquared(Loc(0, 0), Loc(3, 4)), 25)
+        self.assertEqual(MathStat.getdistsquared(Loc(0, 0, 0), Loc(1, 2, 2)), 9)
+
+
+@unittest.skipIf(np is None, "requires NumPy")
+class ArrayMathStatTest(unittest.TestCase):
+
+    def test_matches_scalar(self):
+        vals = [-5, 0, 2.5, 15, 40]
+        np.testing.assert_allclose(
+            ArrayMathStat.map_range(vals, 10, 20, 1, 100),
+            [MathStat.map_range(v, 10, 20, 1, 100) for v in vals])
+        np.testing.assert_allclose(
+            ArrayMathStat.map_range_clamped(vals, 10, 20, 1, 100),
+            [MathStat.map_range_clamped(v, 10, 20, 1, 100) for v in vals])
+        np.testing.assert_allclose(ArrayMathStat.clamp(vals, 0, 10),
+            [MathStat.clamp(v, 0, 10) for v in vals])
+
+    def test_map_points_per_axis(self):
+        points = np.array([[0, 0], [10, 20], [5, 10]])
+        canvas = ArrayMathStat.map_range(points, (0, 0), (10, 20),
+            (0, 200), (100, 0))
+        np.testing.assert_allclose(canvas, [[0, 200], [100, 0], [50, 100]])
+
+    def test_lerp_rows(self):
+        a = np.zeros((3, 2))
+        b = np.full((3, 2), 10.0)
+        np.testing.assert_allclose(ArrayMathStat.lerp(a, b, [0, 0.5, 2]),
+            [[0, 0], [5, 5], [10, 10]])
+
+    def test_lerp_colors(self):
+        colors = ArrayMathStat.lerp((0, 0, 0), (255, 128, 64),
+            np.linspace(0, 1, 5)[:, np.newaxis])
+        self.assertEqual(colors.shape, (5, 3))
+        np.testing.assert_allclose(colors[-1], (255, 128, 64))
+
+    def test_getdist(self):
+        a = np.array([[0, 0], [1, 1]])
+        b = np.array([[3, 4], [1, 1]])
+        np.testing.assert_allclose(ArrayMathStat.getdist(a, b), [5, 0])
+        np.testing.assert_allclose(ArrayMathStat.getdistsquared(a, b), [25, 0])
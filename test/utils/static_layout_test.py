@@ -0,0 +1,144 @@
+"""Tests for memory mapped static layout files."""
+
+import os, tempfile, unittest
+from factorygame import Loc
+from factorygame.core.blueprint import FColor
+from factorygame.core.collision import CollisionManager
+from factorygame.utils.static_layout import write_static_layout, StaticLayout
+
+
+class StaticLayoutTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, "layout.fgl")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _open(self, polygons, cell_size=100.0):
+        write_static_layout(self.filename, polygons, cell_size)
+        layout = StaticLayout(self.filename)
+        self.addCleanup(layout.close)
+        return layout
+
+    def test_read_polygons(self):
+        layout = self._open([
+            ((Loc(0, 0), Loc(10, 0), Loc(10, 10)), FColor.red(), None),
+            (((-50, -50), (-20, -50), (-20, -10), (-50, -10)),
+                (0, 0, 255), FColor(1, 2, 3)),
+        ])
+
+        self.assertEqual(len(layout), 2)
+        self.assertEqual(layout.get_points(0),
+            [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0)])
+        self.assertEqual(list(layout.get_vertices(1)),
+            [-50, -50, -20, -50, -20, -10, -50, -10])
+        self.assertEqual(layout.get_bounds(1), (-50, -50, -20, -10))
+        self.assertEqual(layout.get_fill_color(0), "#ff0000")
+        self.assertEqual(layout.get_outline_color(0), "#ff0000")
+        self.assertEqual(layout.get_fill_color(1), "#0000ff")
+        self.assertEqual(layout.get_outline_color(1), "#010203")
+
+    def test_vertices_not_copied(self):
+        layout = self._open([(((0, 0), (1, 0), (1, 1)), (0, 0, 0), None)])
+        vertices = layout.get_vertices(0)
+        self.assertIsInstance(vertices, memoryview)
+        self.assertTrue(vertices.readonly)
+
+    def test_query_box(self):
+        # Row of triangles 50 units apart, with one spanning many cells.
+        polygons = [(((x, 0), (x + 10, 0), (x, 10)), (0, 0, 0), None)
+            for x in range(-500, 500, 50)]
+        polygons.append((((-1000, 300), (1000, 300), (0, 400)),
+            (0, 0, 0), None))
+        layout = self._open(polygons)
+
+        self.assertEqual(layout.query_box((0, 0, 60, 5)), [10, 11])
+        self.assertEqual(layout.query_box((-1000, -1000, 1000, 1000)),
+            list(range(21)))
+        self.assertEqual(layout.query_box((700, 350, 710, 360)), [20])
+        self.assertEqual(layout.query_box((15, 0, 45, 5)), [])
+        self.assertEqual(layout.query_box((0, 2000, 10, 2010)), [])
+
+    def test_empty_layout(self):
+        layout = self._open([])
+        self.assertEqual(len(layout), 0)
+        self.assertEqual(layout.query_box((-10, -10, 10, 10)), [])
+
+    def test_close(self):
+        layout = self._open([(((0, 0), (1, 0), (1, 1)), (0, 0, 0), None)])
+        vertices = layout.get_vertices(0)
+        layout.close()
+        self.assertTrue(layout.closed)
+        # Closing again does nothing.
+        layout.close()
+        del vertices
+
+    def test_invalid_file(self):
+        with open(self.filename, "wb") as fp:
+            fp.write(b"not a layout file at all, but long enough" * 4)
+        with self.assertRaises(ValueError):
+            StaticLayout(self.filename)
+
+    def test_too_few_vertices(self):
+        with self.assertRaises(ValueError):
+            write_static_layout(self.filename,
+                [(((0, 0), (1, 0)), (0, 0, 0), None)])
+
+
+class StaticLayoutCollisionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        filename = os.path.join(self.temp_dir.name, "walls.fgl")
+        write_static_layout(filename, [
+            (((100, -50), (120, -50), (120, 50), (100, 50)), (0, 0, 0), None),
+            (((200, -50), (220, -50), (220, 50), (200, 50)), (0, 0, 0), None),
+        ])
+        self.layout = StaticLayout(filename)
+
+        self.manager = CollisionManager()
+        self.manager.add_static_layout("walls", self.layout)
+
+    def tearDown(self):
+        self.layout.close()
+        self.temp_dir.cleanup()
+
+    def test_sweep(self):
+        hit = self.manager.sweep(Loc(0, 0), Loc(300, 0))
+        self.assertEqual(hit.other_actor, "walls")
+        self.assertEqual(hit.item, 0)
+        self.assertEqual(hit.location, Loc(100, 0))
+        self.assertEqual(hit.surface_normal, Loc(-1, 0))
+
+        self.assertIsNone(self.manager.sweep(Loc(0, 100), Loc(300, 100)))
+        self.assertIsNone(self.manager.sweep(Loc(0, 0), Loc(300, 0),
+            ignore="walls"))
+
+    def test_sweep_nearest_of_grid_and_layout(self):
+        self.manager.set_geometry("post",
+            (Loc(50, -10), Loc(50, 10)), closed=False)
+        hit = self.manager.sweep(Loc(0, 0), Loc(300, 0))
+        self.assertEqual(hit.other_actor, "post")
+        self.assertIsNone(hit.item)
+
+        hit = self.manager.sweep(Loc(300, 0), Loc(0, 0))
+        self.assertEqual(hit.item, 1)
+        self.assertEqual(hit.location, Loc(220, 0))
+
+    def test_line_trace(self):
+        hits = self.manager.line_trace(Loc(0, 0), Loc(300, 0))
+        self.assertEqual([hit.item for hit in hits], [0, 1])
+        self.assertEqual(hits[1].location, Loc(200, 0))
+
+    def test_overlaps(self):
+        hits = self.manager.sphere_overlap(Loc(160, 0), 45)
+        self.assertEqual([hit.item for hit in hits], [0, 1])
+
+        hits = self.manager.box_overlap(Loc(105, -5), Loc(110, 5))
+        self.assertEqual([hit.item for hit in hits], [0])
+
+    def test_remove(self):
+        self.manager.remove_collider("walls")
+        self.assertIsNone(self.manager.sweep(Loc(0, 0), Loc(300, 0)))